@@ -4,16 +4,36 @@
 #   Pixelbox
 #   Author: Alex Closson
 #   Date: 09/08/2025
-#   Last Update: 09/08/2025
+#   Last Update: 10/17/2026
 #   Version: 1.0.0
 #   Summary: File to use GUI to draw on LED matrix with touchscreen.
 # =====================================================================
 
 
+import argparse
+import os
+import sys
+import time
 import tkinter as tk
-from evdev import InputDevice, ecodes
-import board
-import neopixel
+from evdev import ecodes
+
+# Shared helpers live in ../utils
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.ledBackend import create_strip
+from utils.ledMap import LedMap, Framebuffer
+from utils.outputStage import OutputStage
+from utils.frameScheduler import FrameScheduler
+from utils.strokeEngine import StrokeEngine
+from utils.latencyProbe import probe_from_env
+from utils.pbxFile import encode, resample, PBX_ORIENTATION
+from utils.canvasJournal import CanvasJournal, NullJournal
+from utils.paths import state_dir
+from utils.undoHistory import UndoHistory, group_by_color
+from utils.touchTracker import ContactTracker
+from utils.touchDevice import find_touch_device
+from utils.startupTimer import first_frame
+from utils.touchCalibration import Region, TouchMap, Calibration, raw_size_of, collect_taps
+from utils.touchFilter import TouchFilter, NullTouchFilter
 
 # =========================
 # Config
@@ -22,16 +42,28 @@ GRID_ROWS = 16
 GRID_COLS = 16
 NUM_PIXELS = GRID_ROWS * GRID_COLS
 
-PIXEL_PIN   = board.D12
+PIXEL_PIN   = "D12"   # board pin name
 BRIGHTNESS  = 0.15
-PIXEL_ORDER = neopixel.GRB
+GAMMA       = 2.8   # LED gamma correction, applied with brightness in one lookup table
+PIXEL_ORDER = "GRB"
+MAX_FPS     = 100   # cap on pixels.show() rate; one frame is ~7.7 ms of wire time
 
 # Hardcode your stable touch area
 TOUCH_WIDTH  = 768
 TOUCH_HEIGHT = 768
-TOUCH_DEV    = '/dev/input/by-id/usb-UsbHID_SingWon-CTP-V1.18A_6F6A099B1133-event-if00'
-
-# Orientation (from your working simple script)
+TOUCH_DEV    = None   # None finds the touchscreen (or PIXELBOX_TOUCH_DEV); set a path to force one
+
+# Touch calibration: the GUI's grid spans nominal 0..TOUCH_WIDTH, so it keeps its
+# own fit (touchToLED --calibrate fits the LED overlay's region layout instead)
+MATRIX_REGION     = Region("matrix", 0, TOUCH_WIDTH, 0, TOUCH_HEIGHT, GRID_ROWS, GRID_COLS)
+CALIBRATION_PATH  = state_dir("gui_calibration") + ".json"
+CALIBRATION_CELLS = [(1, 1), (1, GRID_COLS - 2), (GRID_ROWS - 2, GRID_COLS - 2), (GRID_ROWS - 2, 1)]
+
+# Orientation (from your working simple script). This one differs from
+# MATRIX_ORIENTATION in utils/ledMap.py on purpose: the GUI grid is drawn on
+# the display, not under the touch overlay on the matrix, and the display
+# sits turned against the matrix, so a GUI row lights a matrix column.
+# Saved .pbx files are converted back to the matrix orientation (to_pbx).
 SWAP_AXES = True
 HFLIP     = False
 VFLIP     = False
@@ -40,6 +72,22 @@ ROTATE    = 0   # 0 / 90 / 180 / 270
 # Fill full screen width with the grid cells
 FILL_WIDTH = True
 
+# Brush
+BRUSH_SIZE  = 1          # cells across
+BRUSH_SHAPE = "square"   # "square" or "round"
+MAX_CONTACTS = 10        # fingers drawing at once (multi-touch slots)
+TOUCH_FILTER = True      # smooth jitter, predict ahead and hold cells at borders (utils/touchFilter.py)
+
+# Canvas renderer: "image" (one zoomed PhotoImage) or "rects" (one item per cell)
+CANVAS_BACKEND = "image"
+
+# Saved drawings and recordings (.pbx, play with playAnimation.py)
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images")
+RECORD_FPS = 12
+
+# Restore the last drawing on start (state in PIXELBOX_STATE_DIR); off for replays
+PERSIST_DRAWING = True
+
 
 # =========================
 # Helpers
@@ -48,42 +96,87 @@ def color_hex_to_rgb(hex_color: str):
     h = hex_color.lstrip("#")
     return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
 
-def serpentine_index(row, col):
-    # row-wise serpentine
-    if row % 2 == 0:
-        return row * GRID_COLS + col
-    else:
-        return row * GRID_COLS + (GRID_COLS - 1 - col)
-
-def orient(row, col):
-    """Apply SWAP/ROTATE/FLIP to map GUI (row,col) to physical matrix (row,col)."""
-    R, C = GRID_ROWS, GRID_COLS
-    # 1) swap
-    if SWAP_AXES:
-        row, col = col, row
-    # 2) rotate (square grid)
-    if ROTATE == 90:
-        row, col = col, (C - 1) - row
-    elif ROTATE == 180:
-        row, col = (R - 1) - row, (C - 1) - col
-    elif ROTATE == 270:
-        row, col = (R - 1) - col, row
-    # 3) flips
-    if HFLIP:
-        col = (C - 1) - col
-    if VFLIP:
-        row = (R - 1) - row
-    # clamp
-    row = max(0, min(R - 1, row))
-    col = max(0, min(C - 1, col))
-    return row, col
+def rgb_to_hex(rgb):
+    return "#%02x%02x%02x" % tuple(rgb)
+
+
+# =========================
+# Canvas renderers
+# =========================
+class RectGridView:
+    """One canvas rectangle per cell; every update is an itemconfig call."""
+
+    def __init__(self, canvas, cell):
+        self.canvas = canvas
+        self.rects = {}
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                x1, y1 = c * cell, r * cell
+                x2, y2 = x1 + cell, y1 + cell
+                self.rects[(r, c)] = canvas.create_rectangle(
+                    x1, y1, x2, y2, fill="black", outline="gray"
+                )
+
+    def paint(self, row, col, hexcol):
+        self.canvas.itemconfig(self.rects[(row, col)], fill=hexcol)
+
+    def clear(self):
+        for rid in self.rects.values():
+            self.canvas.itemconfig(rid, fill="black")
+
+    def show_frame(self, rgb):
+        """Show a whole row-major RGB frame."""
+        for (r, c), rid in self.rects.items():
+            i = (r * GRID_COLS + c) * 3
+            self.canvas.itemconfig(rid, fill=rgb_to_hex(rgb[i:i + 3]))
+
+
+class ImageGridView:
+    """Whole grid as one PhotoImage zoomed to cell size, with a line overlay.
+
+    A 16x16 base image holds one pixel per cell; full frames are put into it
+    in one call and copied into the displayed image with Tk's -zoom.
+    """
+
+    def __init__(self, canvas, cell):
+        self.cell = cell
+        width, height = GRID_COLS * cell, GRID_ROWS * cell
+        self.base = tk.PhotoImage(width=GRID_COLS, height=GRID_ROWS)
+        self.image = tk.PhotoImage(width=width, height=height)
+        canvas.create_image(0, 0, image=self.image, anchor=tk.NW)
+
+        # Grid overlay
+        for c in range(GRID_COLS + 1):
+            canvas.create_line(c * cell, 0, c * cell, height, fill="gray")
+        for r in range(GRID_ROWS + 1):
+            canvas.create_line(0, r * cell, width, r * cell, fill="gray")
+        self.clear()
+
+    def paint(self, row, col, hexcol):
+        x, y = col * self.cell, row * self.cell
+        self.base.put(hexcol, to=(col, row))
+        self.image.put(hexcol, to=(x, y, x + self.cell, y + self.cell))
+
+    def clear(self):
+        self.base.put("#000000", to=(0, 0, GRID_COLS, GRID_ROWS))
+        self.image.put("#000000", to=(0, 0, GRID_COLS * self.cell, GRID_ROWS * self.cell))
+
+    def show_frame(self, rgb):
+        """Show a whole row-major RGB frame with one put and one zoomed copy."""
+        h = bytes(rgb).hex()
+        row_chars = GRID_COLS * 6
+        self.base.put(" ".join(
+            "{" + " ".join("#" + h[i:i + 6] for i in range(start, start + row_chars, 6)) + "}"
+            for start in range(0, len(h), row_chars)
+        ))
+        self.image.tk.call(self.image, "copy", self.base, "-zoom", self.cell, self.cell)
 
 
 # =========================
 # App
 # =========================
 class LEDTouchGUI:
-    def __init__(self, root):
+    def __init__(self, root, device=None):
         self.root = root
         self.root.title("Touch → LED Painter")
 
@@ -94,12 +187,30 @@ class LEDTouchGUI:
         else:
             self.CELL = max(1, min(sw // GRID_COLS, sh // GRID_ROWS))
 
-        # NeoPixels
-        self.pixels = neopixel.NeoPixel(
-            PIXEL_PIN, NUM_PIXELS, brightness=BRIGHTNESS,
-            auto_write=False, pixel_order=PIXEL_ORDER
-        )
-        self.pixels.fill((0, 0, 0)); self.pixels.show()
+        # NeoPixels (PIXELBOX_BACKEND=sim for a simulated strip)
+        self.pixels = create_strip(PIXEL_PIN, NUM_PIXELS, pixel_order=PIXEL_ORDER)
+        # Logical framebuffer in GUI (row,col); orientation, brightness and gamma applied on push
+        self.frame = Framebuffer(LedMap(
+            GRID_ROWS, GRID_COLS, swap_axes=SWAP_AXES, rotate=ROTATE,
+            hflip=HFLIP, vflip=VFLIP
+        ))
+        # .pbx files hold frames as seen on the matrix, not in this GUI's orientation
+        self.to_pbx = self.frame.map.converter_to(LedMap(GRID_ROWS, GRID_COLS, **PBX_ORIENTATION))
+        self.output = OutputStage(self.pixels, self.frame.map, brightness=BRIGHTNESS,
+                                  gamma=GAMMA, pixel_order=PIXEL_ORDER)
+        self.frame.push(self.output)
+
+        # Paints only mark the frame dirty; one show() per tick at most
+        self.scheduler = FrameScheduler(self.push_frame, max_fps=MAX_FPS)
+        self.flush_pending = False
+
+        # Touch-to-photon instrumentation; a no-op unless PIXELBOX_LATENCY=1
+        self.probe = probe_from_env()
+
+        # Joins touch/mouse samples into continuous lines
+        self.stroke = StrokeEngine(GRID_ROWS, GRID_COLS, BRUSH_SIZE, BRUSH_SHAPE)
+        # Each stroke or clear is one undo step, kept as pixel deltas
+        self.history = UndoHistory(self.frame)
 
         # UI: Canvas on top
         self.canvas = tk.Canvas(
@@ -111,19 +222,21 @@ class LEDTouchGUI:
         self.canvas.pack(side=tk.TOP, pady=6)
 
         # Draw grid
-        self.rects = {}
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                x1, y1 = c * self.CELL, r * self.CELL
-                x2, y2 = x1 + self.CELL, y1 + self.CELL
-                self.rects[(r, c)] = self.canvas.create_rectangle(
-                    x1, y1, x2, y2, fill="black", outline="gray"
-                )
+        if CANVAS_BACKEND == "rects":
+            self.view = RectGridView(self.canvas, self.CELL)
+        else:
+            self.view = ImageGridView(self.canvas, self.CELL)
 
         # Controls
         ctrl = tk.Frame(root); ctrl.pack(side=tk.TOP, pady=6)
         tk.Button(ctrl, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=4)
+        tk.Button(ctrl, text="Undo", command=self.undo).pack(side=tk.LEFT, padx=4)
+        tk.Button(ctrl, text="Redo", command=self.redo).pack(side=tk.LEFT, padx=4)
+        tk.Button(ctrl, text="Save", command=self.save_drawing).pack(side=tk.LEFT, padx=4)
+        self.record_button = tk.Button(ctrl, text="Record", command=self.toggle_recording)
+        self.record_button.pack(side=tk.LEFT, padx=4)
         tk.Button(ctrl, text="Exit", command=self.exit).pack(side=tk.LEFT, padx=4)
+        self.recording = None  # (time, frame) snapshots while recording
 
         # Simple color presets
         pal = tk.Frame(root); pal.pack(side=tk.TOP, pady=6)
@@ -146,36 +259,138 @@ class LEDTouchGUI:
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_down)
         self.canvas.bind("<B1-Motion>", self.on_mouse_move)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
+        root.bind("<Control-z>", lambda _e: self.undo())
+        root.bind("<Control-y>", lambda _e: self.redo())
 
         # Touch device state
         self.dev = None
-        self.use_mt = False         # prefer ABS_MT_* if available
-        self.touch_down = False     # gated by BTN_TOUCH or MT tracking
-        self.x = None               # last X for current frame
-        self.y = None               # last Y for current frame
+        self.tracker = ContactTracker(MAX_CONTACTS)  # per-slot state, up to 10 fingers
+        # Raw touch -> cell tables (resized to the device once it opens); calibrate with --calibrate
+        self.touch_map = TouchMap([MATRIX_REGION], Calibration.load(CALIBRATION_PATH),
+                                  raw_size=(TOUCH_WIDTH, TOUCH_HEIGHT))
+        self.touch_filter = (TouchFilter if TOUCH_FILTER else NullTouchFilter)(self.touch_map.classify)
+
+        # Drawing journal: paint/clear/colour operations survive exits and power loss
+        if PERSIST_DRAWING and device is None:
+            self.journal = CanvasJournal(state_dir("gui"), self.frame,
+                                         on_pending=lambda: self.root.after_idle(self.sync_journal))
+        else:
+            self.journal = NullJournal()
+        color = self.journal.restore()
+        if color is not None:
+            self.current_rgb = color
+            self.current_hex = rgb_to_hex(color)
+        if self.journal.enabled:
+            self.refresh_view()
+            self.request_frame()
 
-        self.init_touch()
-        self.poll_touch()  # start polling loop (no threads)
+        self.init_touch(device)  # frames are handled as soon as the kernel delivers them
 
     # ---- UI actions ----
     def set_color(self, hexcol):
         self.current_hex = hexcol
         self.current_rgb = color_hex_to_rgb(hexcol)
+        self.journal.set_color(self.current_rgb)
 
     def clear(self):
-        self.pixels.fill((0, 0, 0)); self.pixels.show()
-        for rid in self.rects.values():
-            self.canvas.itemconfig(rid, fill="black")
+        self.history.fill((0, 0, 0)); self.history.end(); self.request_frame()
+        self.journal.clear()
+        self.view.clear()
+
+    def refresh_view(self):
+        """Redraw the canvas from the framebuffer (image loads, animation, mirroring)."""
+        self.view.show_frame(self.frame.buf)
 
     def exit(self):
         try:
-            self.pixels.fill((0, 0, 0)); self.pixels.show()
+            if self.recording is not None:
+                self.toggle_recording()  # keep what was recorded
+            self.journal.close()  # the saved drawing outlives the blank LEDs below
+            self.frame.fill((0, 0, 0)); self.scheduler.flush()
+            self.probe.dump()
         finally:
             self.root.destroy()
 
+    def undo(self):
+        self.show_changes(self.history.undo())
+
+    def redo(self):
+        self.show_changes(self.history.redo())
+
+    def show_changes(self, changed):
+        """Push, log and redraw only the pixels an undo/redo touched."""
+        if not changed:
+            return
+        for color, indices in group_by_color(changed).items():
+            self.journal.paint_indices(indices, color)
+        self.request_frame()
+        for index, color in changed:
+            self.view.paint(index // GRID_COLS, index % GRID_COLS, rgb_to_hex(color))
+
+    def end_stroke(self, contact):
+        """Finger or mouse lifted: the next sample starts a new line and undo step."""
+        self.stroke.end(contact)
+        self.history.end()
+
+    # ---- Saving drawings (.pbx) ----
+    def _image_path(self, kind):
+        os.makedirs(IMAGES_DIR, exist_ok=True)
+        return os.path.join(IMAGES_DIR, time.strftime(f"{kind}_%Y%m%d_%H%M%S.pbx"))
+
+    def save_drawing(self):
+        """Write the current drawing to images/ as a one-frame .pbx."""
+        path = self._image_path("drawing")
+        encode(path, [self.to_pbx(self.frame.buf)], GRID_ROWS, GRID_COLS, fps=RECORD_FPS)
+        print(f"Saved {path}")
+
+    def toggle_recording(self):
+        """Start capturing every LED frame, or stop and encode them to images/."""
+        if self.recording is None:
+            self.recording = [(time.monotonic(), bytes(self.frame.buf))]
+            self.record_button.config(text="Stop")
+            return
+        self.recording.append((time.monotonic(), bytes(self.frame.buf)))
+        frames = resample(self.recording, RECORD_FPS)
+        self.recording = None
+        self.record_button.config(text="Record")
+        path = self._image_path("recording")
+        encode(path, [self.to_pbx(f) for f in frames], GRID_ROWS, GRID_COLS, fps=RECORD_FPS)
+        print(f"Saved {len(frames)} frames to {path}")
+
+    # ---- Drawing journal ----
+    def sync_journal(self):
+        """Group commit: fsync the journal once its interval has passed."""
+        sched = self.journal.scheduler
+        if not sched.poll() and sched.dirty:
+            self.root.after(int(sched.due_in() * 1000 + 0.999), self.sync_journal)
+
+    # ---- LED frame pacing ----
+    def request_frame(self):
+        """Mark the LED frame dirty and make sure a flush is scheduled."""
+        self.scheduler.mark_dirty()
+        if self.flush_pending:
+            return
+        self.flush_pending = True
+        delay_ms = int(self.scheduler.due_in() * 1000 + 0.999)  # round up
+        self.root.after(delay_ms, self.flush_frame)
+
+    def push_frame(self):
+        start = time.time()
+        self.frame.push(self.output)
+        self.probe.pushed(start, time.time())
+        first_frame("LED GUI", self.frame.buf)
+        if self.recording is not None:
+            self.recording.append((time.monotonic(), bytes(self.frame.buf)))
+
+    def flush_frame(self):
+        self.flush_pending = False
+        if not self.scheduler.poll() and self.scheduler.dirty:
+            self.request_frame()  # woke a little early; try again
+
     # ---- Mouse (optional) ----
     def on_mouse_down(self, e):
         self.drawing = True
+        self.end_stroke("mouse")
         self.paint_from_canvas(e.x, e.y)
 
     def on_mouse_move(self, e):
@@ -184,108 +399,136 @@ class LEDTouchGUI:
 
     def on_mouse_up(self, e):
         self.drawing = False
+        self.end_stroke("mouse")
 
     def paint_from_canvas(self, px, py):
         col = px // self.CELL
         row = py // self.CELL
-        if (row, col) not in self.rects:
+        if not (0 <= row < GRID_ROWS and 0 <= col < GRID_COLS):
             return
-        mr, mc = orient(row, col)
-        idx = serpentine_index(mr, mc)
-        self.pixels[idx] = self.current_rgb
-        self.pixels.show()
-        self.canvas.itemconfig(self.rects[(row, col)], fill=self.current_hex)
-
-    # ---- Touch setup & polling (no threads, no blocking) ----
-    def init_touch(self):
-        try:
-            self.dev = InputDevice(TOUCH_DEV)
-            # No set_blocking / set_nonblocking API; we'll use read_one() in poll loop
-            caps = self.dev.capabilities().get(ecodes.EV_ABS, [])
-            self.use_mt = any(code in (ecodes.ABS_MT_POSITION_X, ecodes.ABS_MT_POSITION_Y)
-                              for code, _ in caps)
-            print(f"Touch device: {self.dev.name} | use_mt={self.use_mt}")
-        except FileNotFoundError:
+        self.paint_cells(self.stroke.move("mouse", row, col))
+
+    def paint_cells(self, cells):
+        """Commit a batch of cells in one framebuffer update and one push."""
+        if not cells:
+            return
+        self.history.paint_cells(cells, self.current_rgb)
+        self.journal.paint(cells, self.current_rgb)
+        self.request_frame()
+        for row, col in cells:
+            self.view.paint(row, col, self.current_hex)
+
+    # ---- Touch setup & event handling (no threads, no polling) ----
+    def init_touch(self, device=None):
+        """Open the touchscreen, or use device (e.g. a ReplayDevice) when given."""
+        self.dev = device or find_touch_device(TOUCH_DEV)
+        if self.dev is None:
+            print("Touchscreen device not found.")
+            return
+        caps = self.dev.capabilities().get(ecodes.EV_ABS, [])
+        slots = any(code == ecodes.ABS_MT_SLOT for code, _ in caps)
+        print(f"Touch device: {self.dev.name} | multi-touch slots={slots}")
+        # Tables sized to the panel's reported raw range
+        self.set_calibration(self.touch_map.calibration)
+
+        # Let Tk wake us when the (non-blocking) evdev fd becomes readable
+        self.root.tk.createfilehandler(self.dev, tk.READABLE, self.on_touch_readable)
+
+    def set_calibration(self, calibration):
+        raw_size = raw_size_of(self.dev, (TOUCH_WIDTH, TOUCH_HEIGHT)) if self.dev else (TOUCH_WIDTH, TOUCH_HEIGHT)
+        self.touch_map = TouchMap([MATRIX_REGION], calibration, raw_size)
+        self.touch_filter.classify = self.touch_map.classify
+
+    def calibrate(self):
+        """Highlight each calibration cell in turn, fit the taps on it and save the result."""
+        if self.dev is None:
             print("Touchscreen device not found.")
+            return
+        targets = [MATRIX_REGION.centre(row, col) for row, col in CALIBRATION_CELLS]
+
+        def show_target(i, _target):
+            self.view.clear()
+            self.view.paint(*CALIBRATION_CELLS[i], "#ffffff")
+            self.root.update()
+            print(f"Tap the white cell ({i + 1}/{len(targets)})")
+
+        # Taps are read directly; the Tk handler takes the device back afterwards
+        self.root.tk.deletefilehandler(self.dev)
+        try:
+            taps = collect_taps(self.dev, targets, show_target)
+        finally:
+            self.root.tk.createfilehandler(self.dev, tk.READABLE, self.on_touch_readable)
+            self.refresh_view()
+        calibration = Calibration.fit(taps, targets)
+        calibration.save(CALIBRATION_PATH)
+        print(f"Calibration saved to {CALIBRATION_PATH} "
+              f"(worst tap {calibration.error(taps, targets):.1f} px off after fitting)")
+        self.set_calibration(calibration)
+
+    def on_touch_readable(self, _fd, _mask):
+        """Drain every event the kernel has queued; process complete frames on SYN."""
+        try:
+            for ev in self.dev.read():
+                self.handle_touch_event(ev)
+        except BlockingIOError:
+            pass  # spurious wake-up, nothing queued
+        except OSError:
+            # device might have been disconnected
+            self.root.tk.deletefilehandler(self.dev)
             self.dev = None
 
-    def poll_touch(self):
-        """Poll the touch device with read_one(); process complete frames on SYN."""
-        if self.dev is not None:
-            try:
-                while True:
-                    ev = self.dev.read_one()
-                    if ev is None:
-                        break  # nothing more right now
-
-                    # Prefer BTN_TOUCH to gate, but also support MT tracking ID
-                    if ev.type == ecodes.EV_KEY and ev.code == ecodes.BTN_TOUCH:
-                        self.touch_down = (ev.value == 1)
-                        if not self.touch_down:
-                            self.x = self.y = None
-
-                    elif ev.type == ecodes.EV_ABS:
-                        # Some panels don't emit BTN_TOUCH; use MT tracking to gate
-                        if ev.code == ecodes.ABS_MT_TRACKING_ID:
-                            if ev.value == -1:
-                                self.touch_down = False
-                                self.x = self.y = None
-                            else:
-                                self.touch_down = True
-                            continue  # move on to next event
-
-                        if not self.touch_down:
-                            continue  # ignore movement unless finger is down
-
-                        if self.use_mt:
-                            if ev.code == ecodes.ABS_MT_POSITION_X:
-                                self.x = ev.value
-                            elif ev.code == ecodes.ABS_MT_POSITION_Y:
-                                self.y = ev.value
-                        else:
-                            if ev.code == ecodes.ABS_X:
-                                self.x = ev.value
-                            elif ev.code == ecodes.ABS_Y:
-                                self.y = ev.value
-
-                    elif ev.type == ecodes.EV_SYN:
-                        # Once per frame: draw only when we have both coordinates and a touch down
-                        if not self.touch_down or self.x is None or self.y is None:
-                            continue
-
-                        # Map raw → grid (round to nearest cell; avoid off-by-one)
-                        col = int((self.x / max(1, TOUCH_WIDTH  - 1)) * (GRID_COLS - 1) + 0.5)
-                        row = int((self.y / max(1, TOUCH_HEIGHT - 1)) * (GRID_ROWS - 1) + 0.5)
-                        col = max(0, min(GRID_COLS - 1, col))
-                        row = max(0, min(GRID_ROWS - 1, row))
-
-                        mr, mc = orient(row, col)
-                        idx = serpentine_index(mr, mc)
-
-                        # Paint and leave on
-                        self.pixels[idx] = self.current_rgb
-                        self.pixels.show()
-
-                        # Update GUI cell at GUI coords
-                        if (row, col) in self.rects:
-                            self.canvas.itemconfig(self.rects[(row, col)], fill=self.current_hex)
-
-                        # Reset for next frame
-                        self.x = self.y = None
-
-            except OSError:
-                # device might have been disconnected
-                pass
-
-        self.root.after(8, self.poll_touch)
+    def handle_touch_event(self, ev):
+        """Apply one evdev event; every contact's segment is painted together on SYN."""
+        frame_update = self.tracker.feed(ev)
+        if frame_update is None:
+            return
+        moved, lifted = frame_update
+        for slot in lifted:
+            self.stroke.end(("touch", slot))
+            self.touch_filter.end(slot)
+        if lifted and not self.tracker.active:
+            self.history.end()  # all fingers up: one undo step
+        if not moved:
+            return
+        t = ev.timestamp()
+        self.probe.frame(t)
+
+        cells = []
+        for slot, x, y in moved:
+            # Smoothed, predicted sample → grid cell (overshoot clamps to the edge cells)
+            _region, row, col = self.touch_filter.update(slot, x, y, t)
+
+            # The segment since this finger's last sample
+            cells += self.stroke.move(("touch", slot), row, col)
+        self.probe.mark("map")
+
+        # One framebuffer update and one frame request for all fingers
+        if cells:
+            self.paint_cells(cells)
+            self.probe.mark("paint")
+            self.probe.painted()
 
 
 # =========================
 # Main
 # =========================
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Touch → LED Painter")
+    parser.add_argument("--replay", help="replay a touch recording instead of the touchscreen")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed, 1 = real time, 0 = as fast as possible")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="tap the highlighted cells to calibrate the touchscreen first")
+    args = parser.parse_args()
+
     root = tk.Tk()
     root.attributes("-fullscreen", True)
 
-    app = LEDTouchGUI(root)
+    device = None
+    if args.replay:
+        from utils.touchRecorder import ReplayDevice  # only replays pay for the import
+        device = ReplayDevice(args.replay, speed=args.speed)
+    app = LEDTouchGUI(root, device)
+    if args.calibrate:
+        app.calibrate()
     root.mainloop()
\ No newline at end of file
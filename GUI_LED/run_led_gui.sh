@@ -1,3 +1,3 @@
 #!/bin/bash
-sudo python3 /home/alexa/Desktop/GUI_LED/grid_draw_pixelbox.py
-
+# Launch time for the first-frame measurement (utils/startupTimer.py); sudo drops the environment
+sudo PIXELBOX_LAUNCH_T0="$(date +%s.%N)" python3 /home/alexa/Desktop/GUI_LED/grid_draw_pixelbox.py
@@ -0,0 +1,215 @@
+# =====================================================================
+#                   Pixelbox - benchmarkPixelbox.py
+#   benchmarkPixelbox.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Benchmarks the render paths against a simulated WS2812 strip.
+# =====================================================================
+'''
+Runs on any Linux box (no LED hardware needed):
+python3 benchmarkPixelbox.py
+python3 benchmarkPixelbox.py --frames 500 --output bench_output.txt
+'''
+
+
+import os
+os.environ.setdefault("PIXELBOX_BACKEND", "sim")  # must be set before the scripts import
+
+import argparse
+import asyncio
+import contextlib
+import io
+import subprocess
+import sys
+import time
+
+from utils.ledBackend import max_refresh_hz
+from utils.startupTimer import IMPORT_BUDGET_MS
+
+
+# ----- Measurement Helpers -----
+class Result:
+    """Per-frame cost of one benchmark against the frame period it has to fit in.
+
+    The simulated strip does not sleep, so wall-clock rates mean nothing;
+    instead CPU time and the strip's modelled wire time (what show() would
+    block for on a real WS2812 line) are added up per frame. load is that
+    sum over the period: above 100% the Pi could not keep the frame rate.
+    frames/s is the rate that cost allows, 1000 / (cpu + wire ms), shown
+    against the strip's wire-time ceiling (max Hz).
+    """
+
+    def __init__(self, name, frames, cpu, wire, shows, fps, num_pixels, note=""):
+        self.name = name
+        self.frames = frames
+        self.cpu = cpu
+        self.wire = wire
+        self.shows = shows
+        self.fps = fps
+        self.num_pixels = num_pixels
+        self.note = note
+
+    def line(self):
+        cpu_ms = 1000.0 * self.cpu / self.frames if self.frames else 0.0
+        wire_ms = 1000.0 * self.wire / self.shows if self.shows else 0.0
+        period_ms = 1000.0 / self.fps
+        frame_ms = cpu_ms + wire_ms
+        achievable = 1000.0 / frame_ms if frame_ms else 0.0
+        theory = max_refresh_hz(self.num_pixels)
+        load = 100.0 * frame_ms / period_ms
+        return (f"{self.name:<22} {self.frames:>7} {cpu_ms:>10.3f} {wire_ms:>10.3f} "
+                f"{achievable:>10.1f} {theory:>9.1f} {100.0 * achievable / theory:>7.1f}% "
+                f"{period_ms:>10.1f} {load:>7.1f}%  {self.note}")
+
+def measure(name, strip, frames, fps, fn, note=""):
+    """Run fn() and return its Result; frames may be a callable evaluated afterwards."""
+    shows0, wire0 = strip.shows, strip.wire_seconds
+    cpu0 = time.process_time()
+    fn()
+    cpu = time.process_time() - cpu0
+    if callable(frames):
+        frames = frames()
+    return Result(name, frames, cpu, strip.wire_seconds - wire0, strip.shows - shows0, fps,
+                  len(strip), note)
+
+
+class FakeClock:
+    """clock/sleep pair for Animator: sleeping advances time instantly, so every tick renders."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+# ----- Benchmarks -----
+SCROLL_SPEED = 0.08  # seconds per column, as scrollingText.main
+
+def bench_scroll(frames):
+    import scrollingText
+
+    text = "Pixelbox benchmark 0123456789 "
+    repeat = max(1, frames // (len(text) * 6))
+    message = text * repeat
+    clock = FakeClock()
+    anims = []
+
+    def run():
+        anims.append(scrollingText.scroll_text(message, speed=SCROLL_SPEED,
+                                               clock=clock, sleep=clock.sleep))
+
+    return measure("scroll_text", scrollingText.pixels, lambda: anims[0].rendered, 1.0 / SCROLL_SPEED,
+                   run, note="Animator ticks, fake clock")
+
+def bench_touch_paint(frames):
+    import touchToLED
+    from utils.fakeInput import FakeInputDevice, touch_events
+
+    # Zig-zag swipes across the matrix area of the overlay
+    points = []
+    for i in range(frames):
+        x = touchToLED.BUTTON_AREA_WIDTH + (i * 37) % touchToLED.TOUCH_WIDTH
+        y = (i * 53) % touchToLED.TOUCH_HEIGHT
+        points.append((x, y))
+    # 500 Hz input, faster than the strip can refresh
+    device = FakeInputDevice(touch_events(points, interval=0.002), delay=0.002)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):  # skip per-touch prints
+            asyncio.run(touchToLED.run(device))
+
+    return measure("touch paint", touchToLED.pixels, frames, touchToLED.MAX_FPS, run,
+                   note="SYN frames through touchToLED.run")
+
+def bench_gui_clear(frames):
+    import tkinter as tk
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "GUI_LED"))
+    import grid_draw_pixelbox as gui
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None  # no display
+    root.withdraw()
+    results = []
+    for backend in ("rects", "image"):
+        gui.CANVAS_BACKEND = backend
+        gui.PERSIST_DRAWING = False  # keep benchmark clears out of the saved drawing
+        app = gui.LEDTouchGUI(root)
+
+        def run():
+            for _ in range(frames):
+                app.clear()
+                app.scheduler.flush()
+                root.update_idletasks()
+
+        results.append(measure(f"gui clear ({backend})", app.pixels, frames, gui.MAX_FPS, run))
+        app.canvas.destroy()
+    root.destroy()
+    return results
+
+
+# ----- Startup -----
+IMPORT_MODULES = ["scrollingText", "playAnimation", "touchToLED", "GUI_LED/grid_draw_pixelbox"]
+
+def bench_imports():
+    """Import each script in a fresh interpreter; returns report lines against IMPORT_BUDGET_MS."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    lines = []
+    for name in IMPORT_MODULES:
+        folder, module = os.path.split(name)
+        code = ("import sys, time; t = time.perf_counter(); "
+                f"import {module}; print((time.perf_counter() - t) * 1000)")
+        path = os.pathsep.join(filter(None, [here, os.environ.get("PYTHONPATH")]))
+        proc = subprocess.run([sys.executable, "-c", code], cwd=os.path.join(here, folder),
+                              env=dict(os.environ, PYTHONPATH=path), capture_output=True, text=True)
+        if proc.returncode != 0:
+            error = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            lines.append(f"import {module:<20} skipped: {error}")
+            continue
+        ms = float(proc.stdout.split()[-1])
+        status = "ok" if ms <= IMPORT_BUDGET_MS else "OVER BUDGET"
+        lines.append(f"import {module:<20} {ms:>8.1f} ms  (budget {IMPORT_BUDGET_MS} ms, {status})")
+    return lines
+
+
+# ----- Main -----
+def main():
+    parser = argparse.ArgumentParser(description="Pixelbox render benchmarks (simulated strip)")
+    parser.add_argument("--frames", type=int, default=300, help="frames per benchmark")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    header = (f"{'benchmark':<22} {'frames':>7} {'cpu ms/f':>10} {'wire ms/f':>10} "
+              f"{'frames/s':>10} {'max Hz':>9} {'of max':>8} {'period ms':>10} {'load':>8}")
+    lines = [header, "-" * len(header)]
+    for bench in (bench_scroll, bench_touch_paint, bench_gui_clear):
+        try:
+            result = bench(args.frames)
+        except ImportError as e:
+            lines.append(f"{bench.__name__:<22} skipped: {e}")
+            continue
+        if result is None:
+            lines.append(f"{bench.__name__:<22} skipped: no display")
+            continue
+        for r in result if isinstance(result, list) else [result]:
+            lines.append(r.line())
+    lines.append("")
+    lines.extend(bench_imports())
+
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
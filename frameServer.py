@@ -0,0 +1,141 @@
+# =====================================================================
+#                   Pixelbox - frameServer.py
+#   frameServer.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Shows 16x16 RGB frames sent over the network (raw UDP, TCP or E1.31/sACN).
+# =====================================================================
+'''
+Code Example Use:
+python3 frameServer.py                          # raw UDP + TCP on localhost:7890
+python3 frameServer.py --host 0.0.0.0 --sacn 1  # LAN, plus sACN universes 1-2
+python3 frameServer.py --layout 32x32           # tiled panels (utils/panelLayout.py LAYOUTS)
+python3 sendFrames.py --fps 300                 # test sender (see sendFrames.py)
+'''
+
+
+import argparse
+import asyncio
+import time
+from utils.ledBackend import create_strip, max_refresh_hz
+from utils.ledMap import LedMap, Framebuffer, MATRIX_ORIENTATION
+from utils.outputStage import OutputStage
+from utils.frameScheduler import FrameScheduler, render_loop
+from utils.panelLayout import LAYOUTS, CHANNEL_PINS, build_output, layout_refresh_hz
+from utils.frameIngest import (IngestStats, LatestFrame, UdpIngest, SacnAssembler, raw_decoder,
+                               tcp_handler, udp_socket, sacn_socket, universes_for, UDP_PORT, TCP_PORT)
+
+# --- Matrix Config ---
+GRID_ROWS = 16
+GRID_COLS = 16
+NUM_PIXELS = GRID_ROWS * GRID_COLS
+FRAME_SIZE = NUM_PIXELS * 3
+PIXEL_PIN = "D12"
+BRIGHTNESS = 0.1
+GAMMA = 2.8
+MAX_FPS = max_refresh_hz(NUM_PIXELS)  # pace to what the strip can show (~125 Hz)
+STATS_SECONDS = 5  # print counters this often while frames arrive
+LAYOUT = None  # name in panelLayout.LAYOUTS to drive tiled panels (or --layout); None = the matrix above
+
+# --- NeoPixel Setup (PIXELBOX_BACKEND=sim for a simulated strip) ---
+pixels = create_strip(PIXEL_PIN, NUM_PIXELS, pixel_order="GRB", lazy=True)  # brightness applied by output
+led_map = LedMap(GRID_ROWS, GRID_COLS, **MATRIX_ORIENTATION)  # frames are sent left-to-right, top-to-bottom
+frame = Framebuffer(led_map)
+output = OutputStage(pixels, led_map, brightness=BRIGHTNESS, gamma=GAMMA, pixel_order="GRB")
+
+def use_layout(name):
+    """Drive a tiled panel layout instead; grid size, frame size and pacing follow it."""
+    global GRID_ROWS, GRID_COLS, NUM_PIXELS, FRAME_SIZE, MAX_FPS, led_map, frame, output
+    led_map, output = build_output(LAYOUTS[name](), CHANNEL_PINS, brightness=BRIGHTNESS, gamma=GAMMA)
+    GRID_ROWS, GRID_COLS = led_map.rows, led_map.cols
+    NUM_PIXELS = GRID_ROWS * GRID_COLS
+    FRAME_SIZE = NUM_PIXELS * 3
+    MAX_FPS = layout_refresh_hz(led_map)  # channels refresh side by side
+    scheduler.period = 1.0 / MAX_FPS
+    frame = Framebuffer(led_map)
+
+stats = IngestStats()
+
+def show_latest():
+    data = latest.take()
+    if data is None:
+        return
+    frame.load(data)
+    frame.push(output)
+    stats.displayed += 1
+
+# Frames only mark the scheduler dirty; it shows the newest one once per strip refresh
+scheduler = FrameScheduler(show_latest, max_fps=MAX_FPS)
+latest = LatestFrame(stats, on_frame=scheduler.mark_dirty)
+
+
+async def stats_loop():
+    last = None
+    while True:
+        await asyncio.sleep(STATS_SECONDS)
+        if stats.received != last:
+            print(stats.line())
+            last = stats.received
+
+async def serve(host, udp_port, tcp_port, sacn_universe=None, seconds=None):
+    loop = asyncio.get_running_loop()
+
+    inputs = [UdpIngest(udp_socket(host, udp_port), raw_decoder(FRAME_SIZE), latest, stats)]
+    server = await asyncio.start_server(tcp_handler(FRAME_SIZE, latest), host, tcp_port)
+    print(f"Listening for {GRID_COLS}x{GRID_ROWS} RGB frames ({FRAME_SIZE} bytes): "
+          f"UDP {host}:{udp_port}, TCP {host}:{tcp_port}")
+    if sacn_universe is not None:
+        universes = range(sacn_universe, sacn_universe + universes_for(NUM_PIXELS))
+        inputs.append(UdpIngest(sacn_socket(host, universes),
+                                SacnAssembler(sacn_universe, NUM_PIXELS), latest, stats))
+        print(f"sACN universes {universes.start}-{universes.stop - 1}")
+    for ingest in inputs:
+        ingest.start(loop)
+
+    # Shows the latest frame whenever one is pending, at most MAX_FPS times a second
+    tasks = [asyncio.create_task(render_loop(scheduler)), asyncio.create_task(stats_loop())]
+    try:
+        if seconds is None:
+            await asyncio.Event().wait()  # until Ctrl-C
+        else:
+            await asyncio.sleep(seconds)
+    finally:
+        for task in tasks:
+            task.cancel()
+        server.close()
+        for ingest in inputs:
+            ingest.close()
+        if scheduler.dirty:
+            scheduler.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show RGB frames received over the network")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (0.0.0.0 for the LAN)")
+    parser.add_argument("--port", type=int, default=UDP_PORT, help="raw UDP port")
+    parser.add_argument("--tcp-port", type=int, default=TCP_PORT, help="raw TCP stream port")
+    parser.add_argument("--sacn", type=int, metavar="UNIVERSE", help="also accept E1.31 from this universe on")
+    parser.add_argument("--seconds", type=float, help="stop after this many seconds")
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), default=LAYOUT,
+                        help="tiled panel layout (default: one 16x16 matrix)")
+    args = parser.parse_args()
+    if args.layout:
+        use_layout(args.layout)
+
+    start = time.perf_counter()
+    try:
+        asyncio.run(serve(args.host, args.port, args.tcp_port, args.sacn, args.seconds))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = time.perf_counter() - start
+        print(f"{stats.line()}  ({stats.displayed / elapsed:.1f} frames/s shown)")
+        frame.fill((0, 0, 0))
+        frame.push(output)
+
+
+if __name__ == "__main__":
+    main()
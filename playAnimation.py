@@ -0,0 +1,77 @@
+# =====================================================================
+#                   Pixelbox - playAnimation.py
+#   playAnimation.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Plays .pbx drawings and animations (e.g. saved from the GUI) on the LED matrix.
+# =====================================================================
+'''
+Code Example Use:
+python3 playAnimation.py images/recording_20261017_120000.pbx
+python3 playAnimation.py images/wave.pbx --loop
+'''
+
+
+import argparse
+import time
+from utils.ledBackend import create_strip
+from utils.ledMap import LedMap, Framebuffer
+from utils.outputStage import OutputStage
+from utils.animation import Animator, Layer
+from utils.pbxFile import PbxReader, play_effect, PBX_ORIENTATION
+
+# --- Matrix Config ---
+GRID_ROWS = 16
+GRID_COLS = 16
+NUM_PIXELS = GRID_ROWS * GRID_COLS
+PIXEL_PIN = "D12"
+BRIGHTNESS = 0.1
+GAMMA = 2.8
+HOLD_SECONDS = 5  # how long a single-frame drawing stays up
+
+# Orientation: images are stored left-to-right, top-to-bottom as seen on the matrix
+# (same as scrollingText); the GUI converts its frames to this when saving
+
+# --- NeoPixel Setup (PIXELBOX_BACKEND=sim for a simulated strip) ---
+# Opened on the first frame, so importing this module never touches the hardware
+pixels = create_strip(PIXEL_PIN, NUM_PIXELS, pixel_order="GRB", lazy=True)  # brightness applied by output
+led_map = LedMap(GRID_ROWS, GRID_COLS, **PBX_ORIENTATION)
+frame = Framebuffer(led_map)
+output = OutputStage(pixels, led_map, brightness=BRIGHTNESS, gamma=GAMMA, pixel_order="GRB")
+
+
+def play(path, loop=False):
+    with PbxReader(path) as pbx:
+        if (pbx.rows, pbx.cols) != (GRID_ROWS, GRID_COLS):
+            raise ValueError(f"{path} is {pbx.cols}x{pbx.rows}, the matrix is {GRID_COLS}x{GRID_ROWS}")
+        if len(pbx) == 1 and not loop:
+            frame.load(pbx.frame(0))
+            frame.push(output)
+            time.sleep(HOLD_SECONDS)
+            return
+        anim = Animator(frame, lambda: frame.push(output), fps=pbx.fps)
+        anim.add(Layer(play_effect(pbx, loop=loop), blend="copy"))
+        anim.run()
+        if anim.dropped:
+            print(f"Dropped {anim.dropped} frames.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a .pbx drawing or animation")
+    parser.add_argument("path")
+    parser.add_argument("--loop", action="store_true", help="repeat until Ctrl-C")
+    args = parser.parse_args()
+    try:
+        play(args.path, loop=args.loop)
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        frame.fill((0, 0, 0))
+        frame.push(output)
+
+
+if __name__ == "__main__":
+    main()
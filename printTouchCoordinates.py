@@ -4,27 +4,19 @@
 #   Pixelbox
 #   Author: Alex Closson
 #   Date: 09/08/2025
-#   Last Update: 09/08/2025
+#   Last Update: 10/17/2026
 #   Version: 1.0.0
 #   Summary: File to print the coordinates of touch inputs on the touchscreen.
 # =====================================================================
 
 
-from evdev import InputDevice, categorize, ecodes
-import os
+import argparse
+from utils.touchTracker import ContactTracker
+from utils.touchDevice import find_touch_device
 
-# Adjust this to match your touchscreen device path
-TOUCH_DEVICE = '/dev/input/by-id/usb-UsbHID_SingWon-CTP-V1.18A_6F6A099B1133-event-if00'
+# None finds the touchscreen automatically; set a path to force one
+TOUCH_DEVICE = None
 
-# Open the touchscreen device
-try:
-    device = InputDevice(TOUCH_DEVICE)
-    print(f"Listening for touches on: {device.name}")
-except FileNotFoundError:
-    print(f"Device not found at {TOUCH_DEVICE}")
-    exit(1)
-
-x, y = None, None
 def map_to_led_matrix(x, y,
                       matrix_w=16, matrix_h=16,
                       touch_active_w=768, touch_active_h=768):
@@ -45,24 +37,42 @@ def map_to_led_matrix(x, y,
 
     return led_x, led_y
 
-for event in device.read_loop():
-    if event.type == ecodes.EV_ABS:
-        if event.code == ecodes.ABS_MT_POSITION_X:
-            x = event.value
-        elif event.code == ecodes.ABS_MT_POSITION_Y:
-            y = event.value
-    elif event.type == ecodes.EV_SYN:
-       
-        # A full touch event (sync) — only print if both coords are captured
-        if x is not None and y is not None:
-            led_x, led_y = map_to_led_matrix(x, y)
+def main(device):
+    """Print the LED cell of every finger in each complete touch frame read from device."""
+    tracker = ContactTracker()
+    for event in device.read_loop():
+        frame = tracker.feed(event)
+        if frame is None:
+            continue
+        moved, lifted = frame
+
+        # A full touch event (sync) — one line per finger that moved
+        for slot, x, y in moved:
             if x > 768:
                 #Touches outside the active area are not considered
-                print("Touch outside active area, ignoring.")
-                x, y = None, None
+                print(f"Touch {slot} outside active area, ignoring.")
                 continue
-            print(f"Touch at: X={led_x}, Y={led_y} (Raw: X={x}, Y={y})")
+            led_x, led_y = map_to_led_matrix(x, y)
+            print(f"Touch {slot} at: X={led_x}, Y={led_y} (Raw: X={x}, Y={y})")
+        for slot in lifted:
+            print(f"Touch {slot} released")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print touchscreen coordinates")
+    parser.add_argument("--replay", help="replay a touch recording instead of the touchscreen")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed, 1 = real time, 0 = as fast as possible")
+    args = parser.parse_args()
 
-            # Reset coordinates after printing
-            x, y = None, None
-            
\ No newline at end of file
+    if args.replay:
+        from utils.touchRecorder import ReplayDevice  # only replays pay for the import
+        device = ReplayDevice(args.replay, speed=args.speed)
+    else:
+        # Open the touchscreen device
+        device = find_touch_device(TOUCH_DEVICE)
+        if device is None:
+            print("Touchscreen device not found.")
+            exit(1)
+        print(f"Listening for touches on: {device.name} ({device.path})")
+    main(device)
@@ -1,26 +1,47 @@
 '''
 Code Example Use:
 import scrollingText
-scrollingText.main("text")
+scrollingText.main("text")                    # blocks until the text has scrolled by
+ticker = scrollingText.start_ticker()         # background queue; post() returns at once
+ticker.post("Door open", priority=0)   # utils.ticker.ALERT
+
+python3 scrollingText.py "Hello"
+python3 scrollingText.py --serve              # ticker service on a local socket
+python3 scrollingText.py --send --alert "Door open"
 
 
 '''
 
 
-import time
-import board
-import neopixel
 import colorsys
+import operator
+import threading
+import time
+from functools import lru_cache
+from utils.ledBackend import create_strip
+from utils.ledMap import LedMap, Framebuffer, MATRIX_ORIENTATION
+from utils.outputStage import OutputStage
+from utils.glyphAtlas import compile_font, scale_font, render_text
+from utils.animation import Animator, Layer, scroll_effect
 
 # --- Matrix Config ---
 GRID_ROWS = 16
 GRID_COLS = 16
 NUM_PIXELS = GRID_ROWS * GRID_COLS
+PIXEL_PIN = "D12"
 BRIGHTNESS = 0.1
-VERTICAL_OFFSET = 4  # shift down so 7px font is centered in 16px tall grid
+GAMMA = 2.8
+VERTICAL_OFFSET = None  # rows to shift text down; None centres the font in the grid
+STRIP_CACHE_SIZE = 32  # rendered messages kept ready for repeat scrolling
+
+# --- NeoPixel Setup (PIXELBOX_BACKEND=sim for a simulated strip) ---
+# Opened on the first frame, so importing this module never touches the hardware
+pixels = create_strip(PIXEL_PIN, NUM_PIXELS, pixel_order="GRB", lazy=True)  # brightness applied by output
 
-# --- NeoPixel Setup ---
-pixels = neopixel.NeoPixel(board.D12, NUM_PIXELS, auto_write=False, brightness=BRIGHTNESS)
+# --- Logical framebuffer (LED order, brightness and gamma applied once per frame on push) ---
+led_map = LedMap(GRID_ROWS, GRID_COLS, **MATRIX_ORIENTATION)  # text is drawn left-to-right
+frame = Framebuffer(led_map)
+output = OutputStage(pixels, led_map, brightness=BRIGHTNESS, gamma=GAMMA, pixel_order="GRB")
 
 # --- Font (same as your version) ---
 FONT_5x7 = {
@@ -96,43 +117,24 @@ FONT_5x7 = {
     " ": ["00000","00000","00000","00000","00000","00000","00000"],
 }
 
-# --- Font Helpers ---
-def char_to_bitmap(char):
-    """Convert single character into 2D list (rows of 0/1)."""
-    rows = FONT_5x7.get(char, FONT_5x7[" "])
-    return [[int(bit) for bit in row] for row in rows]
-
-def text_to_bitmap(text):
-    """Convert text string into one big bitmap row (7 tall, variable wide)."""
-    bitmap = [[] for _ in range(7)]
-
-    # Add left padding (blank columns equal to display width)
-    for r in range(7):
-        bitmap[r] += [0] * GRID_COLS
-
-    # Build each character with 1px spacing
-    for char in text:
-        char_bitmap = char_to_bitmap(char)
-        for r in range(7):
-            bitmap[r] += char_bitmap[r] + [0]
-
-    # Add right padding (blank columns equal to display width)
-    for r in range(7):
-        bitmap[r] += [0] * GRID_COLS
+# --- Kerning for the proportional font (tuck lowercase under overhangs) ---
+KERNING_5x7 = {
+    (left, right): -1 for left in "TVWY" for right in "acemnoprsuvwxyz"
+}
 
-    return bitmap
+# --- Compiled glyph atlases by name (names keep rendered strips cacheable) ---
+FONTS = {
+    "5x7": compile_font("5x7", FONT_5x7),
+    "5x7p": compile_font("5x7p", FONT_5x7, proportional=True, kerning=KERNING_5x7),
+}
+FONTS["5x14"] = scale_font(FONTS["5x7"], sy=2, name="5x14")     # full-height
+FONTS["5x14p"] = scale_font(FONTS["5x7p"], sy=2, name="5x14p")
 
-# --- Pixel Mapping (serpentine) ---
+# --- Pixel Mapping ---
 def set_pixel(row, col, color):
-    """Serpentine wiring with reversed row order."""
+    """Set a logical pixel; wiring order is applied by led_map on push."""
     if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-        if row % 2 == 0:
-            # even row: right to left
-            idx = row * GRID_COLS + (GRID_COLS - 1 - col)
-        else:
-            # odd row: left to right
-            idx = row * GRID_COLS + col
-        pixels[idx] = color
+        frame.set_pixel(row, col, color)
 
 # --- Color Helpers ---
 def hsv_to_rgb(h, s, v):
@@ -145,32 +147,85 @@ def rainbow_colors(n):
     return [hsv_to_rgb(i / n, 1.0, 1.0) for i in range(n)]
 
 # --- Drawing ---
-def display_window(bitmap, offset, colors_per_char):
-    char_width = 6  # 5px font + 1px spacing
-    for row in range(GRID_ROWS):
-        for col in range(GRID_COLS):
-            set_pixel(row, col, (0, 0, 0))  # clear background
-            if (row - VERTICAL_OFFSET) in range(len(bitmap)) and (col + offset) < len(bitmap[0]):
-                if bitmap[row - VERTICAL_OFFSET][col + offset] == 1:
-                    char_index = (col + offset) // char_width
-                    # Clamp to valid range
-                    if char_index >= len(colors_per_char):
-                        char_index = len(colors_per_char) - 1
-                    set_pixel(row, col, colors_per_char[char_index])
-    pixels.show()
-
-
-def scroll_text(text, speed=0.1):
-    bitmap = text_to_bitmap(text)
-    text_width = len(bitmap[0])
-
-    # rainbow length = number of characters in the text
-    num_chars = len(text)
-    colors_per_char = rainbow_colors(num_chars)
-
-    for offset in range(-GRID_COLS, text_width):
-        display_window(bitmap, offset, colors_per_char)
-        time.sleep(speed)
+# Strips are column-major; this gathers a GRID_COLS wide window into row-major order
+_window_to_rows = operator.itemgetter(*[
+    (col * GRID_ROWS + row) * 3 + ch
+    for row in range(GRID_ROWS) for col in range(GRID_COLS) for ch in range(3)
+])
+
+def render_strip(text, colors=None, font="5x7"):
+    """Render text once into a pre-coloured, column-major RGB strip.
+
+    Returns (strip, width): width columns of GRID_ROWS pixels, 3 bytes each,
+    with a display width of blank padding on both sides. colors is a tuple of
+    RGB tuples, one per character (rainbow when None or empty). The current
+    VERTICAL_OFFSET is part of the cache key, so changing it takes effect at once.
+    """
+    return _render_strip(text, colors, font, VERTICAL_OFFSET)
+
+@lru_cache(maxsize=STRIP_CACHE_SIZE)
+def _render_strip(text, colors, font, offset):
+    if not colors:
+        colors = rainbow_colors(len(text))
+    return render_text(FONTS[font], text, colors, GRID_ROWS, offset, pad=GRID_COLS)
+
+def display_window(strip, offset):
+    """Copy the GRID_COLS wide window at column offset out of a rendered strip and show it."""
+    start = offset * GRID_ROWS * 3
+    frame.buf[:] = bytes(_window_to_rows(memoryview(strip)[start:start + NUM_PIXELS * 3]))
+    frame.push(output)
+
+
+def scroll_text(text, speed=0.1, colors=None, font="5x7", background=None,
+                clock=time.monotonic, sleep=time.sleep):
+    """Scroll text across the matrix, one column every speed seconds.
+
+    Steps run on a fixed timestep, so render and show time do not slow the
+    scroll; frames are dropped if the Pi falls behind. background is an
+    optional effect (see utils.animation) drawn under the text. clock and
+    sleep are passed to the Animator (a fake pair runs it flat out).
+    """
+    if colors is not None:
+        colors = tuple(tuple(c) for c in colors)  # hashable cache key
+    strip, width = render_strip(text, colors, font)
+
+    anim = Animator(frame, lambda: frame.push(output), fps=1.0 / speed, clock=clock, sleep=sleep)
+    if background is not None:
+        anim.add(Layer(background, blend="copy", background=True))
+    # Text enters from the right and leaves fully on the left
+    anim.add(Layer(scroll_effect(strip, width, GRID_ROWS, GRID_COLS)))
+    anim.run()
+    return anim
+
+
+def start_ticker(speed=0.08, font="5x7"):
+    """Start a background Ticker on the matrix: post() queues a message and
+    returns, the next message is rendered while the current one scrolls."""
+    from utils.ticker import Ticker  # threads and sockets: only paid for when a ticker is used
+
+    return Ticker(frame, lambda: frame.push(output), render_strip,
+                  GRID_ROWS, GRID_COLS, fps=1.0 / speed, font=font, fonts=FONTS).start()
+
+
+def serve(messages=(), path=None):
+    """Ticker service: scroll messages posted to the local socket until Ctrl-C."""
+    from utils.ticker import SOCKET_PATH, serve_socket
+
+    path = path or SOCKET_PATH
+    ticker = start_ticker()
+    server = serve_socket(ticker, path)
+    print(f"Ticker listening on {path}")
+    for text in messages:
+        ticker.post(text)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        server.shutdown()
+        ticker.stop()
+        frame.fill((0, 0, 0))
+        frame.push(output)
 
 
 # --- Example Usage ---
@@ -178,13 +233,28 @@ def main(text_to_scroll:str):
     try:
         scroll_text(text_to_scroll, speed=0.08)
 
-        pixels.fill((0, 0, 0))
-        pixels.show()
+        frame.fill((0, 0, 0))
+        frame.push(output)
     except KeyboardInterrupt:
-        pixels.fill((0, 0, 0))
-        pixels.show()
+        frame.fill((0, 0, 0))
+        frame.push(output)
         print("Stopped.")
-        
+
 if __name__ == "__main__":
-    main()
+    import argparse
+    from utils.ticker import ALERT, NORMAL, SOCKET_PATH, send_message
+
+    parser = argparse.ArgumentParser(description="Scroll text across the LED matrix")
+    parser.add_argument("text", nargs="*", help="message(s) to scroll")
+    parser.add_argument("--serve", action="store_true", help=f"keep running and scroll messages sent to {SOCKET_PATH}")
+    parser.add_argument("--send", action="store_true", help="post the messages to a running --serve and return")
+    parser.add_argument("--alert", action="store_true", help="with --send: cut in ahead of routine messages")
+    args = parser.parse_args()
 
+    if args.send:
+        for text in args.text:
+            print(send_message(text, ALERT if args.alert else NORMAL))
+    elif args.serve:
+        serve(args.text)
+    else:
+        main(" ".join(args.text) or "Hello World")
@@ -0,0 +1,109 @@
+# =====================================================================
+#                   Pixelbox - sendFrames.py
+#   sendFrames.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Test sender for frameServer.py: streams a rainbow or a .pbx file over UDP, TCP or sACN.
+# =====================================================================
+'''
+Code Example Use:
+python3 sendFrames.py                              # rainbow, 60 fps, raw UDP to localhost
+python3 sendFrames.py --fps 500 --seconds 5        # faster than the strip: frames get dropped
+python3 sendFrames.py --tcp --pbx images/wave.pbx
+python3 sendFrames.py --sacn 1 --host 192.168.1.40
+python3 sendFrames.py --layout 32x32               # match frameServer.py --layout
+'''
+
+
+import argparse
+import itertools
+import socket
+import time
+from utils.animation import rainbow_background
+from utils.pbxFile import PbxReader
+from utils.frameIngest import (UDP_PORT, TCP_PORT, SACN_PORT, PIXELS_PER_UNIVERSE,
+                               sacn_packet, universes_for)
+from utils.panelLayout import LAYOUTS
+
+GRID_ROWS = 16
+GRID_COLS = 16
+NUM_PIXELS = GRID_ROWS * GRID_COLS
+
+
+def rainbow_frames(rows=GRID_ROWS, cols=GRID_COLS):
+    effect = rainbow_background(rows, cols, value=0.5)
+    next(effect)
+    for tick in itertools.count():
+        yield effect.send(tick)
+
+def sacn_sender(sock, host, universe, num_pixels=NUM_PIXELS):
+    """send(frame) that splits a frame over consecutive universes."""
+    sequence = itertools.count()
+    chunk = PIXELS_PER_UNIVERSE * 3
+
+    def send(data):
+        seq = next(sequence)
+        for k in range(universes_for(num_pixels)):
+            sock.sendto(sacn_packet(universe + k, seq, data[k * chunk:(k + 1) * chunk]), (host, SACN_PORT))
+    return send
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send test frames to frameServer.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--pbx", help="send the frames of this .pbx file (looped) instead of a rainbow")
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument("--tcp", action="store_true", help="stream over TCP instead of UDP")
+    transport.add_argument("--sacn", type=int, metavar="UNIVERSE", help="send E1.31 from this universe on")
+    parser.add_argument("--layout", choices=sorted(LAYOUTS), help="send frames sized for this panel layout")
+    args = parser.parse_args()
+
+    rows, cols = GRID_ROWS, GRID_COLS
+    if args.layout:
+        layout = LAYOUTS[args.layout]()
+        rows, cols = layout.rows, layout.cols
+
+    if args.tcp:
+        sock = socket.create_connection((args.host, TCP_PORT))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        send = sock.sendall
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if args.sacn is not None:
+            send = sacn_sender(sock, args.host, args.sacn, rows * cols)
+        else:
+            send = lambda data: sock.sendto(data, (args.host, UDP_PORT))
+
+    reader = PbxReader(args.pbx) if args.pbx else None
+    frames = reader.frames(loop=True) if reader else rainbow_frames(rows, cols)
+    period = 1.0 / args.fps
+    start = time.perf_counter()
+    sent = 0
+    try:
+        for data in frames:
+            now = time.perf_counter()
+            if now - start >= args.seconds:
+                break
+            send(data)
+            sent += 1
+            # Fixed-rate deadlines so the average rate holds even if one send is late
+            delay = start + sent * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = time.perf_counter() - start
+        print(f"Sent {sent} frames in {elapsed:.2f} s ({sent / elapsed:.1f} frames/s)")
+        sock.close()
+        if reader:
+            reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,28 +4,32 @@
 #   Pixelbox
 #   Author: Alex Closson
 #   Date: 09/08/2025
-#   Last Update: 09/08/2025
+#   Last Update: 10/17/2026
 #   Version: 1.0.0
 #   Summary: File to check on GPIO pin for response from Shake Sensor.
 # =====================================================================
 
 
-import RPi.GPIO as GPIO
-import time
+import threading
+from utils.shakeSensor import ShakeSensor
 
 SENSOR_PIN = 27  # or 16 if you're wired to Pin 36
 
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(SENSOR_PIN, GPIO.IN)
+
+def on_shake(shake):
+    # Runs on the GPIO callback thread, once per debounced edge
+    print(f"Shake detected! intensity {shake.intensity}")
+
+
+sensor = ShakeSensor(SENSOR_PIN)
+sensor.subscribe(on_shake, repeat=True)
+sensor.start()
 
 print("Waiting for vibration...")
 
 try:
-    while True:
-        if GPIO.input(SENSOR_PIN) == GPIO.HIGH:
-            print("Shake detected!")
-        else:
-            print("Idle")
-        time.sleep(0.1)
+    threading.Event().wait()  # edges arrive by interrupt; nothing to poll
 except KeyboardInterrupt:
-    GPIO.cleanup()
\ No newline at end of file
+    print(f"{sensor.bounced} bounces filtered.")
+finally:
+    sensor.close()
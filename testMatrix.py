@@ -4,37 +4,47 @@
 #   Pixelbox
 #   Author: Alex Closson
 #   Date: 09/08/2025
-#   Last Update: 09/08/2025
+#   Last Update: 10/17/2026
 #   Version: 1.0.0
 #   Summary: File to test the LED matrix functionality by illuminating the first 10 LEDs with a green light and then turning them off.
 # =====================================================================
 
 
 import time
-import board
-import neopixel
+from utils.ledBackend import create_strip
+from utils.ledMap import LedMap, Framebuffer
+from utils.outputStage import OutputStage
 
 # --- Config ---
 GRID_ROWS = 16
 GRID_COLS = 16
 NUM_PIXELS = GRID_ROWS * GRID_COLS
+BRIGHTNESS = 0.2
+GAMMA = 1.0  # linear, so the LEDs look as they did with the library's brightness=0.2
 
-# --- NeoPixel setup ---
-pixels = neopixel.NeoPixel(board.D12, NUM_PIXELS, auto_write=False, brightness=0.2)
+# --- NeoPixel setup (brightness applied by output) ---
+pixels = create_strip("D12", NUM_PIXELS, pixel_order="GRB")
+
+# Frame in wire order (identity map): index i is the i-th LED on the strip
+frame = Framebuffer(LedMap(GRID_ROWS, GRID_COLS, index_map=range(NUM_PIXELS)))
+output = OutputStage(pixels, frame.map, brightness=BRIGHTNESS, gamma=GAMMA, pixel_order="GRB")
+
+def set_led(i, color):
+    frame.buf[i * 3:i * 3 + 3] = bytes(color)
 
 try:
     print("Lighting first 10 LEDs green...")
     for i in range(10):
-        pixels[i] = (0, 255, 0)  # Green
-    pixels.show()
+        set_led(i, (0, 255, 0))  # Green
+    frame.push(output)
 
     time.sleep(2)  # hold for 2 seconds
 
     print("Turning all LEDs off...")
-    pixels.fill((0, 0, 0))
-    pixels.show()
+    frame.fill((0, 0, 0))
+    frame.push(output)
 
 except KeyboardInterrupt:
-    pixels.fill((0, 0, 0))
-    pixels.show()
+    frame.fill((0, 0, 0))
+    frame.push(output)
     print("Stopped.")
@@ -4,38 +4,47 @@
 #   Pixelbox
 #   Author: Alex Closson
 #   Date: 09/08/2025
-#   Last Update: 09/08/2025
+#   Last Update: 10/17/2026
 #   Version: 1.0.0
 #   Summary: File to test functionality between touchscreen and LED Matrix.
 # =====================================================================
 
 
-from evdev import InputDevice, ecodes #Touchscreen input library
-import board #Pin definitions for Raspberry Pi
-import neopixel #LED Matrix library
 import time #Time library for delays
+import asyncio #Runs touch, shake sensor and rendering in one loop
+import argparse #Command line options (touch replay)
+from utils.ledBackend import create_strip #NeoPixel or simulated strip
+from utils.ledMap import LedMap, Framebuffer, MATRIX_ORIENTATION #Shared LED index map and wiring
+from utils.outputStage import OutputStage #Brightness/gamma tables applied on push
+from utils.frameScheduler import FrameScheduler, render_loop #Coalesces show() calls
+from utils.shakeSensor import ShakeSensor, ShakeSensorError #Shake sensor event source
+from utils.strokeEngine import StrokeEngine #Joins touch samples into lines
+from utils.touchRecorder import ReplayDevice #Replays recorded touch streams
+from utils.latencyProbe import probe_from_env #Optional latency stats (PIXELBOX_LATENCY=1)
+from utils.canvasJournal import CanvasJournal, NullJournal #Drawing survives restarts
+from utils.paths import state_dir #Saved state location (PIXELBOX_STATE_DIR)
+from utils.undoHistory import UndoHistory, group_by_color #Undo/redo buttons
+from utils.touchTracker import ContactTracker #Per-slot multi-touch state
+from utils.touchDevice import find_touch_device #Touchscreen auto-discovery
+from utils.startupTimer import first_frame #Launch-to-first-frame timing
+from utils.touchCalibration import Region, TouchMap, Calibration, collect_taps, raw_size_of #Touch lookup tables
+from utils.touchFilter import TouchFilter, NullTouchFilter #Jitter smoothing, prediction, hysteresis
 
 # ----- LED Matrix Configuration -----
 GRID_ROWS = 16
 GRID_COLS = 16
 NUM_PIXELS = GRID_ROWS * GRID_COLS
-PIXEL_PIN = board.D12
+PIXEL_PIN = "D12" # board pin name
 BRIGHTNESS = 0.1
+GAMMA = 2.8
+MAX_FPS = 100 # cap on pixels.show() rate; one frame is ~7.7 ms of wire time
 
-# ----- Touch Area Limits -----
+# ----- Touch Area Limits (nominal overlay px; calibration maps raw touches onto these) -----
 TOUCH_WIDTH  = 768        # px 
 TOUCH_HEIGHT = 768        # px
 FULL_OVERLAY_WIDTH = 1024 # px
 BUTTON_AREA_WIDTH = FULL_OVERLAY_WIDTH - TOUCH_WIDTH
 
-# ----- Orientation toggles (hardcode as needed) -----
-SWAP_AXES = True     # set True if row/col appear swapped
-HFLIP     = False     # Horizontal Flip Mirror Left/Right
-VFLIP     = False      # Vertical Flip Mirror Up/Down
-
-# P2-55: Rotation applied for actual matrix orientation
-ROTATE    = 90         # 0, 90, 180, 270 (degrees)
-
 # ----- Orientation toggles for button area -----
 ROTATE_BUTTON_INDICATORS = True # set True to rotate button indicators by 90 degrees clockwise
 TOUCH_OVERLAY_LEFT_SIDE  = True # set True if button area is located left of the LED matrix
@@ -43,170 +52,359 @@ TOUCH_OVERLAY_LEFT_SIDE  = True # set True if button area is located left of the
 # ----- Button Configuration -----
 NUM_BUTTONS = 8
 
-# ----- Setup NeoPixel -----
-pixels = neopixel.NeoPixel(
-    PIXEL_PIN, NUM_PIXELS, brightness=BRIGHTNESS,
-    auto_write=False, pixel_order=neopixel.GRB
-)
+# ----- Touch Regions -----
+# Matrix and button bar side by side; one table drives hit-testing and calibration
+MATRIX_X0  = BUTTON_AREA_WIDTH if TOUCH_OVERLAY_LEFT_SIDE else 0
+BUTTONS_X0 = 0 if TOUCH_OVERLAY_LEFT_SIDE else TOUCH_WIDTH
+MATRIX, BUTTONS = 0, 1
+REGIONS = [
+    Region("matrix",  MATRIX_X0,  MATRIX_X0 + TOUCH_WIDTH,        0, TOUCH_HEIGHT, GRID_ROWS, GRID_COLS),
+    Region("buttons", BUTTONS_X0, BUTTONS_X0 + BUTTON_AREA_WIDTH, 0, TOUCH_HEIGHT, NUM_BUTTONS, 1),
+]
+CALIBRATION_CELLS = [(1, 1), (1, GRID_COLS - 2), (GRID_ROWS - 2, GRID_COLS - 2), (GRID_ROWS - 2, 1)]
 
-# ----- Helper Functions -----
-def serpentine_index(row, col):
-    # row-wise serpentine
-    if row % 2 == 0:
-        return row * GRID_COLS + col
-    else:
-        return row * GRID_COLS + (GRID_COLS - 1 - col)
+# ----- Brush -----
+BRUSH_SIZE  = 1          # cells across
+BRUSH_SHAPE = "square"   # "square" or "round"
+MAX_CONTACTS = 10        # fingers drawing at once (multi-touch slots)
+TOUCH_FILTER = True      # smooth jitter, predict ahead and hold cells at borders (utils/touchFilter.py)
 
-def map_touch_to_led(x, y):
-    # scale raw touch to grid cell (use -1 to avoid hitting 16)
-    col = int((x / max(1, TOUCH_WIDTH  - 1)) * (GRID_COLS - 1) + 0.5)
-    row = int((y / max(1, TOUCH_HEIGHT - 1)) * (GRID_ROWS - 1) + 0.5)
+# ----- Shake Sensor -----
+SHAKE_PIN = 27              # GPIO (BCM) of the shake sensor
+SHAKE_TO_CLEAR = True       # set True to clear the drawing when the box is shaken
+SHAKE_CLEAR_INTENSITY = 3   # debounced edges within a second that count as a shake (1 = any knock)
 
+# ----- Persistence -----
+PERSIST_DRAWING = True      # restore the last drawing on start (state in PIXELBOX_STATE_DIR)
 
-    # apply transforms
-    if SWAP_AXES:
-        row, col = col, row
+# ----- Touch Device -----
+TOUCH_DEV_PATH = None  # None finds the touchscreen (or PIXELBOX_TOUCH_DEV); set a path to force one
 
-    # rotations (about top-left origin)
-    if ROTATE == 90:
-        row, col = col, (GRID_COLS - 1) - row
-    elif ROTATE == 180:
-        row, col = (GRID_ROWS - 1) - row, (GRID_COLS - 1) - col
-    elif ROTATE == 270:
-        row, col = (GRID_ROWS - 1) - col, row
+# ----- Setup NeoPixel (PIXELBOX_BACKEND=sim for a simulated strip) -----
+# Opened on the first frame, so importing this module never touches the hardware
+pixels = create_strip(PIXEL_PIN, NUM_PIXELS, pixel_order="GRB", lazy=True)  # brightness applied by output
 
-    if HFLIP:
-        col = (GRID_COLS - 1) - col
-    if VFLIP:
-        row = (GRID_ROWS - 1) - row
+# ----- Logical framebuffer, orientation/serpentine applied at push time -----
+# The touch overlay sits on the matrix, so touches use the matrix orientation (utils/ledMap.py)
+led_map = LedMap(GRID_ROWS, GRID_COLS, **MATRIX_ORIENTATION)
+frame = Framebuffer(led_map)
+output = OutputStage(pixels, led_map, brightness=BRIGHTNESS, gamma=GAMMA, pixel_order="GRB")
 
-    # clamp (belt & suspenders)
-    col = max(0, min(GRID_COLS - 1, col))
-    row = max(0, min(GRID_ROWS - 1, row))
-    return row, col
+# Touch-to-photon instrumentation; a no-op unless PIXELBOX_LATENCY=1
+probe = probe_from_env()
 
-def clear_matrix():
-    pixels.fill((0, 0, 0))
-    pixels.show()
+def push_frame():
+    start = time.time()
+    frame.push(output)
+    probe.pushed(start, time.time())
+    first_frame("touchToLED", frame.buf)
 
-# Set the button indicator LEDs for the given index
-def set_button_indicator(button_index, color):
+# Drawing journal; replaced in main() when PERSIST_DRAWING is set
+journal = NullJournal()
+
+# Pixel writes only mark the frame dirty; the scheduler pushes once per tick
+scheduler = FrameScheduler(push_frame, max_fps=MAX_FPS)
 
+# Fills the gaps between touch samples of a fast swipe
+stroke = StrokeEngine(GRID_ROWS, GRID_COLS, BRUSH_SIZE, BRUSH_SHAPE)
+
+# Each stroke or clear is one undo step (buttons 6 and 7)
+history = UndoHistory(frame)
+
+# Raw touch -> region and cell, compiled from REGIONS and the saved calibration
+touch_map = TouchMap(REGIONS, Calibration.load(), raw_size=(FULL_OVERLAY_WIDTH, TOUCH_HEIGHT))
+
+# Smooths each finger's samples before they are classified
+touch_filter = (TouchFilter if TOUCH_FILTER else NullTouchFilter)(touch_map.classify)
+
+# ----- Helper Functions -----
+def calibrate(device):
+    """Light each calibration cell in turn, fit the taps on it and save the result."""
+    global touch_map
+    matrix = REGIONS[MATRIX]
+    targets = [matrix.centre(row, col) for row, col in CALIBRATION_CELLS]
+
+    def show_target(i, _target):
+        frame.fill((0, 0, 0))
+        frame.set_pixel(*CALIBRATION_CELLS[i], (255, 255, 255))
+        frame.push(output)
+        print(f"Tap the lit LED ({i + 1}/{len(targets)})")
+
+    taps = collect_taps(device, targets, show_target)
+    calibration = Calibration.fit(taps, targets)
+    calibration.save()
+    print(f"Calibration saved to {Calibration.default_path()} "
+          f"(worst tap {calibration.error(taps, targets):.1f} px off after fitting)")
+    touch_map = TouchMap(REGIONS, calibration, raw_size_of(device, (FULL_OVERLAY_WIDTH, TOUCH_HEIGHT)))
+    touch_filter.classify = touch_map.classify
+
+def clear_matrix():
+    # Indicators are kept out of the undo history, so undoing a clear never relights one
+    history.fill((0, 0, 0), skip=INDICATOR_PIXELS)
+    history.end()
+    for index in INDICATOR_PIXELS:
+        frame.buf[index * 3:index * 3 + 3] = bytes(3)
+    journal.clear()
+    scheduler.mark_dirty()
+
+def apply_history(changed):
+    """Log and show the pixels an undo/redo changed."""
+    for color, indices in group_by_color(changed).items():
+        journal.paint_indices(indices, color)
+    if changed:
+        scheduler.mark_dirty()
+
+# Logical indices of the LEDs that show the given button's indicator
+def indicator_indices(button_index):
+
+    indices = []
     for i in range(int(GRID_ROWS / NUM_BUTTONS)):
 
+        # Indicators are placed in physical matrix coordinates
         if ROTATE_BUTTON_INDICATORS:
-            led_index = serpentine_index(button_index*(int(GRID_ROWS/NUM_BUTTONS)) + i, GRID_COLS-1)
+            row, col = button_index*(int(GRID_ROWS/NUM_BUTTONS)) + i, GRID_COLS-1
         else:
-            led_index = serpentine_index(GRID_COLS-1, button_index*(int(GRID_ROWS/NUM_BUTTONS)) + i)
-        pixels[led_index] = color
+            row, col = GRID_COLS-1, button_index*(int(GRID_ROWS/NUM_BUTTONS)) + i
+        indices.append(led_map.logical_index(row, col))
+    return indices
 
-    pixels.show()
+INDICATOR_PIXELS = frozenset(i for button in range(NUM_BUTTONS) for i in indicator_indices(button))
+
+# Set the button indicator LEDs for the given index
+def set_button_indicator(button_index, color):
+    indices = indicator_indices(button_index)
+    rgb = bytes(color)
+    for index in indices:
+        frame.buf[index * 3:index * 3 + 3] = rgb
+
+    journal.paint_indices(indices, color)
+    scheduler.mark_dirty()
+
+# ----- Touch Handling -----
+class TouchState:
+    """Touch and button state carried between SYN frames."""
+
+    def __init__(self):
+        self.tracker = ContactTracker(MAX_CONTACTS)
+        self.selected_color = (255, 255, 255)
+        self.selected_button = None
+        self.prev_selected_button = None
+        self.button_latched = False  # clear/undo/redo fire once per press
+
+def press_button(state, button):
+    """Handle a contact over the virtual button area on button index button."""
+    if button == state.prev_selected_button and state.button_latched:
+        return  # same button still held: nothing to log or redraw
+    color = state.selected_color
+    state.selected_button = button
+    print("Selected button: ", state.selected_button)
+
+    # If currently selected button differs from last, clear LED indicator
+    if state.prev_selected_button is not None and state.prev_selected_button != state.selected_button:
+        set_button_indicator(state.prev_selected_button, (0, 0, 0))
+
+    match state.selected_button:
+        # Clear button
+        case 0:
+            if not state.button_latched:
+                print("Clear button selected")
+                clear_matrix()
+            set_button_indicator(state.selected_button, (255, 255, 255))
+        # Erase button
+        case 1:
+            print("Erase selected")
+            state.selected_color = (0, 0, 0)
+            set_button_indicator(state.selected_button, (state.selected_color))
+        # White color button
+        case 2:
+            print("White color selected")
+            state.selected_color = (255, 255, 255)
+            set_button_indicator(state.selected_button, (state.selected_color))
+        # Red color button
+        case 3:
+            print("Red color selected")
+            state.selected_color = (255, 0, 0)
+            set_button_indicator(state.selected_button, (state.selected_color))
+        # Green color button
+        case 4:
+            print("Green color selected")
+            state.selected_color = (0, 255, 0)
+            set_button_indicator(state.selected_button, (state.selected_color))
+        # Blue color button
+        case 5:
+            print("Blue color selected")
+            state.selected_color = (0, 0, 255)
+            set_button_indicator(state.selected_button, (state.selected_color))
+        # Undo button
+        case 6:
+            if not state.button_latched:
+                print("Undo selected")
+                apply_history(history.undo())
+            set_button_indicator(state.selected_button, (255, 255, 255))
+        # Redo button
+        case 7:
+            if not state.button_latched:
+                print("Redo selected")
+                apply_history(history.redo())
+            set_button_indicator(state.selected_button, (255, 255, 255))
+        case _:
+            print("Unused button")
+            set_button_indicator(state.selected_button, (255, 255, 255))
+
+    state.button_latched = True
+    if state.selected_color != color:
+        journal.set_color(state.selected_color)
+    state.prev_selected_button = state.selected_button
+
+def handle_event(state, event):
+    """Feed one evdev event; every contact's stroke is painted together on EV_SYN."""
+    frame_update = state.tracker.feed(event)
+    if frame_update is None:
+        return
+    moved, lifted = frame_update
+    for slot in lifted:
+        stroke.end(slot)  # that finger's next touch starts a new line
+        touch_filter.end(slot)
+    if lifted and not state.tracker.active:
+        # All fingers up: the strokes so far are one undo step
+        history.end()
+        state.button_latched = False
+    if not moved:
+        return
+
+    t = event.timestamp()
+    probe.frame(t)
+    cells = []
+    for slot, x, y in moved:
+        region, row, col = touch_filter.update(slot, x, y, t)
+
+        # If touch point on LED matrix
+        if region == MATRIX:
+            # The line since this finger's last sample, printed to terminal
+            segment = stroke.move(slot, row, col)
+            if segment:
+                cells += segment
+                print(f"Touch {slot} LED ({row},{col}) Index {led_map.led_index(row, col)}")
+
+        # Touch point falls over virtual button area
+        else:
+            stroke.end(slot)
+            press_button(state, row)
+    probe.mark("map")
+
+    # One framebuffer update and one dirty mark for all contacts
+    if cells:
+        history.paint_cells(cells, state.selected_color)
+        journal.paint(cells, state.selected_color)
+        scheduler.mark_dirty()
+        probe.mark("paint")
+        probe.painted()
+
+
+# ----- Async Tasks -----
+def on_shake(shake):
+    """Clear the drawing whenever the box is shaken (runs on the event loop)."""
+    print(f"Shake detected! (intensity {shake.intensity})")
+    clear_matrix()
+
+async def run(device, shake=None):
+    """Run touch input, shake sensor and rendering until the device runs dry.
+
+    device is anything with evdev's async_read_loop() (a real InputDevice or a
+    FakeInputDevice for headless runs); shake is an optional ShakeSensor.
+    """
+    # Paced flushes: LED frames, and the journal's group commits
+    tasks = [asyncio.create_task(render_loop(scheduler))]
+    if journal.enabled:
+        tasks.append(asyncio.create_task(render_loop(journal.scheduler)))
+    if shake is not None:
+        try:
+            shake.subscribe(on_shake, min_intensity=SHAKE_CLEAR_INTENSITY)
+            shake.start(asyncio.get_running_loop())
+        except ShakeSensorError as e:
+            # No RPi.GPIO or no GPIO access: keep drawing without the shake sensor
+            print(f"Shake sensor unavailable ({e}), continuing without it.")
+            shake.unsubscribe(on_shake)
+            shake = None
+
+    state = TouchState()
+    if journal.enabled:
+        # Bring back the last drawing: snapshot plus journal tail
+        color = journal.restore()
+        if color is not None:
+            state.selected_color = color
+        scheduler.mark_dirty()
+    else:
+        #Clear the screen initially
+        clear_matrix()
+    try:
+        async for event in device.async_read_loop():
+            handle_event(state, event)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        journal.close()
+        if scheduler.dirty:
+            scheduler.flush()
+        if shake is not None:
+            shake.close()
 
 # ----- Main Loop -----
 def main():
-    #Path of touchscreen device. Adjust as needed.
-    touch_dev_path = '/dev/input/by-id/usb-UsbHID_SingWon-CTP-V1.18A_6F6A099B1133-event-if00'
-    try:
-        device = InputDevice(touch_dev_path) #Initialize touchscreen device
-        print(f"Listening on: {device.name}")
-    except FileNotFoundError:
-        print("Touchscreen device not found.")
+    global journal, touch_map
+    parser = argparse.ArgumentParser(description="Draw on the LED matrix with the touchscreen")
+    parser.add_argument("--replay", help="replay a touch recording instead of the touchscreen")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed, 1 = real time, 0 = as fast as possible")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="tap the lit LEDs to calibrate the touchscreen, then exit")
+    args = parser.parse_args()
+
+    if args.replay:
+        device = ReplayDevice(args.replay, speed=args.speed)
+        shake = None
+        print(f"Replaying {len(device.events)} events from {args.replay}")
+    else:
+        device = find_touch_device(TOUCH_DEV_PATH) #Initialize touchscreen device
+        if device is None:
+            print("Touchscreen device not found.")
+            return
+        print(f"Listening on: {device.name} ({device.path})")
+        # Tables sized to the panel's reported raw range
+        touch_map = TouchMap(REGIONS, touch_map.calibration,
+                             raw_size_of(device, (FULL_OVERLAY_WIDTH, TOUCH_HEIGHT)))
+        touch_filter.classify = touch_map.classify
+        shake = ShakeSensor(SHAKE_PIN) if SHAKE_TO_CLEAR else None
+        if PERSIST_DRAWING:
+            journal = CanvasJournal(state_dir("touch"), frame)
+
+    if args.calibrate:
+        try:
+            calibrate(device)
+        finally:
+            frame.fill((0, 0, 0))
+            frame.push(output)
         return
 
-    #Clear the screen initially
-    clear_matrix()
-    x = y = None
-
-    #Button variables
-    selected_color = (255, 255, 255)
-    selected_button = None
-    prev_selected_button = None
-
-    for event in device.read_loop():
-        if event.type == ecodes.EV_ABS:
-            if event.code == ecodes.ABS_MT_POSITION_X:
-                x = event.value
-            elif event.code == ecodes.ABS_MT_POSITION_Y:
-                y = event.value
-        elif event.type == ecodes.EV_SYN:
-            if x is not None and y is not None:
-
-                # If touch point on LED matrix
-                if  ((x >= BUTTON_AREA_WIDTH) and TOUCH_OVERLAY_LEFT_SIDE) or ((x <= TOUCH_WIDTH) and not TOUCH_OVERLAY_LEFT_SIDE):
-
-                    if TOUCH_OVERLAY_LEFT_SIDE:
-                        # Offset touch x value for button area
-                        x = x - BUTTON_AREA_WIDTH
-
-                    row, col = map_touch_to_led(x, y)
-                    led_index = serpentine_index(row, col)
-
-                    # Light up corresponding LED and print to terminal
-                    print(f"Touch LED ({row},{col}) Index {led_index}")
-                    pixels[led_index] = selected_color
-                    pixels.show()
-
-                    x = y = None
-
-                # Touch point falls over virtual button area
-                else: 
-
-                    # Determine selected button
-                    for i in range(NUM_BUTTONS):
-                        if y >= i*(TOUCH_HEIGHT / NUM_BUTTONS) and y <= (i+1)*(TOUCH_HEIGHT / NUM_BUTTONS):
-
-                            selected_button = i
-                            print("Selected button: ", selected_button)
-
-                    if selected_button is not None:
-
-                        # If currently selected button differs from last, clear LED indicator
-                        if prev_selected_button is not None and prev_selected_button != selected_button:
-                            set_button_indicator(prev_selected_button, (0, 0, 0))
-
-                        match selected_button:
-                            # Clear button
-                            case 0:
-                                print("Clear button selected")
-                                set_button_indicator(selected_button, (255, 255, 255))
-                                clear_matrix()
-                            # Erase button
-                            case 1:
-                                print("Erase selected")
-                                selected_color = (0, 0, 0)
-                                set_button_indicator(selected_button, (selected_color))
-                            # White color button
-                            case 2:
-                                print("White color selected")
-                                selected_color = (255, 255, 255)
-                                set_button_indicator(selected_button, (selected_color))
-                            # Red color button
-                            case 3:
-                                print("Red color selected")
-                                selected_color = (255, 0, 0)
-                                set_button_indicator(selected_button, (selected_color))
-                            # Green color button
-                            case 4:
-                                print("Green color selected")
-                                selected_color = (0, 255, 0)
-                                set_button_indicator(selected_button, (selected_color))
-                            # Blue color button
-                            case 5:
-                                print("Blue color selected")
-                                selected_color = (0, 0, 255)
-                                set_button_indicator(selected_button, (selected_color))
-                            case _:
-                                print("Unused button")
-                                set_button_indicator(selected_button, (255, 255, 255))
-
-                        prev_selected_button = selected_button
+    start = time.perf_counter()
+    asyncio.run(run(device, shake))
+    if args.replay:
+        elapsed = time.perf_counter() - start
+        print(f"Replay done: {len(device.events)} events in {elapsed:.3f} s "
+              f"({len(device.events) / elapsed:.0f} events/s), {scheduler.flushes} frames pushed")
+    if probe.enabled:
+        probe.dump()
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        #Ctrl-C to exit and clear matrix
+        #Ctrl-C to exit and clear matrix (the saved drawing is kept)
+        journal.close()
         clear_matrix()
+        scheduler.flush()
+        probe.dump()
         print("\nExited by user using keyboard interrupt.")
         
\ No newline at end of file
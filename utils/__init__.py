@@ -0,0 +1,10 @@
+# =====================================================================
+#                   Pixelbox - __init__.py
+#   __init__.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Shared helpers used by the Pixelbox scripts.
+# =====================================================================
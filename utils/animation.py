@@ -0,0 +1,230 @@
+# =====================================================================
+#                   Pixelbox - animation.py
+#   animation.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Fixed-timestep animation engine compositing effect layers into one framebuffer.
+# =====================================================================
+'''
+Code Example Use:
+from utils.animation import Animator, Layer, scroll_effect, solid
+anim = Animator(frame, lambda: frame.push(pixels), fps=12)
+anim.add(Layer(solid((0, 0, 20)), background=True))
+anim.add(Layer(scroll_effect(strip, width, 16, 16)))
+anim.run()
+'''
+
+
+import colorsys
+import operator
+import time
+
+from utils.ledMap import GRID_ROWS, GRID_COLS
+
+# ----- Blend Modes -----
+# Each takes the composed frame so far (bytearray) and a layer (bytes-like)
+def blend_copy(dst, src):
+    dst[:] = src
+
+def blend_over(dst, src):
+    """Layer pixels replace the frame except where the layer is black (transparent)."""
+    for i in range(0, len(dst), 3):
+        if src[i] or src[i + 1] or src[i + 2]:
+            dst[i:i + 3] = src[i:i + 3]
+
+def blend_add(dst, src):
+    dst[:] = bytes(min(a + b, 255) for a, b in zip(dst, src))
+
+def blend_max(dst, src):
+    dst[:] = bytes(map(max, dst, src))
+
+BLENDS = {
+    "copy": blend_copy,
+    "over": blend_over,
+    "add": blend_add,
+    "max": blend_max,
+}
+
+
+# ----- Effects -----
+# An effect is a generator primed by the engine. Each tick the engine sends
+# the tick number and the effect yields a row-major RGB buffer for that tick
+# (or None to keep its previous one); returning ends the effect. Ticks can
+# jump forward when the engine drops frames, so effects index by tick rather
+# than counting yields.
+def scroll_effect(strip, width, rows, cols, step=1):
+    """Scroll a column-major strip (as from glyphAtlas.render_text) right to left, step columns per tick."""
+    window = operator.itemgetter(*[
+        (col * rows + row) * 3 + ch
+        for row in range(rows) for col in range(cols) for ch in range(3)
+    ])
+    view = memoryview(strip)
+    last = width - cols  # text fully off the left edge
+    size = rows * cols * 3
+    tick = yield
+    while tick * step <= last:
+        start = tick * step * rows * 3
+        tick = yield bytes(window(view[start:start + size]))
+
+def solid(color, num_pixels=GRID_ROWS * GRID_COLS):
+    """Constant colour layer."""
+    buf = bytes(color) * num_pixels
+    yield
+    while True:
+        yield buf
+
+def static(buf):
+    """Show a live buffer (e.g. the drawing canvas) as it is each tick.
+
+    Passing the Animator's own frame.buf shows the frame as it was when the
+    animation started, so layers on top do not leave trails in it.
+    """
+    yield
+    while True:
+        yield buf
+
+def rainbow_background(rows, cols, ticks_per_cycle=120, value=0.3):
+    """Diagonal rainbow drifting one hue step per tick (frames precomputed once)."""
+    frames = []
+    for k in range(ticks_per_cycle):
+        buf = bytearray()
+        for row in range(rows):
+            for col in range(cols):
+                h = ((row + col) / (rows + cols) + k / ticks_per_cycle) % 1.0
+                r, g, b = colorsys.hsv_to_rgb(h, 1.0, value)
+                buf += bytes((int(r * 255), int(g * 255), int(b * 255)))
+        frames.append(bytes(buf))
+    tick = yield
+    while True:
+        tick = yield frames[tick % ticks_per_cycle]
+
+
+# ----- Layers -----
+class Layer:
+    """One effect in the stack. Background layers do not keep the animation running."""
+
+    def __init__(self, effect, blend="over", background=False):
+        self.effect = effect
+        self.blend = BLENDS[blend]
+        self.background = background
+        self.buf = None
+        self.done = False
+        next(effect)  # prime to the first yield
+
+    def advance(self, tick):
+        try:
+            buf = self.effect.send(tick)
+        except StopIteration:
+            self.done = True
+            self.buf = None
+            return
+        if buf is not None:
+            self.buf = buf
+
+
+# ----- Engine -----
+class Animator:
+    """Runs layers on a fixed timestep measured from a monotonic start time.
+
+    Tick k is due at start + k * period, so render and show time never
+    accumulate into drift. When the engine falls more than a frame behind it
+    skips straight to the current tick (counting the dropped frames) instead
+    of trying to catch up. Layers are composed bottom to top and copied into
+    frame.buf, then push() is called once per rendered tick.
+    """
+
+    def __init__(self, frame, push, fps=30, clock=time.monotonic, sleep=time.sleep):
+        self.frame = frame
+        self.push = push
+        self.period = 1.0 / fps
+        self.clock = clock
+        self.sleep = sleep
+        self.layers = []
+        self._scratch = bytearray(len(frame.buf))
+        self._base = None
+        self.tick = 0
+        self.start = None
+        self._running = False
+
+        # Counters
+        self.rendered = 0
+        self.dropped = 0
+
+    def add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def stop(self):
+        self._running = False
+
+    @property
+    def finished(self):
+        return not any(not layer.done and not layer.background for layer in self.layers)
+
+    def render(self, tick):
+        """Advance every layer to tick and compose them into the framebuffer."""
+        # Composed off to the side and copied in: a layer may be showing frame.buf
+        # itself (e.g. static(frame.buf) under text), which then stands for the
+        # frame as it was when the animation started, not last tick's output
+        frame_buf = self.frame.buf
+        if self._base is None:
+            self._base = bytes(frame_buf)
+        buf = self._scratch
+        buf[:] = bytes(len(buf))
+        for layer in self.layers:
+            if not layer.done:
+                layer.advance(tick)
+            if layer.buf is frame_buf:
+                layer.blend(buf, self._base)
+            elif layer.buf is not None:
+                layer.blend(buf, layer.buf)
+        self.frame.buf[:] = buf
+        self.layers = [layer for layer in self.layers if not layer.done]
+
+    def step(self, now=None):
+        """Render and push the current tick; returns seconds until the next one is due."""
+        if now is None:
+            now = self.clock()
+        if self.start is None:
+            self.start = now
+        behind = int((now - self.start) / self.period) - self.tick
+        if behind > 0:
+            self.dropped += behind
+            self.tick += behind
+        self.render(self.tick)
+        if not self.finished:
+            self.push()
+            self.rendered += 1
+        self.tick += 1
+        return max(0.0, self.start + self.tick * self.period - self.clock())
+
+    def run(self, duration=None):
+        """Block until every foreground layer has finished (or duration seconds pass)."""
+        self._running = True
+        self.start = None
+        self.tick = 0
+        self._base = None
+        while self._running and not self.finished:
+            delay = self.step()
+            if duration is not None and self.clock() - self.start >= duration:
+                break
+            self.sleep(delay)
+        self._running = False
+
+    async def run_async(self, duration=None):
+        """run() for an asyncio event loop."""
+        import asyncio  # ~70 ms to import; only callers already on a loop pay for it
+
+        self._running = True
+        self.start = None
+        self.tick = 0
+        self._base = None
+        while self._running and not self.finished:
+            delay = self.step()
+            if duration is not None and self.clock() - self.start >= duration:
+                break
+            await asyncio.sleep(delay)
+        self._running = False
@@ -0,0 +1,252 @@
+# =====================================================================
+#                   Pixelbox - canvasJournal.py
+#   canvasJournal.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Crash-safe drawing persistence: append-only journal, group-commit fsync, snapshots.
+# =====================================================================
+'''
+Code Example Use:
+journal = CanvasJournal(state_dir("touch"), frame)
+color = journal.restore()          # last canvas back in frame.buf
+journal.paint(cells, color)        # after each framebuffer change
+journal.scheduler.poll()           # from the event loop; fsyncs at most every SYNC_MS
+'''
+
+
+import os
+import struct
+import time
+import zlib
+
+from utils.frameScheduler import FrameScheduler
+
+# ----- Files -----
+# <name>.snap:    snapshot of the whole canvas, replaced atomically
+# <name>.journal: operations since that snapshot
+# Both carry the snapshot generation, so a journal left over from a crash
+# between writing a snapshot and resetting the journal is recognised and skipped.
+SNAP_MAGIC    = b"PBXS"
+JOURNAL_MAGIC = b"PBXJ"
+VERSION       = 1
+FILE_HEADER   = struct.Struct("<4sBHHI")  # magic, version, rows, cols, generation
+RECORD        = struct.Struct("<BHI")     # op, payload length, crc32 of payload
+
+# Operations (payload starts with an RGB colour)
+OP_PAINT = 1   # + u16 logical pixel indices
+OP_CLEAR = 2
+OP_COLOR = 3   # selected drawing colour
+
+SYNC_MS       = 250         # group commit: at most one fsync per interval
+COMPACT_BYTES = 64 * 1024   # snapshot once the journal grows past this
+
+
+def _fsync_dir(path):
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# ----- Journal -----
+class CanvasJournal:
+    """Logs paint/clear/colour operations on a Framebuffer so the canvas survives power loss.
+
+    Operations are buffered in memory and written with one write+fsync per
+    group commit, paced by a FrameScheduler at no more than one per
+    sync_ms. When the journal outgrows compact_bytes the canvas is written
+    as a snapshot (temp file, fsync, rename) and the journal starts over,
+    so restore() only ever loads one snapshot and a short journal tail.
+    Records carry a CRC; a torn record at the end is dropped on restore.
+    """
+
+    enabled = True
+
+    def __init__(self, path_prefix, frame, sync_ms=SYNC_MS, compact_bytes=COMPACT_BYTES,
+                 clock=time.monotonic, on_pending=None):
+        self.snap_path = path_prefix + ".snap"
+        self.journal_path = path_prefix + ".journal"
+        self.frame = frame
+        self.compact_bytes = compact_bytes
+        self.color = None
+        self.generation = 0
+        self.journal_size = 0
+        self._pending = bytearray()
+        self._fd = None
+        self.scheduler = FrameScheduler(self.sync, max_fps=1000.0 / sync_ms,
+                                        clock=clock, on_dirty=on_pending)
+
+    # -- logging --
+    def _append(self, op, payload):
+        if self._fd is None:
+            return  # not restored yet, or closed
+        self._pending += RECORD.pack(op, len(payload), zlib.crc32(payload))
+        self._pending += payload
+        self.scheduler.mark_dirty()
+
+    def paint(self, cells, color):
+        cols = self.frame.cols
+        self.paint_indices([row * cols + col for row, col in cells], color)
+
+    def paint_indices(self, indices, color):
+        """Log logical pixel indices set to color (e.g. from Framebuffer.set_physical)."""
+        if indices:
+            self._append(OP_PAINT, bytes(color) + struct.pack(f"<{len(indices)}H", *indices))
+
+    def clear(self, color=(0, 0, 0)):
+        self._append(OP_CLEAR, bytes(color))
+
+    def set_color(self, color):
+        self.color = tuple(color)
+        self._append(OP_COLOR, bytes(color))
+
+    # -- group commit --
+    def sync(self):
+        """Write and fsync everything logged so far; compact if the journal is long."""
+        if self._fd is None or not self._pending:
+            return
+        os.write(self._fd, self._pending)
+        os.fsync(self._fd)
+        self.journal_size += len(self._pending)
+        self._pending.clear()
+        if self.journal_size > self.compact_bytes:
+            self.snapshot()
+
+    def close(self):
+        """Sync and stop logging (later operations, like clearing the LEDs on exit, are not saved)."""
+        if self._fd is None:
+            return
+        self.scheduler.flush()
+        os.close(self._fd)
+        self._fd = None
+
+    # -- snapshots --
+    def snapshot(self):
+        """Write the whole canvas as a new snapshot and start an empty journal."""
+        self.generation += 1
+        color = bytes(self.color) if self.color is not None else b""
+        body = bytes([len(color)]) + color + bytes(self.frame.buf)
+        tmp = self.snap_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._file_header(SNAP_MAGIC) + body + struct.pack("<I", zlib.crc32(body)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snap_path)
+        _fsync_dir(self.snap_path)  # the new snapshot must be durable before the journal resets
+        self._open_journal(truncate=True)
+
+    def _file_header(self, magic):
+        return FILE_HEADER.pack(magic, VERSION, self.frame.rows, self.frame.cols, self.generation)
+
+    def _open_journal(self, truncate):
+        if self._fd is not None:
+            os.close(self._fd)
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if truncate else 0)
+        self._fd = os.open(self.journal_path, flags, 0o644)
+        if truncate:
+            os.write(self._fd, self._file_header(JOURNAL_MAGIC))
+            os.fsync(self._fd)
+            self.journal_size = 0
+        else:
+            os.ftruncate(self._fd, self.journal_size)  # drop a torn tail
+            os.lseek(self._fd, self.journal_size, os.SEEK_SET)
+
+    # -- recovery --
+    def _load_snapshot(self):
+        try:
+            with open(self.snap_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        if len(data) < FILE_HEADER.size + 5:
+            return False
+        magic, version, rows, cols, generation = FILE_HEADER.unpack_from(data, 0)
+        body, crc = data[FILE_HEADER.size:-4], data[-4:]
+        if (magic != SNAP_MAGIC or version != VERSION or (rows, cols) != (self.frame.rows, self.frame.cols)
+                or struct.unpack("<I", crc)[0] != zlib.crc32(body)):
+            return False
+        n = body[0]
+        if len(body) != 1 + n + len(self.frame.buf):
+            return False
+        self.color = tuple(body[1:1 + n]) or None
+        self.frame.buf[:] = body[1 + n:]
+        self.generation = generation
+        return True
+
+    def _replay(self):
+        """Apply the journal tail; returns its valid length in bytes (0 if unusable)."""
+        try:
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        if len(data) < FILE_HEADER.size:
+            return 0
+        magic, version, rows, cols, generation = FILE_HEADER.unpack_from(data, 0)
+        if (magic != JOURNAL_MAGIC or version != VERSION or generation != self.generation
+                or (rows, cols) != (self.frame.rows, self.frame.cols)):
+            return 0
+
+        frame = self.frame
+        pos = FILE_HEADER.size
+        while pos + RECORD.size <= len(data):
+            op, length, crc = RECORD.unpack_from(data, pos)
+            start = pos + RECORD.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break  # torn write at power loss
+            color = payload[:3]
+            if op == OP_PAINT:
+                buf = frame.buf
+                for i in struct.unpack(f"<{(length - 3) // 2}H", payload[3:]):
+                    buf[i * 3:i * 3 + 3] = color
+            elif op == OP_CLEAR:
+                frame.fill(color)
+            elif op == OP_COLOR:
+                self.color = tuple(color)
+            pos = start + length
+        return pos
+
+    def restore(self):
+        """Load the latest snapshot and journal tail into the framebuffer, then start logging.
+
+        Returns the saved drawing colour, or None if none was saved.
+        """
+        os.makedirs(os.path.dirname(self.snap_path) or ".", exist_ok=True)
+        if not self._load_snapshot():
+            self.frame.fill()
+            self.generation = 0
+        self.journal_size = self._replay()
+        self._open_journal(truncate=self.journal_size == 0)
+        return self.color
+
+
+class NullJournal:
+    """Persistence switched off: every call is a no-op."""
+
+    enabled = False
+
+    def paint(self, cells, color):
+        pass
+
+    def paint_indices(self, indices, color):
+        pass
+
+    def clear(self, color=(0, 0, 0)):
+        pass
+
+    def set_color(self, color):
+        pass
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+    def restore(self):
+        return None
@@ -0,0 +1,146 @@
+# =====================================================================
+#                   Pixelbox - fakeInput.py
+#   fakeInput.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Fake evdev InputDevice that replays events, for running headless.
+# =====================================================================
+
+
+from evdev import AbsInfo, ecodes
+
+RAW_SIZE = (1024, 768)  # raw position range reported by the fake panel (the overlay's nominal px)
+
+
+class FakeEvent:
+    """Minimal evdev.InputEvent look-alike."""
+
+    __slots__ = ("sec", "usec", "type", "code", "value")
+
+    def __init__(self, sec, usec, type, code, value):
+        self.sec = sec
+        self.usec = usec
+        self.type = type
+        self.code = code
+        self.value = value
+
+    def timestamp(self):
+        return self.sec + self.usec / 1000000.0
+
+    def __repr__(self):
+        return f"FakeEvent({self.timestamp():.6f}, type={self.type}, code={self.code}, value={self.value})"
+
+
+def make_event(t, type, code, value):
+    """Build an event stamped at t seconds."""
+    sec = int(t)
+    return FakeEvent(sec, int(round((t - sec) * 1000000)), type, code, value)
+
+def touch_events(points, start=0.0, interval=0.008):
+    """Events for one finger touching down, moving through raw (x, y) points and lifting."""
+    events = []
+    t = start
+    for i, (x, y) in enumerate(points):
+        if i == 0:
+            events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_TRACKING_ID, 1))
+            events.append(make_event(t, ecodes.EV_KEY, ecodes.BTN_TOUCH, 1))
+        events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_POSITION_X, x))
+        events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_POSITION_Y, y))
+        events.append(make_event(t, ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+        t += interval
+    events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_TRACKING_ID, -1))
+    events.append(make_event(t, ecodes.EV_KEY, ecodes.BTN_TOUCH, 0))
+    events.append(make_event(t, ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+    return events
+
+def multitouch_events(strokes, start=0.0, interval=0.008):
+    """Events for several fingers drawing at once (multi-touch protocol B).
+
+    strokes is a list of raw (x, y) point lists, one per finger; finger i uses
+    slot i and all fingers touch down together and lift when their points run out.
+    """
+    events = []
+    t = start
+    for step in range(max(len(points) for points in strokes) + 1):
+        for slot, points in enumerate(strokes):
+            if step > len(points):
+                continue
+            events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_SLOT, slot))
+            if step == len(points):
+                events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_TRACKING_ID, -1))
+                continue
+            if step == 0:
+                events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_TRACKING_ID, 100 + slot))
+            x, y = points[step]
+            events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_POSITION_X, x))
+            events.append(make_event(t, ecodes.EV_ABS, ecodes.ABS_MT_POSITION_Y, y))
+        if step == 0:
+            events.append(make_event(t, ecodes.EV_KEY, ecodes.BTN_TOUCH, 1))
+        if step == max(len(points) for points in strokes):
+            events.append(make_event(t, ecodes.EV_KEY, ecodes.BTN_TOUCH, 0))
+        events.append(make_event(t, ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+        t += interval
+    return events
+
+
+class FakeInputDevice:
+    """Stand-in for evdev.InputDevice that replays a list of events.
+
+    delay is the pause before each async event (0 replays as fast as the
+    event loop allows). The async reader ends when the events run out.
+    """
+
+    def __init__(self, events, name="Fake touchscreen", delay=0.0, raw_size=RAW_SIZE, slots=10):
+        self.name = name
+        self.path = "fake"
+        self.events = list(events)
+        self.delay = delay
+        self.raw_size = raw_size
+        self.slots = slots
+        self._pos = 0
+
+    def capabilities(self, verbose=False, absinfo=True):
+        """Same shape as evdev's: {EV_ABS: [(code, AbsInfo), ...]}, plain codes with absinfo=False."""
+        width, height = self.raw_size
+        axes = [
+            (ecodes.ABS_MT_SLOT, AbsInfo(0, 0, self.slots - 1, 0, 0, 0)),
+            (ecodes.ABS_MT_POSITION_X, AbsInfo(0, 0, width - 1, 0, 0, 0)),
+            (ecodes.ABS_MT_POSITION_Y, AbsInfo(0, 0, height - 1, 0, 0, 0)),
+            (ecodes.ABS_MT_TRACKING_ID, AbsInfo(0, 0, 65535, 0, 0, 0)),
+        ]
+        if verbose:
+            axes = [((ecodes.ABS[code], code), info) for code, info in axes]
+        if not absinfo:
+            axes = [code for code, _ in axes]
+        key = (ecodes.EV[ecodes.EV_ABS], ecodes.EV_ABS) if verbose else ecodes.EV_ABS
+        return {key: axes}
+
+    def read_one(self):
+        if self._pos >= len(self.events):
+            return None
+        self._pos += 1
+        return self.events[self._pos - 1]
+
+    def read_loop(self):
+        while True:
+            event = self.read_one()
+            if event is None:
+                return
+            yield event
+
+    async def async_read_loop(self):
+        import asyncio  # ~60 ms to import; only callers already on a loop pay for it
+
+        while True:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            event = self.read_one()
+            if event is None:
+                return
+            yield event
+
+    def close(self):
+        pass
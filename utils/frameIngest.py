@@ -0,0 +1,234 @@
+# =====================================================================
+#                   Pixelbox - frameIngest.py
+#   frameIngest.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Network frame input (raw UDP, TCP stream, E1.31/sACN) into a latest-frame-wins slot.
+# =====================================================================
+'''
+Code Example Use:
+stats = IngestStats()
+latest = LatestFrame(stats, on_frame=scheduler.mark_dirty)
+udp = UdpIngest(udp_socket("127.0.0.1", UDP_PORT), raw_decoder(768), latest, stats)
+udp.start(asyncio.get_running_loop())
+data = latest.take()      # newest complete frame, or None
+'''
+
+
+import asyncio
+import socket
+import struct
+
+# ----- Ports -----
+UDP_PORT  = 7890   # one datagram = one raw frame (rows x cols x RGB, row-major)
+TCP_PORT  = 7890   # stream of raw frames back to back
+SACN_PORT = 5568   # E1.31 (ANSI E1.31-2018)
+
+# ----- E1.31 Layout -----
+ACN_ID             = b"ASC-E1.17\x00\x00\x00"
+VECTOR_ROOT_DATA   = 0x00000004
+VECTOR_FRAMING     = 0x00000002
+VECTOR_DMP_SET     = 0x02
+SACN_HEADER        = 126          # bytes before the first DMX slot
+PIXELS_PER_UNIVERSE = 170         # 510 of the 512 slots, whole RGB pixels only
+OPTION_TERMINATED  = 0x40
+
+
+class IngestStats:
+    """Frame counters: received (complete frames), dropped (replaced before they
+    were shown), displayed, and invalid (packets that were not a frame)."""
+
+    def __init__(self):
+        self.received = 0
+        self.dropped = 0
+        self.displayed = 0
+        self.invalid = 0
+
+    def line(self):
+        return (f"received {self.received}  displayed {self.displayed}  "
+                f"dropped {self.dropped}  invalid {self.invalid}")
+
+
+class LatestFrame:
+    """Single-slot buffer between the network and the LEDs.
+
+    put() replaces any frame that has not been taken yet (counted as
+    dropped), so a sender faster than the strip never builds a backlog and
+    the LEDs always show the newest frame. on_frame is called on every put,
+    e.g. FrameScheduler.mark_dirty.
+    """
+
+    def __init__(self, stats, on_frame=None):
+        self.stats = stats
+        self.on_frame = on_frame
+        self.pending = None
+
+    def put(self, data):
+        if self.pending is not None:
+            self.stats.dropped += 1
+        self.pending = data
+        self.stats.received += 1
+        if self.on_frame is not None:
+            self.on_frame()
+
+    def take(self):
+        data, self.pending = self.pending, None
+        return data
+
+
+# ----- Decoders (packet -> frame bytes, None if incomplete, ValueError if invalid) -----
+def raw_decoder(frame_size):
+    def decode(packet):
+        if len(packet) != frame_size:
+            raise ValueError(f"expected {frame_size} bytes, got {len(packet)}")
+        return bytes(packet)
+    return decode
+
+
+def parse_sacn(packet):
+    """(universe, sequence, options, slots) of an E1.31 data packet; ValueError otherwise."""
+    if len(packet) < SACN_HEADER or packet[4:16] != ACN_ID:
+        raise ValueError("not an E1.31 packet")
+    root_vector, = struct.unpack_from(">I", packet, 18)
+    framing_vector, = struct.unpack_from(">I", packet, 40)
+    if root_vector != VECTOR_ROOT_DATA or framing_vector != VECTOR_FRAMING:
+        raise ValueError("not an E1.31 data packet")  # e.g. sync or discovery
+    sequence, options, universe = struct.unpack_from(">BBH", packet, 111)
+    if packet[117] != VECTOR_DMP_SET or packet[125] != 0:
+        raise ValueError("not DMX512 level data")
+    count, = struct.unpack_from(">H", packet, 123)
+    return universe, sequence, options, packet[SACN_HEADER:SACN_HEADER + count - 1]
+
+
+def sacn_packet(universe, sequence, slots, source="Pixelbox", priority=100, cid=b"pixelbox-sender!"):
+    """Build an E1.31 data packet (used by sendFrames.py)."""
+    n = len(slots)
+    out = bytearray(SACN_HEADER + n)
+    struct.pack_into(">HH12sHI16s", out, 0, 0x0010, 0, ACN_ID,
+                     0x7000 | (len(out) - 16), VECTOR_ROOT_DATA, cid[:16].ljust(16, b"\0"))
+    struct.pack_into(">HI64sBHBBH", out, 38, 0x7000 | (len(out) - 38), VECTOR_FRAMING,
+                     source.encode()[:63], priority, 0, sequence & 0xFF, 0, universe)
+    struct.pack_into(">HBBHHHB", out, 115, 0x7000 | (len(out) - 115), VECTOR_DMP_SET,
+                     0xA1, 0, 1, n + 1, 0)
+    out[SACN_HEADER:] = slots
+    return bytes(out)
+
+
+def universes_for(num_pixels):
+    return -(-num_pixels // PIXELS_PER_UNIVERSE)
+
+def multicast_group(universe):
+    return f"239.255.{universe >> 8}.{universe & 0xFF}"
+
+
+class SacnAssembler:
+    """Joins the universes of one frame (170 pixels each, starting at `universe`).
+
+    A frame is complete once every universe has been updated since the last
+    one; packets older than a universe's last sequence number (within the
+    E1.31 window of 20) are discarded as reordered.
+    """
+
+    def __init__(self, universe, num_pixels):
+        self.first = universe
+        self.count = universes_for(num_pixels)
+        self.buf = bytearray(num_pixels * 3)
+        self.sequence = [None] * self.count
+        self.seen = 0
+        self.full = (1 << self.count) - 1
+
+    def __call__(self, packet):
+        universe, sequence, options, slots = parse_sacn(packet)
+        k = universe - self.first
+        if not 0 <= k < self.count:
+            return None  # someone else's universe
+        last = self.sequence[k]
+        if last is not None and -20 < ((sequence - last + 128) % 256) - 128 <= 0:
+            return None
+        self.sequence[k] = sequence
+        if options & OPTION_TERMINATED:
+            return None
+        start = k * PIXELS_PER_UNIVERSE * 3
+        end = min(start + PIXELS_PER_UNIVERSE * 3, len(self.buf))
+        slots = slots[:end - start]
+        self.buf[start:start + len(slots)] = slots
+        self.seen |= 1 << k
+        if self.seen != self.full:
+            return None
+        self.seen = 0
+        return bytes(self.buf)
+
+
+# ----- Transports -----
+class UdpIngest:
+    """Decodes datagrams and puts complete frames in the LatestFrame slot.
+
+    Each time the socket becomes readable every queued datagram is read
+    (asyncio's datagram transport reads one per loop pass), so frames that
+    queued up during a show() are skipped over rather than shown late.
+    """
+
+    def __init__(self, sock, decode, latest, stats):
+        self.sock = sock
+        self.decode = decode
+        self.latest = latest
+        self.stats = stats
+        self._loop = None
+
+    def start(self, loop):
+        self._loop = loop
+        loop.add_reader(self.sock.fileno(), self._drain)
+
+    def _drain(self):
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            try:
+                frame = self.decode(data)
+            except ValueError:
+                self.stats.invalid += 1
+                continue
+            if frame is not None:
+                self.latest.put(frame)
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.remove_reader(self.sock.fileno())
+        self.sock.close()
+
+
+def tcp_handler(frame_size, latest):
+    """asyncio.start_server callback reading back-to-back raw frames from one client."""
+    async def handle(reader, writer):
+        try:
+            while True:
+                latest.put(await reader.readexactly(frame_size))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    return handle
+
+
+def udp_socket(host, port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.setblocking(False)
+    return sock
+
+def sacn_socket(host, universes):
+    """UDP socket on the E1.31 port, joined to each universe's multicast group when possible."""
+    sock = udp_socket(host, SACN_PORT)
+    for universe in universes:
+        mreq = socket.inet_aton(multicast_group(universe)) + socket.inet_aton("0.0.0.0")
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        except OSError:
+            break  # no multicast route (e.g. loopback only): unicast still arrives
+    return sock
@@ -0,0 +1,91 @@
+# =====================================================================
+#                   Pixelbox - frameScheduler.py
+#   frameScheduler.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Rate-capped scheduler that coalesces pixel writes into one show() per tick.
+# =====================================================================
+
+
+import time
+
+# One 16x16 WS2812 frame is 256 * 24 bits at 800 kHz ~= 7.7 ms on the wire
+DEFAULT_MAX_FPS = 100
+
+
+class FrameScheduler:
+    """Collects framebuffer changes behind a dirty flag and flushes at a capped rate.
+
+    A change marked at any time is flushed no later than one period after the
+    previous flush, so a lone tap after an idle spell lights immediately and a
+    burst of changes costs one push per tick. on_dirty, if set, is called when
+    the frame goes from clean to dirty so an event loop can wake its render task.
+    """
+
+    def __init__(self, flush, max_fps=DEFAULT_MAX_FPS, clock=time.monotonic, on_dirty=None):
+        self._flush = flush
+        self.on_dirty = on_dirty
+        self.period = 1.0 / max_fps
+        self.clock = clock
+        self.dirty = False
+        self.last_flush = float("-inf")
+        self.flushes = 0
+
+    def mark_dirty(self):
+        if not self.dirty and self.on_dirty is not None:
+            self.on_dirty()
+        self.dirty = True
+
+    def due_in(self, now=None):
+        """Seconds until a pending frame may be flushed, or None if nothing is pending."""
+        if not self.dirty:
+            return None
+        if now is None:
+            now = self.clock()
+        return max(0.0, self.last_flush + self.period - now)
+
+    def poll(self, now=None):
+        """Flush if a frame is pending and the rate cap allows it. Returns True if flushed."""
+        if not self.dirty:
+            return False
+        if now is None:
+            now = self.clock()
+        if now - self.last_flush < self.period:
+            return False
+        self.flush(now)
+        return True
+
+    def flush(self, now=None):
+        """Push the current frame right away, ignoring the rate cap."""
+        self.dirty = False
+        self.last_flush = self.clock() if now is None else now
+        self.flushes += 1
+        self._flush()
+
+
+async def render_loop(scheduler):
+    """Asyncio task flushing scheduler whenever it is dirty, at most once per period.
+
+    Sleeps on an event (wired to scheduler.on_dirty while the task runs)
+    when nothing is pending, so an idle loop costs no wakeups.
+    """
+    import asyncio  # ~70 ms to import; only callers already on a loop pay for it
+
+    dirty = asyncio.Event()
+    previous, scheduler.on_dirty = scheduler.on_dirty, dirty.set
+    try:
+        while True:
+            delay = scheduler.due_in()
+            if delay is None:
+                # Nothing to draw; sleep until something marks the frame dirty
+                await dirty.wait()
+                dirty.clear()
+                continue
+            if delay > 0:
+                await asyncio.sleep(delay)
+            scheduler.poll()
+    finally:
+        scheduler.on_dirty = previous
@@ -0,0 +1,232 @@
+# =====================================================================
+#                   Pixelbox - glyphAtlas.py
+#   glyphAtlas.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Bit-packed glyph atlas and column blitter for scrolling text.
+# =====================================================================
+'''
+Code Example Use:
+font = compile_font("5x7", FONT_5x7)
+strip, width = render_text(font, "Hello", [(255, 0, 0)], rows=16, pad=16)
+python3 -m utils.glyphAtlas       (checks the negative-kerning path)
+
+Cost: a strip is one join of cached glyph blocks, but the per-character
+Python loop remains. 2,240 characters take about 2-4 ms on a desktop x86
+(roughly ten times that on a Pi Zero 2 W); a 30-character message about
+50 us. Long texts are not rendered in microseconds: callers cache whole
+strips (scrollingText.render_strip) or render ahead of display (ticker).
+'''
+
+
+from functools import lru_cache
+
+BLACK = (0, 0, 0)
+
+
+# ----- Font -----
+class Font:
+    """Compiled glyph atlas: one integer bitmask per glyph column (bit 0 = top row).
+
+    glyphs maps each character to a tuple of column masks, so glyphs may have
+    any width (proportional fonts) and any height (up to the mask size).
+    kerning maps (left, right) character pairs to an extra advance in pixels,
+    negative to tuck glyphs together.
+    """
+
+    def __init__(self, name, height, glyphs, spacing=1, kerning=None, default=" "):
+        self.name = name
+        self.height = height
+        self.glyphs = glyphs
+        self.spacing = spacing
+        self.kerning = kerning or {}
+        self.default = default
+
+    def __repr__(self):
+        return f"Font({self.name!r}, height={self.height}, glyphs={len(self.glyphs)})"
+
+    def layout(self, text):
+        """Place each character: returns ([(char, x), ...], total width in columns).
+
+        Negative kerning never moves a glyph left of column 0, and the width
+        is the furthest column any glyph reaches, not where the cursor ends.
+        """
+        glyphs = self.glyphs
+        kerning = self.kerning
+        placed = []
+        x = 0
+        width = 0
+        prev = None
+        for ch in text:
+            if ch not in glyphs:
+                ch = self.default
+            if prev is not None:
+                x = max(0, x + self.spacing + kerning.get((prev, ch), 0))
+            placed.append((ch, x))
+            x += len(glyphs[ch])
+            width = max(width, x)
+            prev = ch
+        return placed, width
+
+
+# ----- Atlas Builders -----
+def compile_font(name, rows_font, spacing=1, proportional=False, space_width=3, kerning=None):
+    """Compile a {"A": ["01110", ...]} row font into a column-mask Font.
+
+    With proportional=True blank columns are trimmed from both sides of every
+    glyph and the space becomes space_width columns wide.
+    """
+    height = len(next(iter(rows_font.values())))
+    glyphs = {}
+    for char, rows in rows_font.items():
+        width = len(rows[0])
+        columns = [0] * width
+        for r, row in enumerate(rows):
+            for c, bit in enumerate(row):
+                if bit == "1":
+                    columns[c] |= 1 << r
+        if proportional:
+            if any(columns):
+                while columns[0] == 0:
+                    columns.pop(0)
+                while columns[-1] == 0:
+                    columns.pop()
+            else:
+                columns = [0] * space_width
+        glyphs[char] = tuple(columns)
+    return Font(name, height, glyphs, spacing, kerning)
+
+def scale_font(font, sx=1, sy=1, name=None):
+    """Return a copy of font scaled by whole pixels (e.g. sy=2 for a double-height font)."""
+    def stretch(mask):
+        out = 0
+        for r in range(font.height):
+            if mask >> r & 1:
+                out |= ((1 << sy) - 1) << (r * sy)
+        return out
+
+    glyphs = {
+        char: tuple(stretch(m) for m in columns for _ in range(sx))
+        for char, columns in font.glyphs.items()
+    }
+    kerning = {pair: adj * sx for pair, adj in font.kerning.items()}
+    return Font(name or f"{font.name}@{sx}x{sy}", font.height * sy, glyphs,
+                font.spacing * sx, kerning, font.default)
+
+
+# ----- Column Blitter -----
+LIT = b"\x01\x02\x03"  # template pixel, recoloured by translate()
+
+@lru_cache(maxsize=1024)
+def _glyph_template(font, char, rows, offset):
+    """Column-major bytes of one glyph shifted down by offset rows, lit pixels as LIT."""
+    visible = (1 << rows) - 1
+    off = bytes(BLACK)
+    out = []
+    for mask in font.glyphs[char]:
+        mask = (mask << offset if offset >= 0 else mask >> -offset) & visible
+        out.extend(LIT if mask >> r & 1 else off for r in range(rows))
+    return b"".join(out)
+
+@lru_cache(maxsize=256)
+def _color_table(color):
+    """translate() table turning LIT into color and leaving black alone."""
+    r, g, b = color
+    return bytes((0, r, g, b)) + bytes(252)
+
+@lru_cache(maxsize=4096)
+def _glyph_block(font, char, rows, offset, color):
+    """A glyph template coloured in: the unit render_text joins together."""
+    return _glyph_template(font, char, rows, offset).translate(_color_table(color))
+
+@lru_cache(maxsize=64)
+def _blank(size):
+    return bytes(size)
+
+def _overlay(under, over):
+    """Overlay one run of pixels on another; lit pixels of `over` win."""
+    out = bytearray(under)
+    off = bytes(BLACK)
+    for i in range(0, len(over), 3):
+        if over[i:i + 3] != off:
+            out[i:i + 3] = over[i:i + 3]
+    return out
+
+LAYOUT_CACHE_SIZE = 64  # (font, text) placements, reused when only the colours change
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _layout(font, text):
+    return font.layout(text)
+
+def render_text(font, text, colors, rows, offset=None, pad=0):
+    """Blit text into a column-major RGB strip.
+
+    Every column is `rows` pixels of 3 bytes, so a window of N columns is one
+    contiguous slice. colors holds one RGB tuple per character (the last one
+    is reused when short). offset shifts glyphs down; None centres the font.
+    pad adds blank columns on both sides. Returns (strip bytes, width).
+    Raises ValueError if colors is empty and there is text to colour.
+
+    The strip is one join of cached per-(glyph, colour) blocks and blank
+    gaps; only kerning that pulls glyphs into each other takes the slower
+    overlap path.
+    """
+    if offset is None:
+        offset = (rows - font.height) // 2
+    placed, text_width = _layout(font, text)
+    if placed and not colors:
+        raise ValueError("colors needs at least one RGB tuple")
+
+    col_bytes = rows * 3
+    width = text_width + 2 * pad
+    colors = [c if type(c) is tuple else tuple(c) for c in colors]  # hashable block keys
+    last = len(colors) - 1
+    pieces = [_blank(pad * col_bytes)]
+    blocks = {}  # (char, colour) -> block for this call, in front of the shared cache
+    end = 0  # first text column not yet written
+    for i, (char, x) in enumerate(placed):
+        color = colors[i] if i < last else colors[last]
+        block = blocks.get((char, color))
+        if block is None:
+            block = blocks[char, color] = _glyph_block(font, char, rows, offset, color)
+        if x >= end:
+            if x > end:
+                pieces.append(_blank((x - end) * col_bytes))
+            pieces.append(block)
+        else:
+            # Negative kerning past the spacing: merge the overlapping columns
+            out = bytearray(b"".join(pieces))
+            start = (pad + x) * col_bytes
+            overlap = min(len(out) - start, len(block))
+            out[start:start + overlap] = _overlay(out[start:start + overlap], block[:overlap])
+            pieces = [out, block[overlap:]]
+        end = max(end, x + len(block) // col_bytes)
+    pieces.append(_blank(pad * col_bytes))
+    return b"".join(pieces), width
+
+
+# ----- Self Check -----
+def check_kerning():
+    """Render pathological kerning and check the strip matches the reported width."""
+    rows_font = {"A": ["111", "101", "111"], "i": ["1", "1", "1"], " ": ["0", "0", "0"]}
+    kerning = {("A", "i"): -3, ("i", "A"): -9, ("A", "A"): -6, ("i", "i"): -1}
+    font = compile_font("kern-check", rows_font, kerning=kerning)
+    for text in ("Ai", "iA", "AiA", "AAA", "AiiiA", "iAi A"):
+        placed, width = font.layout(text)
+        assert all(x >= 0 for _, x in placed), (text, placed)
+        assert width == max(x + len(font.glyphs[ch]) for ch, x in placed), (text, placed, width)
+        for pad in (0, 2):
+            strip, strip_width = render_text(font, text, [(255, 0, 0)], rows=3, pad=pad)
+            assert strip_width == width + 2 * pad, (text, strip_width)
+            assert len(strip) == strip_width * 3 * 3, (text, len(strip), strip_width)
+    # A glyph kerned entirely inside a wider one keeps its columns
+    strip, width = render_text(font, "Ai", [(255, 0, 0), (0, 0, 255)], rows=3)
+    assert width == 3 and strip[9:12] == bytes((0, 0, 255)), (width, strip[9:18])
+    print("glyphAtlas kerning check passed")
+
+
+if __name__ == "__main__":
+    check_kerning()
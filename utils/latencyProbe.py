@@ -0,0 +1,205 @@
+# =====================================================================
+#                   Pixelbox - latencyProbe.py
+#   latencyProbe.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Optional touch-to-photon latency instrumentation with per-stage histograms.
+# =====================================================================
+'''
+Enable with PIXELBOX_LATENCY=1. Send SIGUSR1 to print p50/p95/p99 per stage
+(or write them to PIXELBOX_LATENCY_FILE when set):
+kill -USR1 <pid>
+'''
+
+
+import os
+import signal
+import sys
+import time
+from array import array
+
+# Per-frame fields kept in the ring buffer (times in seconds)
+#   read:  kernel event timestamp -> SYN handled in Python
+#   map:   raw coordinates -> grid cells (mapping + stroke)
+#   paint: framebuffer writes
+#   wait:  waiting for the frame scheduler's next tick
+#   show:  index map + pixels.show()
+#   total: kernel event timestamp -> show() returned (touch-to-photon)
+STAGES = ("read", "map", "paint", "wait", "show", "total")
+FIELDS = ("event_time",) + STAGES
+
+RING_SIZE = 4096
+
+
+# ----- Histogram -----
+class Histogram:
+    """HDR-style log-linear histogram of microsecond values (~6% precision, fixed size)."""
+
+    SUB = 16        # linear sub-buckets per power of two
+    BUCKETS = 512   # covers far beyond 10 s
+
+    def __init__(self):
+        self.counts = array("L", bytes(array("L").itemsize * self.BUCKETS))
+        self.count = 0
+        self.max = 0
+
+    @classmethod
+    def _index(cls, v):
+        if v < 2 * cls.SUB:
+            return v
+        shift = v.bit_length() - 5  # keep the top 5 bits (16..31)
+        return min(2 * cls.SUB + (shift - 1) * cls.SUB + (v >> shift) - cls.SUB, cls.BUCKETS - 1)
+
+    @classmethod
+    def _value(cls, index):
+        """Midpoint of a bucket."""
+        if index < 2 * cls.SUB:
+            return index
+        shift = (index - 2 * cls.SUB) // cls.SUB + 1
+        low = ((index - 2 * cls.SUB) % cls.SUB + cls.SUB) << shift
+        return low + (1 << shift) // 2
+
+    def record(self, seconds):
+        us = max(0, int(seconds * 1000000))
+        self.counts[self._index(us)] += 1
+        self.count += 1
+        if us > self.max:
+            self.max = us
+
+    def percentile(self, p):
+        """Value in microseconds at percentile p (0-100)."""
+        if not self.count:
+            return 0
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(self._value(index), self.max)
+        return self.max
+
+
+# ----- Probes -----
+class LatencyProbe:
+    """Stamps touch frames through each pipeline stage.
+
+    Call frame() when a SYN frame starts, mark() after each stage, painted()
+    once the framebuffer holds it, and pushed() around every show(). Frames
+    waiting for a push are all closed by that push.
+    """
+
+    enabled = True
+
+    def __init__(self, ring_size=RING_SIZE, clock=time.time):
+        self.clock = clock  # evdev timestamps are CLOCK_REALTIME
+        self.histograms = {stage: Histogram() for stage in STAGES}
+        self.ring = array("d", bytes(8 * ring_size * len(FIELDS)))
+        self.ring_size = ring_size
+        self.frames = 0
+        self._current = None
+        self._last = 0.0
+        self._pending = []
+
+    def frame(self, event_time):
+        now = self.clock()
+        self._current = {"event_time": event_time, "read": now - event_time}
+        self._last = now
+
+    def mark(self, stage):
+        if self._current is None:
+            return
+        now = self.clock()
+        self._current[stage] = now - self._last
+        self._last = now
+
+    def painted(self):
+        if self._current is not None:
+            self._current["_painted"] = self._last
+            self._pending.append(self._current)
+            self._current = None
+
+    def pushed(self, start, end):
+        """Close every painted frame with a push that ran from start to end."""
+        for rec in self._pending:
+            rec["wait"] = start - rec.pop("_painted")
+            rec["show"] = end - start
+            rec["total"] = end - rec["event_time"]
+            self._store(rec)
+        self._pending.clear()
+
+    def _store(self, rec):
+        for stage in STAGES:
+            self.histograms[stage].record(rec.get(stage, 0.0))
+        base = (self.frames % self.ring_size) * len(FIELDS)
+        for i, field in enumerate(FIELDS):
+            self.ring[base + i] = rec.get(field, 0.0)
+        self.frames += 1
+
+    def recent(self):
+        """Ring buffer contents, oldest first, as dicts of FIELDS."""
+        n = min(self.frames, self.ring_size)
+        out = []
+        for k in range(self.frames - n, self.frames):
+            base = (k % self.ring_size) * len(FIELDS)
+            out.append(dict(zip(FIELDS, self.ring[base:base + len(FIELDS)])))
+        return out
+
+    def report(self):
+        lines = [f"touch-to-photon latency, {self.frames} frames (microseconds)",
+                 f"{'stage':<8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"]
+        for stage in STAGES:
+            h = self.histograms[stage]
+            lines.append(f"{stage:<8} {h.percentile(50):>8} {h.percentile(95):>8} "
+                         f"{h.percentile(99):>8} {h.max:>8}")
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        """Write report() to path (appending), or stdout when None."""
+        if path:
+            with open(path, "a") as f:
+                f.write(self.report() + "\n\n")
+        else:
+            print(self.report(), file=sys.stdout, flush=True)
+
+    def install_signal(self, path=None, signum=signal.SIGUSR1):
+        """Dump the report whenever signum arrives."""
+        signal.signal(signum, lambda _sig, _frame: self.dump(path))
+
+
+class NullProbe:
+    """Disabled probe: every call is a no-op."""
+
+    enabled = False
+
+    def frame(self, event_time):
+        pass
+
+    def mark(self, stage):
+        pass
+
+    def painted(self):
+        pass
+
+    def pushed(self, start, end):
+        pass
+
+    def report(self):
+        return "latency instrumentation disabled (set PIXELBOX_LATENCY=1)"
+
+    def dump(self, path=None):
+        pass
+
+    def install_signal(self, path=None, signum=signal.SIGUSR1):
+        pass
+
+
+def probe_from_env():
+    """LatencyProbe when PIXELBOX_LATENCY=1 (SIGUSR1 dumps the report), else a NullProbe."""
+    if os.environ.get("PIXELBOX_LATENCY") != "1":
+        return NullProbe()
+    probe = LatencyProbe()
+    probe.install_signal(os.environ.get("PIXELBOX_LATENCY_FILE"))
+    return probe
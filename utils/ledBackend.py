@@ -0,0 +1,208 @@
+# =====================================================================
+#                   Pixelbox - ledBackend.py
+#   ledBackend.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Pluggable LED output: real NeoPixel strip or a simulated WS2812 strip.
+# =====================================================================
+
+
+import os
+import time
+from collections import deque
+
+# Select with PIXELBOX_BACKEND=sim to run without the Pi hardware
+BACKEND = os.environ.get("PIXELBOX_BACKEND", "neopixel")
+
+# ----- WS2812 Timing Model -----
+WS2812_HZ      = 800000   # data rate, bits per second
+BITS_PER_PIXEL = 24
+RESET_SECONDS  = 280e-6   # latch low time (WS2812B rev.5; older parts need 50 us)
+
+
+def wire_time(num_pixels):
+    """Seconds one show() of num_pixels keeps the data line busy."""
+    return num_pixels * BITS_PER_PIXEL / WS2812_HZ + RESET_SECONDS
+
+def max_refresh_hz(num_pixels):
+    """Theoretical refresh ceiling of a single strip."""
+    return 1.0 / wire_time(num_pixels)
+
+
+# ----- Simulated Strip -----
+class SimulatedStrip:
+    """Stand-in for neopixel.NeoPixel that records frames instead of driving GPIO.
+
+    Pixel writes follow the NeoPixel API (tuples or 0xRRGGBB ints, slices,
+    fill, brightness). show() counts calls, bytes pushed and modelled wire
+    time; with realtime=True it also sleeps for that wire time. The last
+    `record` frames are kept as wire-order bytes in `frames`.
+    """
+
+    def __init__(self, num_pixels, brightness=1.0, auto_write=False,
+                 pixel_order="GRB", record=0, realtime=False):
+        self.n = num_pixels
+        self.auto_write = auto_write
+        self.byteorder = pixel_order
+        self._offsets = tuple(pixel_order.index(ch) for ch in "RGB")
+        self._colors = [(0, 0, 0)] * num_pixels
+        self.buf = bytearray(num_pixels * 3)
+        self._brightness = 1.0
+        self.brightness = brightness
+        self.realtime = realtime
+        self.frames = deque(maxlen=record) if record else None
+
+        # Counters
+        self.shows = 0
+        self.bytes_pushed = 0
+        self.wire_seconds = 0.0
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def brightness(self):
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value):
+        self._brightness = min(max(value, 0.0), 1.0)
+        for i, color in enumerate(self._colors):
+            self._store(i, color)
+
+    def _store(self, index, color):
+        if isinstance(color, int):
+            color = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+        else:
+            color = tuple(color[:3])
+        self._colors[index] = color
+        base = index * 3
+        scale = self._brightness
+        for ch, offset in enumerate(self._offsets):
+            self.buf[base + offset] = int(color[ch] * scale)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self.n))
+            if len(value) != len(indices):
+                raise ValueError("Slice and input sequence size do not match.")
+            for i, color in zip(indices, value):
+                self._store(i, color)
+        else:
+            if index < 0:
+                index += self.n
+            self._store(index, value)
+        if self.auto_write:
+            self.show()
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def fill(self, color):
+        for i in range(self.n):
+            self._store(i, color)
+        if self.auto_write:
+            self.show()
+
+    def show(self):
+        self.shows += 1
+        self.bytes_pushed += len(self.buf)
+        seconds = wire_time(self.n)
+        self.wire_seconds += seconds
+        if self.frames is not None:
+            self.frames.append(bytes(self.buf))
+        if self.realtime:
+            time.sleep(seconds)
+
+    def deinit(self):
+        pass
+
+    def stats(self):
+        return {
+            "shows": self.shows,
+            "bytes_pushed": self.bytes_pushed,
+            "wire_seconds": self.wire_seconds,
+        }
+
+
+# ----- Lazy Strip -----
+class LazyStrip:
+    """Opens the real strip on first use instead of at construction.
+
+    Importing board/neopixel and setting up the PWM/DMA channel is most of a
+    script's startup time, and modules imported as libraries may never show
+    a frame. Every attribute and item access forwards to the opened strip;
+    len() and opened do not open it.
+    """
+
+    def __init__(self, pin_name, num_pixels, brightness=1.0, pixel_order="GRB", backend=None):
+        self._args = (pin_name, num_pixels, brightness, pixel_order, backend)
+        self._strip = None
+        self.n = num_pixels
+
+    @property
+    def opened(self):
+        return self._strip is not None
+
+    @property
+    def strip(self):
+        if self._strip is None:
+            self._strip = create_strip(*self._args)
+        return self._strip
+
+    def __getattr__(self, name):
+        # Only reached for attributes LazyStrip itself lacks
+        return getattr(self.strip, name)
+
+    def __setattr__(self, name, value):
+        if name in ("_args", "_strip", "n"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.strip, name, value)
+
+    def __len__(self):
+        return self.n
+
+    def __setitem__(self, index, value):
+        self.strip[index] = value
+
+    def __getitem__(self, index):
+        return self.strip[index]
+
+    def deinit(self):
+        if self._strip is not None and hasattr(self._strip, "deinit"):
+            self._strip.deinit()
+
+
+# ----- Factory -----
+def create_strip(pin_name, num_pixels, brightness=1.0, pixel_order="GRB", backend=None, lazy=False):
+    """Open the LED strip on board.<pin_name> (e.g. "D12") using the selected backend.
+
+    pin_name "SPI" drives the strip from the SPI MOSI pin (GPIO10) instead,
+    which can run alongside a PWM pin; Blinka drives only one PWM pin per
+    process. lazy=True returns a LazyStrip that opens on the first frame.
+    """
+    if lazy:
+        return LazyStrip(pin_name, num_pixels, brightness, pixel_order, backend)
+    backend = backend or BACKEND
+    if backend == "sim":
+        return SimulatedStrip(num_pixels, brightness=brightness, pixel_order=pixel_order,
+                              realtime=os.environ.get("PIXELBOX_SIM_REALTIME") == "1")
+    if backend != "neopixel":
+        raise ValueError(f"Unknown LED backend: {backend!r}")
+
+    import board     # Pin definitions for Raspberry Pi
+    import neopixel  # LED Matrix library
+    if pin_name == "SPI":
+        import neopixel_spi  # adafruit-circuitpython-neopixel-spi
+        return neopixel_spi.NeoPixel_SPI(
+            board.SPI(), num_pixels, brightness=brightness,
+            auto_write=False, pixel_order=getattr(neopixel, pixel_order)
+        )
+    return neopixel.NeoPixel(
+        getattr(board, pin_name), num_pixels, brightness=brightness,
+        auto_write=False, pixel_order=getattr(neopixel, pixel_order)
+    )
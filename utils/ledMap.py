@@ -0,0 +1,185 @@
+# =====================================================================
+#                   Pixelbox - ledMap.py
+#   ledMap.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Shared logical-to-physical LED index map and framebuffer.
+# =====================================================================
+
+
+import operator
+
+# ----- Default Matrix Size -----
+GRID_ROWS = 16
+GRID_COLS = 16
+
+BLACK = (0, 0, 0)
+
+# ----- Matrix Orientation -----
+# The Pixelbox matrix seen from the front: serpentine wiring whose first row
+# runs right to left, so a left-to-right, top-to-bottom frame needs HFLIP.
+# (touchToLED's old SWAP_AXES + ROTATE 90 is the same permutation.) Every
+# script that draws in matrix coordinates builds its LedMap from this.
+MATRIX_ORIENTATION = dict(swap_axes=False, rotate=0, hflip=True, vflip=False)
+
+
+# ----- Helper Functions -----
+def serpentine_index(row, col, cols=GRID_COLS):
+    # row-wise serpentine, first row runs left to right
+    if row % 2 == 0:
+        return row * cols + col
+    else:
+        return row * cols + (cols - 1 - col)
+
+def orient(row, col, rows=GRID_ROWS, cols=GRID_COLS,
+           swap_axes=False, rotate=0, hflip=False, vflip=False):
+    """Apply SWAP/ROTATE/FLIP to map logical (row,col) to physical matrix (row,col)."""
+    # 1) swap
+    if swap_axes:
+        row, col = col, row
+    # 2) rotate (about top-left origin)
+    if rotate == 90:
+        row, col = col, (cols - 1) - row
+    elif rotate == 180:
+        row, col = (rows - 1) - row, (cols - 1) - col
+    elif rotate == 270:
+        row, col = (rows - 1) - col, row
+    # 3) flips
+    if hflip:
+        col = (cols - 1) - col
+    if vflip:
+        row = (rows - 1) - row
+    return row, col
+
+def build_index_map(rows=GRID_ROWS, cols=GRID_COLS,
+                    swap_axes=False, rotate=0, hflip=False, vflip=False):
+    """Return the physical LED index of every logical cell, in row-major order."""
+    if rotate not in (0, 90, 180, 270):
+        raise ValueError(f"ROTATE must be 0, 90, 180 or 270, got {rotate}")
+    if rows != cols and (swap_axes or rotate in (90, 270)):
+        raise ValueError("SWAP_AXES and 90/270 rotation need a square grid")
+
+    index_map = []
+    for row in range(rows):
+        for col in range(cols):
+            mr, mc = orient(row, col, rows, cols, swap_axes, rotate, hflip, vflip)
+            index_map.append(serpentine_index(mr, mc, cols))
+    return index_map
+
+
+def frame_bytes(data, num_pixels):
+    """View a whole frame as flat RGB bytes without copying.
+
+    data may be bytes, a bytearray, a memoryview or any C-contiguous
+    rows x cols x 3 uint8 array (e.g. NumPy).
+    """
+    view = memoryview(data)
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    if view.nbytes != num_pixels * 3:
+        raise ValueError(f"expected {num_pixels * 3} bytes of RGB, got {view.nbytes}")
+    return view
+
+
+# ----- Index Map -----
+class LedMap:
+    """Permutation between logical row-major cells and physical LED indices.
+
+    Built once from the orientation toggles (or a precompiled index_map,
+    e.g. from a panel layout); afterwards every lookup is a list read and a
+    whole frame is reordered by a single itemgetter call.
+    """
+
+    def __init__(self, rows=GRID_ROWS, cols=GRID_COLS,
+                 swap_axes=False, rotate=0, hflip=False, vflip=False, index_map=None):
+        self.rows = rows
+        self.cols = cols
+        self.num_pixels = rows * cols
+
+        # logical index -> LED index, and its inverse
+        if index_map is None:
+            index_map = build_index_map(rows, cols, swap_axes, rotate, hflip, vflip)
+        self.to_led = list(index_map)
+        self.from_led = [0] * self.num_pixels
+        for logical, led in enumerate(self.to_led):
+            self.from_led[led] = logical
+
+        # Byte gather: pulls a logical RGB buffer into LED order in one call
+        self._gather = operator.itemgetter(
+            *[logical * 3 + ch for logical in self.from_led for ch in range(3)]
+        )
+
+    def led_index(self, row, col):
+        """LED index for a logical (row,col)."""
+        return self.to_led[row * self.cols + col]
+
+    def logical_index(self, row, col):
+        """Logical index for a physical matrix (row,col)."""
+        return self.from_led[serpentine_index(row, col, self.cols)]
+
+    def to_led_order(self, rgb):
+        """Reorder a logical RGB byte buffer into LED order (tuple of ints)."""
+        return self._gather(rgb)
+
+    def converter_to(self, other):
+        """Function turning a logical buffer of this map into one of `other` that lights the same LEDs."""
+        gather = operator.itemgetter(
+            *[self.from_led[led] * 3 + ch for led in other.to_led for ch in range(3)]
+        )
+        return lambda rgb: bytes(gather(rgb))
+
+
+# ----- Framebuffer -----
+class Framebuffer:
+    """Logical row-major RGB framebuffer, pushed to the strip in one pass."""
+
+    def __init__(self, led_map):
+        self.map = led_map
+        self.rows = led_map.rows
+        self.cols = led_map.cols
+        self.num_pixels = led_map.num_pixels
+        self.buf = bytearray(self.num_pixels * 3)
+
+    def set_pixel(self, row, col, color):
+        i = (row * self.cols + col) * 3
+        self.buf[i:i + 3] = bytes(color)
+
+    def paint_cells(self, cells, color):
+        """Set every (row,col) in cells to one color."""
+        rgb = bytes(color)
+        buf, cols = self.buf, self.cols
+        for row, col in cells:
+            i = (row * cols + col) * 3
+            buf[i:i + 3] = rgb
+
+    def get_pixel(self, row, col):
+        i = (row * self.cols + col) * 3
+        return tuple(self.buf[i:i + 3])
+
+    def set_physical(self, row, col, color):
+        """Set a pixel addressed in physical matrix coordinates."""
+        i = self.map.logical_index(row, col) * 3
+        self.buf[i:i + 3] = bytes(color)
+
+    def fill(self, color=BLACK):
+        self.buf[:] = bytes(color) * self.num_pixels
+
+    def load(self, data):
+        """Replace the whole frame from a row-major RGB buffer or rows x cols x 3 array."""
+        self.buf[:] = frame_bytes(data, self.num_pixels)
+
+    def push(self, pixels):
+        """Apply the index map to the whole frame and show it.
+
+        pixels is a strip, or an OutputStage that also applies brightness/gamma.
+        """
+        write_frame = getattr(pixels, "write_frame", None)
+        if write_frame is not None:
+            write_frame(self.buf)
+            return
+        it = iter(self.map.to_led_order(self.buf))
+        pixels[:] = list(zip(it, it, it))
+        pixels.show()
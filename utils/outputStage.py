@@ -0,0 +1,167 @@
+# =====================================================================
+#                   Pixelbox - outputStage.py
+#   outputStage.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Brightness/gamma lookup tables applied to whole frames straight into the strip buffer.
+# =====================================================================
+'''
+Code Example Use:
+pixels = create_strip("D12", 256)          # library brightness stays 1.0
+output = OutputStage(pixels, led_map, brightness=0.1)
+frame.push(output)                        # or output.write_frame(array_16x16x3)
+'''
+
+
+import operator
+
+from utils.ledMap import frame_bytes
+
+DEFAULT_GAMMA = 2.8  # typical for WS2812 LEDs
+
+
+# ----- Lookup Tables -----
+def build_lut(brightness=1.0, gamma=DEFAULT_GAMMA):
+    """256-byte table mapping a channel value to gamma-corrected, brightness-scaled output."""
+    brightness = min(max(brightness, 0.0), 1.0)
+    return bytes(
+        int(round(255.0 * brightness * (i / 255.0) ** gamma)) for i in range(256)
+    )
+
+def strip_buffer(pixels):
+    """The byte buffer a strip transmits on show(), or None if it is not reachable.
+
+    adafruit_pixelbuf based NeoPixels transmit _post_brightness_buffer; older
+    neopixel releases and SimulatedStrip keep it in buf.
+    """
+    for name in ("_post_brightness_buffer", "buf"):
+        buf = getattr(pixels, name, None)
+        if isinstance(buf, bytearray) and len(buf) == len(pixels) * 3:
+            return buf
+    return None
+
+
+def build_slice_plan(from_led, pixel_order="GRB"):
+    """Copies that move a logical RGB frame into LED and wire channel order.
+
+    Walking the strip in LED order, consecutive LEDs whose logical indices
+    advance by a constant step form one run (a matrix row for any
+    orientation). Runs with step +1 or -1 become one contiguous copy from a
+    channel-swizzled frame; other steps fall back to one extended slice per
+    channel. Returns [(dst slice, source, src slice, reverse)] where source
+    is "wire" (channels in pixel_order), "rwire" (pixel_order reversed, so a
+    reversed run comes out in wire order) or "rgb" (the frame as given).
+    """
+    plan = []
+    n = len(from_led)
+    led = 0
+    while led < n:
+        start = from_led[led]
+        step = from_led[led + 1] - start if led + 1 < n else 1
+        end = led + 1
+        while end < n and from_led[end] - from_led[end - 1] == step:
+            end += 1
+        length = end - led
+        if step == 1:
+            plan.append((slice(led * 3, end * 3), "wire", slice(start * 3, (start + length) * 3), False))
+        elif step == -1:
+            first = start - length + 1
+            plan.append((slice(led * 3, end * 3), "rwire", slice(first * 3, (start + 1) * 3), True))
+        else:
+            for k, ch in enumerate(pixel_order):
+                src_start = start * 3 + "RGB".index(ch)
+                src_stop = src_start + length * step * 3
+                plan.append((slice(led * 3 + k, end * 3, 3), "rgb",
+                             slice(src_start, src_stop if src_stop >= 0 else None, step * 3), False))
+        led = end
+    return plan
+
+
+# ----- Output Stage -----
+class OutputStage:
+    """Final stage between a logical frame and the strip.
+
+    write_frame() takes any row-major RGB buffer (bytes, bytearray,
+    memoryview or a C-contiguous rows x cols x 3 uint8 array), applies the
+    brightness+gamma table with bytes.translate and copies it into the
+    strip's transmit buffer with a handful of slice copies (a channel
+    swizzle plus one copy per matrix row) before show(); no per-pixel objects are created. The
+    strip itself should run at brightness 1.0 so the library never rescales
+    pixels; brightness lives in the tables instead. balance scales each of
+    R, G, B for white balance.
+    """
+
+    def __init__(self, pixels, led_map, brightness=1.0, gamma=DEFAULT_GAMMA,
+                 pixel_order="GRB", balance=(1.0, 1.0, 1.0)):
+        self.pixels = pixels
+        self.map = led_map
+        self.num_pixels = led_map.num_pixels
+        self.gamma = gamma
+        self.balance = tuple(balance)
+        self.pixel_order = pixel_order
+        self.buffer = None
+        self._bound = False
+        if getattr(pixels, "opened", True):
+            self._bind()
+        self.set_brightness(brightness)
+
+    def _bind(self):
+        """Look up the strip's transmit buffer and plan the copies into it.
+
+        Runs at construction, or on the first frame for a LazyStrip so the
+        hardware is not opened before anything is shown.
+        """
+        pixels, pixel_order = self.pixels, self.pixel_order
+        if getattr(pixels, "brightness", 1.0) != 1.0:
+            pixels.brightness = 1.0
+        self.buffer = strip_buffer(pixels)
+
+        if self.buffer is not None:
+            self._plan = build_slice_plan(self.map.from_led, pixel_order)
+            # (wire channel, RGB channel) pairs for each swizzled source the plan reads
+            orders = {"wire": pixel_order, "rwire": pixel_order[::-1]}
+            used = {source for _dst, source, _src, _rev in self._plan}
+            self._swizzles = [(name, [(k, "RGB".index(ch)) for k, ch in enumerate(orders[name])])
+                              for name in ("wire", "rwire") if name in used]
+        else:
+            # Fallback hands RGB tuples in LED order to the library
+            self._gather = operator.itemgetter(
+                *[logical * 3 + ch for logical in self.map.from_led for ch in range(3)]
+            )
+        self._bound = True
+
+    def set_brightness(self, brightness):
+        self.brightness = min(max(brightness, 0.0), 1.0)
+        self.luts = [build_lut(self.brightness * self.balance[ch], self.gamma) for ch in range(3)]
+        self._single = self.luts[0] == self.luts[1] == self.luts[2]
+
+    def write_frame(self, rgb):
+        """Correct a logical RGB frame, store it in wire order and show it."""
+        view = frame_bytes(rgb, self.num_pixels)
+        if self._single:
+            data = view.tobytes().translate(self.luts[0])
+        else:
+            data = bytearray(view)
+            for ch, lut in enumerate(self.luts):
+                data[ch::3] = data[ch::3].translate(lut)
+
+        if not self._bound:
+            self._bind()
+        buf = self.buffer
+        if buf is not None:
+            sources = {"rgb": data}
+            for name, pairs in self._swizzles:
+                swizzled = bytearray(len(data))
+                for k, ch in pairs:
+                    swizzled[k::3] = data[ch::3]
+                sources[name] = swizzled
+            for dst, source, src, reverse in self._plan:
+                chunk = sources[source][src]
+                buf[dst] = chunk[::-1] if reverse else chunk
+        else:
+            it = iter(self._gather(data))
+            self.pixels[:] = list(zip(it, it, it))
+        self.pixels.show()
@@ -0,0 +1,203 @@
+# =====================================================================
+#                   Pixelbox - panelLayout.py
+#   panelLayout.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Tiled multi-panel layouts compiled to one index map, output over several channels.
+# =====================================================================
+'''
+Code Example Use (32x32 from four 16x16 panels, two per channel):
+layout = PanelLayout(32, 32, [
+    Panel(0, 0,  channel=0), Panel(0, 16, channel=0, rotate=180),
+    Panel(16, 0, channel=1), Panel(16, 16, channel=1, rotate=180),
+])
+led_map, output = build_output(layout, {0: "D12", 1: "SPI"}, brightness=0.1)
+frame = Framebuffer(led_map); frame.push(output)
+
+layout = LAYOUTS["32x32"]()           # presets, e.g. python3 frameServer.py --layout 32x32
+'''
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.ledBackend import create_strip, max_refresh_hz
+from utils.ledMap import LedMap, orient, serpentine_index
+from utils.outputStage import OutputStage, strip_buffer
+
+
+# ----- Layout Description -----
+class Panel:
+    """One LED panel placed with its top-left corner at logical (row, col).
+
+    rotate/hflip/vflip/swap_axes orient the panel like LedMap does for a
+    single matrix; serpentine=False is for panels whose rows all run the
+    same way. Panels on the same channel are chained in the order listed.
+    """
+
+    def __init__(self, row, col, rows=16, cols=16, channel=0, rotate=0,
+                 hflip=False, vflip=False, swap_axes=False, serpentine=True):
+        if rotate not in (0, 90, 180, 270):
+            raise ValueError(f"rotate must be 0, 90, 180 or 270, got {rotate}")
+        if rows != cols and (swap_axes or rotate in (90, 270)):
+            raise ValueError("swap_axes and 90/270 rotation need a square panel")
+        self.row = row
+        self.col = col
+        self.rows = rows
+        self.cols = cols
+        self.channel = channel
+        self.rotate = rotate
+        self.hflip = hflip
+        self.vflip = vflip
+        self.swap_axes = swap_axes
+        self.serpentine = serpentine
+
+    @property
+    def num_pixels(self):
+        return self.rows * self.cols
+
+    def wire_index(self, row, col):
+        """Position along this panel's data line of panel-local logical (row, col)."""
+        mr, mc = orient(row, col, self.rows, self.cols,
+                        self.swap_axes, self.rotate, self.hflip, self.vflip)
+        if self.serpentine:
+            return serpentine_index(mr, mc, self.cols)
+        return mr * self.cols + mc
+
+
+class PanelLayout(LedMap):
+    """Compiles tiled panels into one LedMap over all channels back to back.
+
+    LED indices run through channel 0's chain, then channel 1's, and so on;
+    channel_sizes gives the pixel count of each, in channel order.
+    """
+
+    def __init__(self, rows, cols, panels):
+        self.panels = list(panels)
+        channels = sorted({p.channel for p in self.panels})
+        chains = {ch: [p for p in self.panels if p.channel == ch] for ch in channels}
+        self.channel_sizes = [sum(p.num_pixels for p in chains[ch]) for ch in channels]
+
+        # Panel -> first LED index of its chain position
+        base = {}
+        offset = 0
+        for ch in channels:
+            for panel in chains[ch]:
+                base[id(panel)] = offset
+                offset += panel.num_pixels
+        if offset != rows * cols:
+            raise ValueError(f"panels cover {offset} pixels, the layout has {rows * cols}")
+
+        to_led = [None] * (rows * cols)
+        self._panel_cells = []  # per panel: physical row * cols + col -> logical index
+        for panel in self.panels:
+            if panel.row + panel.rows > rows or panel.col + panel.cols > cols:
+                raise ValueError(f"panel at ({panel.row},{panel.col}) lies outside the layout")
+            start = base[id(panel)]
+            cells = [0] * panel.num_pixels
+            for r in range(panel.rows):
+                for c in range(panel.cols):
+                    logical = (panel.row + r) * cols + panel.col + c
+                    if to_led[logical] is not None:
+                        raise ValueError(f"panels overlap at ({panel.row + r},{panel.col + c})")
+                    to_led[logical] = start + panel.wire_index(r, c)
+                    mr, mc = orient(r, c, panel.rows, panel.cols,
+                                    panel.swap_axes, panel.rotate, panel.hflip, panel.vflip)
+                    cells[mr * panel.cols + mc] = logical
+            self._panel_cells.append(cells)
+
+        super().__init__(rows, cols, index_map=to_led)
+
+    def panel_index(self, panel, row, col):
+        """Logical index of a physical (row, col) on panels[panel]."""
+        p = self.panels[panel]
+        if not (0 <= row < p.rows and 0 <= col < p.cols):
+            raise ValueError(f"({row},{col}) is not on panel {panel}")
+        return self._panel_cells[panel][row * p.cols + col]
+
+    def logical_index(self, row, col):
+        """A tiled layout has no single physical grid; use panel_index()."""
+        raise ValueError("physical (row, col) is per panel on a tiled layout; use panel_index(panel, row, col)")
+
+
+# ----- Preset Layouts -----
+# Pixelbox 16x16 panels, each wired like the single matrix (first row right to
+# left); panels on a channel are chained left to right, top to bottom.
+# Edit or add entries to match the real wiring.
+LAYOUTS = {
+    "16x16": lambda: PanelLayout(16, 16, [Panel(0, 0, hflip=True)]),
+    "32x16": lambda: PanelLayout(16, 32, [Panel(0, 0, hflip=True), Panel(0, 16, hflip=True)]),
+    "32x32": lambda: PanelLayout(32, 32, [
+        Panel(0, 0, hflip=True), Panel(0, 16, hflip=True),
+        Panel(16, 0, channel=1, hflip=True), Panel(16, 16, channel=1, hflip=True),
+    ]),
+}
+CHANNEL_PINS = {0: "D12", 1: "SPI"}  # data pin per channel
+
+def layout_refresh_hz(layout):
+    """Refresh ceiling of a layout: its longest channel sets the wire time."""
+    return max_refresh_hz(max(layout.channel_sizes))
+
+
+# ----- Multi-Channel Output -----
+class ChannelGroup:
+    """Several strips presented as one, shown concurrently.
+
+    buf holds every channel back to back (the layout's LED order), so an
+    OutputStage writes it like a single strip. show() copies each channel's
+    slice into its strip and runs the strips' show() calls in parallel, so
+    a refresh can take as long as the longest channel rather than the sum.
+
+    That overlap has only been measured with the simulated strip (whose
+    realtime wire wait sleeps and releases the GIL). The real drivers have
+    not been measured: rpi_ws281x hands the frame to DMA, but neopixel_spi
+    expands bits in Python under the GIL, so a D12 + SPI pair may gain less.
+    """
+
+    def __init__(self, strips):
+        self.strips = list(strips)
+        self.sizes = [len(s) for s in self.strips]
+        self.buf = bytearray(3 * sum(self.sizes))
+        self._targets = []
+        offset = 0
+        for strip, n in zip(self.strips, self.sizes):
+            target = strip_buffer(strip)
+            if target is None:
+                raise ValueError(f"{type(strip).__name__} does not expose its pixel buffer")
+            self._targets.append((slice(offset, offset + 3 * n), target))
+            offset += 3 * n
+        self._pool = ThreadPoolExecutor(max_workers=max(1, len(self.strips) - 1))
+        self.brightness = 1.0
+
+    def __len__(self):
+        return len(self.buf) // 3
+
+    def show(self):
+        for part, target in self._targets:
+            target[:] = self.buf[part]
+        # Channel 0 runs here while the others run on the pool
+        pending = [self._pool.submit(strip.show) for strip in self.strips[1:]]
+        self.strips[0].show()
+        for future in pending:
+            future.result()
+
+    def deinit(self):
+        self._pool.shutdown()
+        for strip in self.strips:
+            if hasattr(strip, "deinit"):
+                strip.deinit()
+
+
+def build_output(layout, channel_pins, brightness=1.0, gamma=None, pixel_order="GRB"):
+    """Open one strip per channel (pins by channel, e.g. {0: "D12", 1: "SPI"}).
+
+    Returns (led_map, output) ready for Framebuffer(led_map).push(output).
+    """
+    channels = sorted({p.channel for p in layout.panels})
+    strips = [create_strip(channel_pins[ch], n, pixel_order=pixel_order)
+              for ch, n in zip(channels, layout.channel_sizes)]
+    pixels = strips[0] if len(strips) == 1 else ChannelGroup(strips)
+    kwargs = {} if gamma is None else {"gamma": gamma}
+    return layout, OutputStage(pixels, layout, brightness=brightness, pixel_order=pixel_order, **kwargs)
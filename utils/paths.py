@@ -0,0 +1,27 @@
+# =====================================================================
+#                   Pixelbox - paths.py
+#   paths.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Where the Pixelbox scripts keep their saved state.
+# =====================================================================
+'''
+Code Example Use:
+journal = CanvasJournal(state_dir("touch"), frame)     # ~/.local/share/pixelbox/touch.*
+PIXELBOX_STATE_DIR=/tmp/pbx python3 touchToLED.py      (keep state somewhere else)
+'''
+
+
+import os
+
+STATE_ENV = "PIXELBOX_STATE_DIR"
+
+
+def state_dir(name):
+    """Per-app state path prefix; PIXELBOX_STATE_DIR overrides the default location."""
+    base = os.environ.get(STATE_ENV,
+                          os.path.join(os.path.expanduser("~"), ".local", "share", "pixelbox"))
+    return os.path.join(base, name)
@@ -0,0 +1,330 @@
+# =====================================================================
+#                   Pixelbox - pbxFile.py
+#   pbxFile.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: .pbx pixel art / animation container: XOR run-length deltas, mmap playback.
+# =====================================================================
+'''
+Code Example Use:
+encode("images/wave.pbx", frames, rows=16, cols=16, fps=12)
+with PbxReader("images/wave.pbx") as pbx:
+    for rgb in pbx.frames():
+        output.write_frame(rgb)
+python3 -m utils.pbxFile info images/wave.pbx
+'''
+
+
+import argparse
+import mmap
+import re
+import struct
+
+from utils.ledMap import MATRIX_ORIENTATION
+
+# ----- File Format -----
+# Header:  magic, version, flags, rows, cols, fps, frame count, index offset, palette size
+# Palette: palette size * RGB (only when FLAG_PALETTE is set; frames are then 1 byte per pixel)
+# Frame:   kind, payload length, payload of (varint skip, varint length, literal bytes) runs
+# Index:   frame count * u32 file offset of each frame record
+# A frame's runs are XORed onto the previous frame (DELTA) or onto black (KEY),
+# so unchanged bytes cost nothing and keyframes give random access.
+# Pixels are row-major as seen on the matrix, i.e. laid out by a LedMap with
+# PBX_ORIENTATION, the shared MATRIX_ORIENTATION; writers using another
+# orientation convert first (LedMap.converter_to).
+MAGIC   = b"PBXA"
+VERSION = 1
+HEADER  = struct.Struct("<4sBBHHfIIH")
+FRAME   = struct.Struct("<BI")
+INDEX   = struct.Struct("<I")
+
+FLAG_PALETTE = 0x01
+
+KIND_KEY   = 0
+KIND_DELTA = 1
+
+KEYFRAME_INTERVAL = 60
+
+PBX_ORIENTATION = MATRIX_ORIENTATION
+
+# Runs of changed bytes; gaps of up to 3 unchanged bytes are cheaper to carry inline
+_CHANGED = re.compile(rb"[^\x00]+(?:\x00{1,3}[^\x00]+)*")
+
+
+# ----- Run Coding -----
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _get_varint(data, i):
+    value = shift = 0
+    while True:
+        b = data[i]
+        i += 1
+        value |= (b & 0x7F) << shift
+        if b < 0x80:
+            return value, i
+        shift += 7
+
+def xor_runs(prev, cur):
+    """Encode cur as skip/literal runs of its XOR with prev (prev=None for a keyframe)."""
+    n = len(cur)
+    if prev is None:
+        diff = bytes(cur)
+    else:
+        diff = (int.from_bytes(prev, "little") ^ int.from_bytes(cur, "little")).to_bytes(n, "little")
+    out = bytearray()
+    pos = 0
+    for m in _CHANGED.finditer(diff):
+        _put_varint(out, m.start() - pos)
+        _put_varint(out, m.end() - m.start())
+        out += m.group()
+        pos = m.end()
+    return bytes(out)
+
+def apply_runs(buf, payload, key=False):
+    """XOR the runs in payload onto buf in place (keyframes overwrite a black buf)."""
+    if key:
+        buf[:] = bytes(len(buf))
+    pos = i = 0
+    end = len(payload)
+    while i < end:
+        skip, i = _get_varint(payload, i)
+        n, i = _get_varint(payload, i)
+        pos += skip
+        lit = payload[i:i + n]
+        i += n
+        if key:
+            buf[pos:pos + n] = lit
+        else:
+            x = int.from_bytes(buf[pos:pos + n], "little") ^ int.from_bytes(lit, "little")
+            buf[pos:pos + n] = x.to_bytes(n, "little")
+        pos += n
+
+
+# ----- Writing -----
+class PbxWriter:
+    """Streams frames to a .pbx file; call close() (or use with) to write the index."""
+
+    def __init__(self, path, rows=16, cols=16, fps=12.0, palette=None,
+                 keyframe_interval=KEYFRAME_INTERVAL):
+        self.rows = rows
+        self.cols = cols
+        self.fps = fps
+        self.keyframe_interval = keyframe_interval
+        self.palette = [tuple(c) for c in palette] if palette else None
+        if self.palette is not None and len(self.palette) > 256:
+            raise ValueError("a palette holds at most 256 colours")
+        self._lookup = {c: i for i, c in enumerate(self.palette or ())}
+        self._offsets = []
+        self._prev = None
+        self._f = open(path, "wb")
+        self._f.write(self._header(0, 0))
+        if self.palette is not None:
+            self._f.write(b"".join(bytes(c) for c in self.palette))
+
+    def _header(self, count, index_offset):
+        flags = FLAG_PALETTE if self.palette is not None else 0
+        return HEADER.pack(MAGIC, VERSION, flags, self.rows, self.cols, self.fps,
+                           count, index_offset, len(self.palette or ()))
+
+    def _pixels(self, rgb):
+        """Frame bytes as stored: RGB, or one palette index per pixel."""
+        rgb = bytes(rgb)
+        if len(rgb) != self.rows * self.cols * 3:
+            raise ValueError(f"expected {self.rows * self.cols * 3} bytes of RGB, got {len(rgb)}")
+        if self.palette is None:
+            return rgb
+        it = iter(rgb)
+        try:
+            return bytes(self._lookup[c] for c in zip(it, it, it))
+        except KeyError as e:
+            raise ValueError(f"colour {e.args[0]} is not in the palette") from None
+
+    def add_frame(self, rgb):
+        """Append a row-major RGB frame."""
+        data = self._pixels(rgb)
+        key = self._prev is None or len(self._offsets) % self.keyframe_interval == 0
+        payload = xor_runs(None if key else self._prev, data)
+        self._offsets.append(self._f.tell())
+        self._f.write(FRAME.pack(KIND_KEY if key else KIND_DELTA, len(payload)))
+        self._f.write(payload)
+        self._prev = data
+
+    def close(self):
+        if self._f.closed:
+            return
+        index_offset = self._f.tell()
+        self._f.write(b"".join(INDEX.pack(o) for o in self._offsets))
+        self._f.seek(0)
+        self._f.write(self._header(len(self._offsets), index_offset))
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def encode(path, frames, rows=16, cols=16, fps=12.0, keyframe_interval=KEYFRAME_INTERVAL):
+    """Write frames to path, palette-indexed when they use 256 colours or fewer.
+
+    Returns the number of frames written.
+    """
+    frames = [bytes(f) for f in frames]
+    colors = set()
+    for rgb in frames:
+        it = iter(rgb)
+        colors.update(zip(it, it, it))
+        if len(colors) > 256:
+            break
+    palette = sorted(colors) if len(colors) <= 256 else None
+    with PbxWriter(path, rows, cols, fps, palette, keyframe_interval) as writer:
+        for rgb in frames:
+            writer.add_frame(rgb)
+    return len(frames)
+
+def resample(samples, fps):
+    """Turn (time, rgb) snapshots taken at irregular times into frames at a fixed fps.
+
+    Each output frame is the latest snapshot at or before its tick; repeated
+    frames encode as empty deltas.
+    """
+    if not samples:
+        return []
+    start, end = samples[0][0], samples[-1][0]
+    frames = []
+    k = 0
+    for tick in range(int((end - start) * fps) + 1):
+        t = start + tick / fps
+        while k + 1 < len(samples) and samples[k + 1][0] <= t:
+            k += 1
+        frames.append(samples[k][1])
+    if frames[-1] is not samples[-1][1]:
+        frames.append(samples[-1][1])  # always end on the final drawing
+    return frames
+
+
+# ----- Reading -----
+class PbxReader:
+    """Memory-mapped .pbx reader that decodes one frame at a time.
+
+    Nothing is decoded up front and only the current frame is held in
+    memory, so long animations stream from the SD card. Sequential access
+    applies one delta per frame; random access replays from the nearest
+    keyframe.
+    """
+
+    def __init__(self, path):
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, flags, self.rows, self.cols, self.fps,
+         self.frame_count, index_offset, palette_size) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a Pixelbox animation")
+
+        self.num_pixels = self.rows * self.cols
+        self.palette = None
+        if flags & FLAG_PALETTE:
+            raw = self._mm[HEADER.size:HEADER.size + palette_size * 3]
+            self.palette = [tuple(raw[i:i + 3]) for i in range(0, len(raw), 3)]
+            # One translate table per channel expands indices to RGB
+            padded = raw + bytes(768 - len(raw))
+            self._expand = [padded[ch::3] for ch in range(3)]
+        self._index = memoryview(self._mm)[index_offset:index_offset + 4 * self.frame_count].cast("I")
+
+        bpp = 1 if self.palette is not None else 3
+        self._data = bytearray(self.num_pixels * bpp)
+        self._pos = -1  # frame currently in _data
+
+    def __len__(self):
+        return self.frame_count
+
+    def _record(self, i):
+        offset = self._index[i]
+        kind, length = FRAME.unpack_from(self._mm, offset)
+        start = offset + FRAME.size
+        return kind, self._mm[start:start + length]
+
+    def _seek(self, i):
+        if not 0 <= i < self.frame_count:
+            raise IndexError(f"frame {i} out of range")
+        if i == self._pos:
+            return
+        if i < self._pos or self._pos < 0:
+            start = i
+            while self._record(start)[0] != KIND_KEY:
+                start -= 1
+        else:
+            start = self._pos + 1
+        for k in range(start, i + 1):
+            kind, payload = self._record(k)
+            apply_runs(self._data, payload, key=kind == KIND_KEY)
+        self._pos = i
+
+    def _rgb(self):
+        if self.palette is None:
+            return bytes(self._data)
+        rgb = bytearray(self.num_pixels * 3)
+        for ch, table in enumerate(self._expand):
+            rgb[ch::3] = self._data.translate(table)
+        return bytes(rgb)
+
+    def frame(self, i):
+        """Row-major RGB bytes of frame i."""
+        self._seek(i)
+        return self._rgb()
+
+    def frames(self, loop=False):
+        """Yield every frame in order (forever when loop is True)."""
+        while True:
+            for i in range(self.frame_count):
+                yield self.frame(i)
+            if not loop or not self.frame_count:
+                return
+
+    def close(self):
+        if hasattr(self, "_index"):
+            self._index.release()
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def play_effect(reader, loop=True):
+    """utils.animation effect showing frame tick of reader (run the Animator at reader.fps)."""
+    count = reader.frame_count
+    tick = yield
+    while count and (loop or tick < count):
+        tick = yield reader.frame(tick % count)
+
+
+# ----- Command Line -----
+def main():
+    parser = argparse.ArgumentParser(description="Inspect Pixelbox .pbx animations")
+    sub = parser.add_subparsers(dest="command", required=True)
+    info = sub.add_parser("info", help="summarise a .pbx file")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    with PbxReader(args.path) as pbx:
+        keys = sum(1 for i in range(len(pbx)) if pbx._record(i)[0] == KIND_KEY)
+        size = len(pbx._mm)
+        mode = f"{len(pbx.palette)} colour palette" if pbx.palette is not None else "RGB"
+        print(f"{pbx.cols}x{pbx.rows}, {len(pbx)} frames at {pbx.fps:g} fps, {mode}, "
+              f"{keys} keyframes, {size} bytes ({size / max(1, len(pbx)):.1f} bytes/frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# =====================================================================
+#                   Pixelbox - shakeSensor.py
+#   shakeSensor.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Debounced, interrupt-driven shake sensor with intensity, as an event source.
+# =====================================================================
+'''
+Code Example Use:
+shake = ShakeSensor(27)
+shake.subscribe(lambda s: print(s.intensity), min_intensity=3)  # a real shake, not a knock
+shake.start(asyncio.get_running_loop())                       # callbacks run on the loop
+event = await shake.wait()                                    # or await the next edge
+'''
+
+
+import asyncio
+import threading
+import time
+from collections import deque, namedtuple
+
+SENSOR_PIN  = 27     # or 16 if you're wired to Pin 36
+DEBOUNCE_MS = 5      # edges closer than this to the last one are contact bounce
+WINDOW_S    = 1.0    # intensity = debounced edges within this many seconds
+
+# One debounced edge: time.monotonic() timestamp and edges in the window up to it
+Shake = namedtuple("Shake", "time intensity")
+
+
+class ShakeSensorError(RuntimeError):
+    """The shake sensor could not be armed (no RPi.GPIO, no GPIO access, edge detection refused)."""
+
+
+class ShakeSensor:
+    """Edge-triggered shake sensor with software debounce and an intensity count.
+
+    RPi.GPIO calls back from its own thread on each rising edge, so detection
+    costs no polling. An edge within debounce_ms of the last accepted one is
+    dropped; accepted edges are kept for window_s and their count is the
+    shake intensity. Subscribers are told when the intensity reaches their
+    min_intensity, once per shake (they re-arm when it falls back below),
+    or on every edge from then on with repeat=True.
+    With a loop given to start() callbacks and wait() run on that loop,
+    otherwise callbacks run on the GPIO thread.
+    """
+
+    def __init__(self, pin=SENSOR_PIN, debounce_ms=DEBOUNCE_MS, window_s=WINDOW_S):
+        self.pin = pin
+        self.debounce = debounce_ms / 1000.0
+        self.window = window_s
+        self.edges = deque()        # accepted edge times within the window
+        self.bounced = 0            # edges dropped by the debounce
+        self._last = None
+        self._subscribers = []      # [callback, min_intensity, repeat, armed]
+        self._lock = threading.Lock()
+        self._loop = None
+        self._waiters = []          # futures of wait() calls in progress
+        self._gpio = None
+
+    # -- subscribers --
+    def subscribe(self, callback, min_intensity=1, repeat=False):
+        """Call callback(Shake) each time the intensity reaches min_intensity."""
+        with self._lock:
+            self._subscribers.append([callback, min_intensity, repeat, True])
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s[0] is not callback]
+
+    @property
+    def intensity(self):
+        """Debounced edges in the last window_s seconds."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self.edges)
+
+    # -- GPIO --
+    def start(self, loop=None):
+        """Arm edge detection.
+
+        Raises ShakeSensorError when RPi.GPIO is missing or the pin cannot be
+        set up (no /dev/gpiomem access, "Failed to add edge detection");
+        the pin is released again before it is raised.
+        """
+        try:
+            import RPi.GPIO as GPIO  # only present on the Pi
+        except ImportError as e:
+            raise ShakeSensorError(f"RPi.GPIO not available: {e}") from e
+
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None  # plain threads: callbacks run on the GPIO thread
+        self._loop = loop
+        try:
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setup(self.pin, GPIO.IN)
+            GPIO.add_event_detect(self.pin, GPIO.RISING, callback=self._on_edge)
+        except (RuntimeError, ValueError) as e:
+            try:
+                GPIO.cleanup(self.pin)
+            except (RuntimeError, ValueError):
+                pass  # nothing was set up
+            raise ShakeSensorError(f"GPIO {self.pin}: {e}") from e
+        self._gpio = GPIO
+
+    def _expire(self, now):
+        edges = self.edges
+        while edges and now - edges[0] > self.window:
+            edges.popleft()
+
+    def _on_edge(self, channel, now=None):
+        # Runs on the RPi.GPIO thread
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self._last is not None and now - self._last < self.debounce:
+                self.bounced += 1
+                return
+            self._last = now
+            self._expire(now)
+            self.edges.append(now)
+            shake = Shake(now, len(self.edges))
+            due = []
+            for sub in self._subscribers:
+                callback, min_intensity, repeat, armed = sub
+                if shake.intensity < min_intensity:
+                    sub[3] = True
+                elif armed or repeat:
+                    sub[3] = False
+                    due.append(callback)
+        if self._loop is None:
+            for callback in due:
+                callback(shake)
+            return
+        self._loop.call_soon_threadsafe(self._dispatch, shake, due)
+
+    def _dispatch(self, shake, due):
+        # Runs on the event loop
+        waiters, self._waiters = self._waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(shake)
+        for callback in due:
+            callback(shake)
+
+    async def wait(self):
+        """Wait for the next debounced edge; returns its Shake (needs a loop in start())."""
+        future = self._loop.create_future()
+        self._waiters.append(future)
+        return await future
+
+    def close(self):
+        if self._gpio is not None:
+            self._gpio.remove_event_detect(self.pin)
+            self._gpio.cleanup(self.pin)
+            self._gpio = None
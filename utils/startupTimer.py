@@ -0,0 +1,64 @@
+# =====================================================================
+#                   Pixelbox - startupTimer.py
+#   startupTimer.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Launch-to-first-frame timing and the startup budgets it is checked against.
+# =====================================================================
+'''
+Code Example Use:
+PIXELBOX_LAUNCH_T0=$(date +%s.%N) python3 GUI_LED/grid_draw_pixelbox.py   (run_led_gui.sh does this)
+first_frame("gui", frame.buf)     # after every push; prints the time of the first lit frame once
+'''
+
+
+import os
+import time
+
+LAUNCH_ENV = "PIXELBOX_LAUNCH_T0"  # epoch seconds when the launcher started
+
+# ----- Budgets -----
+FIRST_FRAME_TARGET_MS = 1500  # launcher start -> first frame on the LEDs
+IMPORT_BUDGET_MS      = 300   # importing one script module (checked by benchmarkPixelbox.py)
+
+_reported = False
+
+
+def launch_time():
+    """Epoch time of launch: PIXELBOX_LAUNCH_T0, else this process's start (Linux), else None."""
+    value = os.environ.get(LAUNCH_ENV)
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime, clock ticks since boot); the name in () may hold spaces
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+        return boot + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, StopIteration):
+        return None
+
+def first_frame(label, buf=None, target_ms=FIRST_FRAME_TARGET_MS):
+    """Report launch -> now once, on the first call whose frame buf has a lit pixel.
+
+    Blank (all black) frames pushed while starting up are not counted; with
+    buf None the call itself counts. Returns the milliseconds (or None).
+    """
+    global _reported
+    if _reported or (buf is not None and not any(buf)):
+        return None
+    _reported = True
+    start = launch_time()
+    if start is None:
+        return None
+    elapsed_ms = (time.time() - start) * 1000.0
+    status = "ok" if elapsed_ms <= target_ms else "OVER TARGET"
+    print(f"{label}: first frame {elapsed_ms:.0f} ms after launch (target {target_ms} ms, {status})")
+    return elapsed_ms
@@ -0,0 +1,96 @@
+# =====================================================================
+#                   Pixelbox - strokeEngine.py
+#   strokeEngine.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Joins touch samples into continuous strokes with a configurable brush.
+# =====================================================================
+
+
+# ----- Brush Shapes -----
+BRUSH_SQUARE = "square"
+BRUSH_ROUND  = "round"
+
+
+# ----- Helper Functions -----
+def line_cells(r0, c0, r1, c1):
+    """Bresenham line from (r0,c0) to (r1,c1), both ends included."""
+    cells = []
+    dr, dc = abs(r1 - r0), abs(c1 - c0)
+    sr = 1 if r1 >= r0 else -1
+    sc = 1 if c1 >= c0 else -1
+    err = dc - dr
+    while True:
+        cells.append((r0, c0))
+        if r0 == r1 and c0 == c1:
+            return cells
+        e2 = 2 * err
+        if e2 > -dr:
+            err -= dr
+            c0 += sc
+        if e2 < dc:
+            err += dc
+            r0 += sr
+
+def brush_offsets(size=1, shape=BRUSH_SQUARE):
+    """(drow, dcol) offsets covered by a brush of the given size and shape."""
+    lo = -((size - 1) // 2)
+    span = range(lo, lo + size)
+    if shape == BRUSH_SQUARE:
+        return tuple((dr, dc) for dr in span for dc in span)
+    if shape == BRUSH_ROUND:
+        centre = lo + (size - 1) / 2
+        limit = max((size / 2) ** 2 - 0.5, 0)
+        return tuple(
+            (dr, dc) for dr in span for dc in span
+            if (dr - centre) ** 2 + (dc - centre) ** 2 <= limit
+        )
+    raise ValueError(f"Unknown brush shape: {shape!r}")
+
+
+# ----- Stroke Engine -----
+class StrokeEngine:
+    """Tracks the last cell of each contact and rasterises the segment to the next one.
+
+    move() returns every grid cell the brush covers between two samples, so a
+    fast swipe paints a continuous line that the caller commits in one
+    framebuffer update and one push.
+    """
+
+    def __init__(self, rows, cols, brush_size=1, brush_shape=BRUSH_SQUARE):
+        self.rows = rows
+        self.cols = cols
+        self.last = {}  # contact -> (row, col)
+        self.set_brush(brush_size, brush_shape)
+
+    def set_brush(self, size, shape=BRUSH_SQUARE):
+        self.brush = brush_offsets(size, shape)
+
+    def move(self, contact, row, col):
+        """Extend the stroke of contact to (row,col); returns the cells to paint."""
+        prev = self.last.get(contact)
+        if prev == (row, col):
+            return []  # same cell as last sample, nothing new to draw
+        self.last[contact] = (row, col)
+        path = [(row, col)] if prev is None else line_cells(prev[0], prev[1], row, col)
+
+        cells = []
+        seen = set()
+        rows, cols = self.rows, self.cols
+        for r, c in path:
+            for dr, dc in self.brush:
+                cell = (r + dr, c + dc)
+                if cell not in seen and 0 <= cell[0] < rows and 0 <= cell[1] < cols:
+                    seen.add(cell)
+                    cells.append(cell)
+        return cells
+
+    def end(self, contact=None):
+        """Lift a contact (all contacts when None) so its next sample starts a new stroke."""
+        if contact is None:
+            self.last.clear()
+        else:
+            self.last.pop(contact, None)
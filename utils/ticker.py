@@ -0,0 +1,300 @@
+# =====================================================================
+#                   Pixelbox - ticker.py
+#   ticker.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Background ticker: prioritised message queue, pre-rendering thread, local socket.
+# =====================================================================
+'''
+Code Example Use:
+ticker = Ticker(frame, push, render_strip, rows=16, cols=16, fps=12.5).start()
+ticker.post("Hello")                         # returns at once
+ticker.post("Door open", priority=ALERT)     # cuts in ahead of routine messages
+serve_socket(ticker)                         # other processes: send_message("Hi")
+'''
+
+
+import heapq
+import itertools
+import json
+import operator
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+
+from utils.animation import Animator, Layer
+from utils.paths import state_dir
+
+# ----- Priorities (lower is more urgent) -----
+ALERT  = 0
+NORMAL = 10
+LOW    = 20
+PRIORITIES = {"alert": ALERT, "normal": NORMAL, "low": LOW}
+
+def _default_socket_path():
+    """Per-user socket: $XDG_RUNTIME_DIR (private to the user) when set, else the state directory."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "pixelbox-ticker.sock")
+    return state_dir("ticker") + ".sock"
+
+SOCKET_PATH = os.environ.get("PIXELBOX_TICKER_SOCKET") or _default_socket_path()
+_STOP = (-1, -1, None)  # sorts ahead of every message in the render queue
+
+
+def _check_colors(colors):
+    """colors as a tuple of (r, g, b) int tuples; ValueError if it is empty or malformed."""
+    try:
+        colors = tuple(tuple(int(v) for v in c) for c in colors)
+    except (TypeError, ValueError):
+        raise ValueError("colors must be a list of [r, g, b] values") from None
+    if not colors or any(len(c) != 3 or not all(0 <= v <= 255 for v in c) for c in colors):
+        raise ValueError("colors must be a non-empty list of [r, g, b] values 0-255")
+    return colors
+
+
+class TickerMessage:
+    __slots__ = ("text", "priority", "colors", "font", "seq", "strip", "width")
+
+    def __init__(self, text, priority, colors, font, seq):
+        self.text = text
+        self.priority = priority
+        self.colors = colors
+        self.font = font
+        self.seq = seq
+        self.strip = None
+        self.width = 0
+
+
+class Ticker:
+    """Scrolls queued messages back to back on background threads.
+
+    post() only queues. A render thread turns messages into strips (most
+    urgent first) while the current one scrolls, and the display thread
+    chains the strips in one fixed-timestep animation, so the next message
+    starts on the very next tick. A message more urgent than the one
+    scrolling cuts in; the interrupted one is queued again from the start.
+    render(text, colors, font) returns (column-major strip, width) as
+    scrollingText.render_strip does; fonts, when given, are the font names
+    render accepts.
+    """
+
+    def __init__(self, frame, push, render, rows, cols, fps=12.5, font="5x7", fonts=None):
+        self.frame = frame
+        self.push = push
+        self.render = render
+        self.rows = rows
+        self.cols = cols
+        self.fps = fps
+        self.font = font
+        self.fonts = fonts
+        self._window = operator.itemgetter(*[
+            (col * rows + row) * 3 + ch
+            for row in range(rows) for col in range(cols) for ch in range(3)
+        ])
+        self._incoming = queue.PriorityQueue()   # posted, not rendered yet
+        self._ready = []                         # heap of rendered (priority, seq, message)
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._pending = 0                        # posted and not yet fully shown
+        self._running = False
+        self._anim = None
+        self._threads = []
+        self.current = None
+
+        # Counters
+        self.shown = 0
+        self.preempted = 0
+        self.failed = 0
+
+    # -- API --
+    def post(self, text, priority=NORMAL, colors=None, font=None):
+        """Queue a message and return its sequence number without waiting.
+
+        Raises ValueError for an unknown font or colours that are not RGB triples.
+        """
+        font = font or self.font
+        if self.fonts is not None and font not in self.fonts:
+            raise ValueError(f"unknown font {font!r}")
+        if colors is not None:
+            colors = _check_colors(colors)  # hashable for the render cache
+        msg = TickerMessage(text, priority, colors, font, next(self._seq))
+        with self._cond:
+            self._pending += 1
+        self._incoming.put((msg.priority, msg.seq, msg))
+        return msg.seq
+
+    def start(self):
+        self._running = True
+        self._threads = [threading.Thread(target=self._render_loop, name="ticker-render", daemon=True),
+                         threading.Thread(target=self._display_loop, name="ticker-display", daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """Stop after the current tick; queued messages are discarded."""
+        with self._cond:
+            self._running = False
+            if self._anim is not None:
+                self._anim.stop()
+            self._cond.notify_all()
+        self._incoming.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def wait_idle(self, timeout=None):
+        """Block until every posted message has been shown (or dropped as unrenderable).
+
+        Returns False on timeout, or when stop() leaves messages unshown.
+        Raises RuntimeError if the ticker is not running.
+        """
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("ticker is not running; call start() first")
+            self._cond.wait_for(lambda: self._pending == 0 or not self._running, timeout)
+            return self._pending == 0
+
+    # -- threads --
+    def _render_loop(self):
+        while True:
+            item = self._incoming.get()
+            msg = item[2]
+            if msg is None:
+                return
+            try:
+                msg.strip, msg.width = self.render(msg.text, msg.colors, msg.font)
+            except Exception as e:
+                # Drop the message; the thread has to survive for the next one
+                print(f"Ticker: could not render {msg.text!r}: {e}")
+                self._done(msg, shown=False)
+                continue
+            with self._cond:
+                heapq.heappush(self._ready, (msg.priority, msg.seq, msg))
+                self._cond.notify_all()
+
+    def _display_loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ready or not self._running)
+                if not self._running:
+                    return
+                self._anim = Animator(self.frame, self.push, fps=self.fps)
+                self._anim.add(Layer(self._effect(), blend="copy"))
+            self._anim.run()  # until the queue runs dry
+
+    def _pop(self, more_urgent_than=None):
+        with self._cond:
+            if not self._ready:
+                return None
+            if more_urgent_than is not None and self._ready[0][0] >= more_urgent_than:
+                return None
+            return heapq.heappop(self._ready)[2]
+
+    def _done(self, msg, shown=True):
+        with self._cond:
+            self._pending -= 1
+            if shown:
+                self.shown += 1
+            else:
+                self.failed += 1
+            self._cond.notify_all()
+
+    def _effect(self):
+        """One effect for a whole run of messages: windows of each strip in turn."""
+        tick = yield
+        base = tick
+        msg = self._pop()
+        while msg is not None:
+            self.current = msg
+            view = memoryview(msg.strip)
+            last = msg.width - self.cols  # text fully off the left edge
+            size = self.rows * self.cols * 3
+            cut_in = None
+            offset = tick - base
+            while offset <= last:
+                if not self._running:
+                    return
+                cut_in = self._pop(more_urgent_than=msg.priority)
+                if cut_in is not None:
+                    break
+                start = offset * self.rows * 3
+                tick = yield bytes(self._window(view[start:start + size]))
+                offset = tick - base
+
+            if cut_in is not None:
+                # Interrupted: play it again from the start after the urgent one
+                self.preempted += 1
+                with self._cond:
+                    heapq.heappush(self._ready, (msg.priority, msg.seq, msg))
+                msg = cut_in
+            else:
+                self._done(msg)
+                msg = self._pop()
+            # Next strip starts one column in: its blank first window would repeat the last one
+            base = tick - 1
+        self.current = None
+
+
+# ----- Local Socket -----
+class _Handler(socketserver.StreamRequestHandler):
+    """One message per line: plain text, or JSON {"text", "priority", "colors", "font"}."""
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.decode("utf-8", "replace").rstrip("\r\n")
+            if not line:
+                continue
+            try:
+                fields = json.loads(line) if line.startswith("{") else {"text": line}
+                priority = fields.get("priority", NORMAL)
+                priority = PRIORITIES[priority] if isinstance(priority, str) else int(priority)
+                seq = self.server.ticker.post(str(fields["text"]), priority,
+                                              fields.get("colors"), fields.get("font"))
+            except (ValueError, KeyError, TypeError) as e:
+                self.wfile.write(f"error {type(e).__name__}: {e}\n".encode())
+                continue
+            self.wfile.write(f"ok {seq}\n".encode())
+
+
+def serve_socket(ticker, path=SOCKET_PATH):
+    """Accept messages on a Unix socket from a background thread; returns the server (shutdown() to stop).
+
+    The socket is readable and writable by its owner only (0600), so other
+    local users cannot post to the display. Raises PermissionError if path
+    exists and is not a socket owned by this user.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+            raise PermissionError(f"{path} exists and is not this user's ticker socket")
+        os.unlink(path)  # left over from a previous run
+    old_umask = os.umask(0o177)  # no window where the fresh socket is open to others
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+    finally:
+        os.umask(old_umask)
+    os.chmod(path, 0o600)
+    server.daemon_threads = True
+    server.ticker = ticker
+    threading.Thread(target=server.serve_forever, name="ticker-socket", daemon=True).start()
+    return server
+
+
+def send_message(text, priority=NORMAL, path=SOCKET_PATH):
+    """Post a message to a running ticker service; returns its reply ("ok <seq>")."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall((json.dumps({"text": text, "priority": priority}) + "\n").encode())
+        sock.shutdown(socket.SHUT_WR)
+        return sock.makefile().readline().strip()
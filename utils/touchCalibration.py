@@ -0,0 +1,249 @@
+# =====================================================================
+#                   Pixelbox - touchCalibration.py
+#   touchCalibration.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Touch calibration (affine fit from tapped targets) compiled to per-axis lookup tables.
+# =====================================================================
+'''
+Code Example Use:
+regions = [Region("matrix", 256, 1024, 0, 768, 16, 16), Region("buttons", 0, 256, 0, 768, 8, 1)]
+touch_map = TouchMap(regions, Calibration.load())
+region, row, col = touch_map.classify(x, y)      # raw evdev x/y -> region and cell
+
+taps = collect_taps(device, targets, show_target) # interactive: raw point per target
+Calibration.fit(taps, targets).save()
+'''
+
+
+import json
+import os
+from array import array
+
+from evdev import ecodes
+
+from utils.paths import state_dir
+from utils.touchTracker import ContactTracker
+
+IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+
+# ----- Regions -----
+class Region:
+    """A rows x cols grid of touch cells over nominal x0..x1, y0..y1 (overlay px).
+
+    Regions are vertical bands: each spans its own x range, so one x lookup
+    tells which region a touch is in.
+    """
+
+    def __init__(self, name, x0, x1, y0, y1, rows, cols):
+        self.name = name
+        self.x0, self.x1 = x0, x1
+        self.y0, self.y1 = y0, y1
+        self.rows = rows
+        self.cols = cols
+
+    def centre(self, row, col):
+        """Nominal (x, y) of the middle of a cell, e.g. for a calibration target."""
+        return (self.x0 + (col + 0.5) * (self.x1 - self.x0) / self.cols,
+                self.y0 + (row + 0.5) * (self.y1 - self.y0) / self.rows)
+
+
+# ----- Calibration -----
+def _solve3(m, v):
+    """Solve the 3x3 system m @ s = v by Cramer's rule."""
+    def det(a):
+        return (a[0][0] * (a[1][1] * a[2][2] - a[1][2] * a[2][1])
+                - a[0][1] * (a[1][0] * a[2][2] - a[1][2] * a[2][0])
+                + a[0][2] * (a[1][0] * a[2][1] - a[1][1] * a[2][0]))
+    d = det(m)
+    if abs(d) < 1e-9:
+        raise ValueError("calibration taps are collinear; tap targets spread over the panel")
+    out = []
+    for k in range(3):
+        mk = [row[:k] + [v[i]] + row[k + 1:] for i, row in enumerate(m)]
+        out.append(det(mk) / d)
+    return out
+
+class Calibration:
+    """Affine map from raw touch coordinates to nominal overlay coordinates.
+
+    nominal x = a*x + b*y + c, nominal y = d*x + e*y + f. The identity is
+    the uncalibrated behaviour (raw values used as they are).
+    """
+
+    def __init__(self, coeffs=IDENTITY):
+        self.coeffs = tuple(float(v) for v in coeffs)
+
+    @classmethod
+    def fit(cls, raw, nominal):
+        """Least-squares fit from at least three raw points to their nominal targets."""
+        if len(raw) < 3 or len(raw) != len(nominal):
+            raise ValueError("need at least three taps, one per target")
+        # Normal equations of [x y 1] @ (a b c) = X, and the same for Y
+        m = [[0.0] * 3 for _ in range(3)]
+        vx = [0.0] * 3
+        vy = [0.0] * 3
+        for (x, y), (nx, ny) in zip(raw, nominal):
+            row = (x, y, 1.0)
+            for i in range(3):
+                for j in range(3):
+                    m[i][j] += row[i] * row[j]
+                vx[i] += row[i] * nx
+                vy[i] += row[i] * ny
+        return cls(_solve3(m, vx) + _solve3(m, vy))
+
+    def apply(self, x, y):
+        a, b, c, d, e, f = self.coeffs
+        return a * x + b * y + c, d * x + e * y + f
+
+    def error(self, raw, nominal):
+        """Largest distance (nominal px) between a mapped tap and its target."""
+        return max(((mx - nx) ** 2 + (my - ny) ** 2) ** 0.5
+                   for (mx, my), (nx, ny) in ((self.apply(*p), t) for p, t in zip(raw, nominal)))
+
+    def separable(self, raw_size):
+        """Per-axis form (swap, (sx, ox), (sy, oy)): nominal x = sx*u + ox, y = sy*v + oy.
+
+        u, v are raw x, y (or raw y, x when swap). A glued overlay is off
+        in scale and offset, sometimes with its axes swapped; the small
+        cross term of the fit is folded in at the middle of the other axis
+        so each nominal axis depends on one raw axis only.
+        """
+        a, b, c, d, e, f = self.coeffs
+        mid_x, mid_y = (raw_size[0] - 1) / 2.0, (raw_size[1] - 1) / 2.0
+        if abs(a) + abs(e) >= abs(b) + abs(d):
+            return False, (a, b * mid_y + c), (e, d * mid_x + f)
+        return True, (b, a * mid_x + c), (d, e * mid_y + f)
+
+    # -- storage --
+    @staticmethod
+    def default_path():
+        return state_dir("touch_calibration") + ".json"
+
+    @classmethod
+    def load(cls, path=None):
+        """Saved calibration, or the identity if there is none (or it is unreadable)."""
+        try:
+            with open(path or cls.default_path()) as f:
+                coeffs = json.load(f)["affine"]
+            if len(coeffs) == 6:
+                return cls(coeffs)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return cls()
+
+    def save(self, path=None):
+        path = path or self.default_path()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"affine": list(self.coeffs)}, f)
+        os.replace(tmp, path)
+
+
+# ----- Compiled Map -----
+def _axis_table(size, scale, offset, cuts):
+    """For each raw value 0..size-1: index into cuts after mapping and clamping to [cuts[0], cuts[-1])."""
+    lo, hi = cuts[0], cuts[-1]
+    table = array("h", bytes(2 * size))
+    k = 0
+    for raw in range(size):
+        u = min(max(scale * raw + offset, lo), hi)
+        # Cuts are sorted; walk them (the mapped values are monotonic in either direction)
+        while k > 0 and u < cuts[k]:
+            k -= 1
+        while k < len(cuts) - 2 and u >= cuts[k + 1]:
+            k += 1
+        table[raw] = k
+    return table
+
+class TouchMap:
+    """Raw touch coordinates -> (region, row, col) with three array reads.
+
+    Built once from a region table and a calibration: the raw x axis maps to
+    a region and column, the raw y axis (per region) to a row. classify()
+    does no float maths and no loops; raw values outside the tables (past
+    the end or negative) clamp to the nearest edge.
+    """
+
+    def __init__(self, regions, calibration=None, raw_size=(1024, 768)):
+        self.regions = list(regions)
+        self.calibration = calibration or Calibration()
+        self.swap, (sx, ox), (sy, oy) = self.calibration.separable(raw_size)
+        # Table lengths follow the raw axis each nominal axis is read from
+        nx, ny = (raw_size[1], raw_size[0]) if self.swap else raw_size
+
+        # x: one cut per column edge of every region, left to right
+        bands = sorted(range(len(self.regions)), key=lambda r: self.regions[r].x0)
+        cuts, owners = [], []
+        for r in bands:
+            reg = self.regions[r]
+            for col in range(reg.cols):
+                cuts.append(reg.x0 + col * (reg.x1 - reg.x0) / reg.cols)
+                owners.append((r, col))
+        cuts.append(self.regions[bands[-1]].x1 - 1e-6)
+        slots = _axis_table(nx, sx, ox, cuts)
+        self.x_region = array("h", (owners[k][0] for k in slots))
+        self.x_col = array("h", (owners[k][1] for k in slots))
+
+        # y: one table of rows per region
+        self.y_row = []
+        for reg in self.regions:
+            row_cuts = [reg.y0 + row * (reg.y1 - reg.y0) / reg.rows for row in range(reg.rows)]
+            self.y_row.append(_axis_table(ny, sy, oy, row_cuts + [reg.y1 - 1e-6]))
+        self.x_max = nx - 1
+        self.y_max = ny - 1
+
+    def classify(self, x, y):
+        """(region index, row, col) of a raw touch."""
+        if self.swap:
+            x, y = y, x
+        # Clamp both ends: a negative index would wrap to the far edge of the table
+        x = min(max(x, 0), self.x_max)
+        y = min(max(y, 0), self.y_max)
+        region = self.x_region[x]
+        return region, self.y_row[region][y], self.x_col[x]
+
+
+def raw_size_of(device, default):
+    """(width, height) of the device's raw position range, from its absinfo when it has one."""
+    size = list(default)
+    for code, info in device.capabilities().get(ecodes.EV_ABS, []):
+        if info is None or not hasattr(info, "max"):
+            continue
+        if code in (ecodes.ABS_MT_POSITION_X, ecodes.ABS_X):
+            size[0] = max(size[0], info.max + 1)
+        elif code in (ecodes.ABS_MT_POSITION_Y, ecodes.ABS_Y):
+            size[1] = max(size[1], info.max + 1)
+    return tuple(size)
+
+
+# ----- Interactive Calibration -----
+def collect_taps(device, targets, show):
+    """Show each target with show(i, target), wait for a tap, return the raw points.
+
+    A tap's raw point is the mean of every sample while the finger was down,
+    so jitter averages out; the next target is shown after the lift.
+    """
+    tracker = ContactTracker()
+    taps = []
+    samples = []
+    show(0, targets[0])
+    for event in device.read_loop():
+        update = tracker.feed(event)
+        if update is None:
+            continue
+        moved, lifted = update
+        samples += [(x, y) for _slot, x, y in moved]
+        if lifted and not tracker.active and samples:
+            taps.append((sum(x for x, _ in samples) / len(samples),
+                         sum(y for _, y in samples) / len(samples)))
+            samples = []
+            if len(taps) == len(targets):
+                return taps
+            show(len(taps), targets[len(taps)])
+    raise EOFError(f"touch input ended after {len(taps)} of {len(targets)} taps")
@@ -0,0 +1,124 @@
+# =====================================================================
+#                   Pixelbox - touchDevice.py
+#   touchDevice.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Finds the touchscreen by its multi-touch capabilities and caches the result.
+# =====================================================================
+'''
+Code Example Use:
+device = find_touch_device()          # None if no touchscreen is attached
+device = find_touch_device("/dev/input/event3")   # a given path wins
+python3 -m utils.touchDevice          # list what would be picked, and why
+'''
+
+
+import json
+import os
+
+from evdev import InputDevice, ecodes, list_devices
+
+from utils.paths import state_dir
+
+# The panel shipped with the Pixelbox; tried before a full scan
+KNOWN_PATHS = [
+    '/dev/input/by-id/usb-UsbHID_SingWon-CTP-V1.18A_6F6A099B1133-event-if00',
+]
+BY_ID_DIR = "/dev/input/by-id"
+DEVICE_ENV = "PIXELBOX_TOUCH_DEV"   # force a device path
+
+
+def is_touchscreen(device):
+    """True when the device reports multi-touch positions (ABS_MT_POSITION_X/Y)."""
+    codes = device.capabilities(absinfo=False).get(ecodes.EV_ABS, [])
+    return ecodes.ABS_MT_POSITION_X in codes and ecodes.ABS_MT_POSITION_Y in codes
+
+def _stable_path(path):
+    """A /dev/input/by-id link to path's event node if there is one (eventN can renumber)."""
+    real = os.path.realpath(path)
+    try:
+        names = sorted(os.listdir(BY_ID_DIR))
+    except OSError:
+        return path
+    for name in names:
+        link = os.path.join(BY_ID_DIR, name)
+        if os.path.realpath(link) == real:
+            return link
+    return path
+
+def _open_checked(path, name=None):
+    """InputDevice at path if it is a touchscreen (and named name, when given), else None."""
+    try:
+        device = InputDevice(path)
+    except OSError:
+        return None
+    if (name is None or device.name == name) and is_touchscreen(device):
+        return device
+    device.close()
+    return None
+
+
+# ----- Cache -----
+def _cache_path():
+    return state_dir("touch_device") + ".json"
+
+def _load_cache():
+    try:
+        with open(_cache_path()) as f:
+            entry = json.load(f)
+        return entry["path"], entry["name"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_cache(path, name):
+    cache = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        with open(cache, "w") as f:
+            json.dump({"path": path, "name": name}, f)
+    except OSError:
+        pass  # read-only home: discovery still works, just not cached
+
+
+# ----- Discovery -----
+def find_touch_device(path=None):
+    """Open the touchscreen; returns an InputDevice or None if none is found.
+
+    Tries, in order: path (or PIXELBOX_TOUCH_DEV) as given, the cached
+    device if it is still present under the same name, the known panel
+    paths, then every /dev/input/event* node for one with multi-touch
+    positions. Whatever is found by checking is cached for the next start,
+    so the scan (one open and ioctl per input device) happens only when
+    the panel changes.
+    """
+    path = path or os.environ.get(DEVICE_ENV)
+    if path:
+        try:
+            return InputDevice(path)
+        except OSError:
+            return None
+
+    cached = _load_cache()
+    if cached is not None:
+        device = _open_checked(*cached)
+        if device is not None:
+            return device
+
+    for candidate in KNOWN_PATHS + sorted(list_devices()):
+        device = _open_checked(candidate)
+        if device is not None:
+            _save_cache(_stable_path(candidate), device.name)
+            return device
+    return None
+
+
+if __name__ == "__main__":
+    for node in sorted(list_devices()):
+        dev = InputDevice(node)
+        print(f"{node:<20} {'touch' if is_touchscreen(dev) else '-':<6} {dev.name}  ({_stable_path(node)})")
+        dev.close()
+    found = find_touch_device()
+    print(f"Selected: {found.path} ({found.name})" if found else "No touchscreen found.")
@@ -0,0 +1,149 @@
+# =====================================================================
+#                   Pixelbox - touchFilter.py
+#   touchFilter.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Touch input filter: one-euro smoothing, short motion prediction, cell hysteresis.
+# =====================================================================
+'''
+Code Example Use:
+touch_filter = TouchFilter(touch_map.classify)     # or NullTouchFilter(...) to switch it off
+region, row, col = touch_filter.update(slot, x, y, event.timestamp())
+touch_filter.end(slot)                             # finger lifted
+'''
+
+
+import math
+
+# ----- Tuning (raw touch px and seconds) -----
+MIN_CUTOFF    = 1.0    # Hz; lower = steadier when the finger rests, more lag when slow
+BETA          = 0.01   # cutoff gain with speed; higher = less lag on fast strokes
+D_CUTOFF      = 1.0    # Hz; smoothing of the speed estimate itself
+PREDICT_MS    = 12     # look-ahead, about one frame of wire time plus the scheduler tick
+PREDICT_MAX   = 24     # px; cap on the look-ahead (half a matrix cell)
+HYSTERESIS_PX = 12     # px a point must travel past a cell border before the cell changes
+
+
+def _alpha(cutoff, dt):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """One-euro filter for one axis (Casiez et al., CHI 2012).
+
+    A low-pass filter whose cutoff rises with speed: heavy smoothing removes
+    jitter while the finger is nearly still, light smoothing keeps fast
+    strokes from lagging. dx is the filtered speed in units per second.
+    """
+
+    def __init__(self, min_cutoff=MIN_CUTOFF, beta=BETA, d_cutoff=D_CUTOFF):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x = None
+        self.dx = 0.0
+        self.t = None
+
+    def __call__(self, x, t):
+        if self.x is None:
+            self.x, self.t = float(x), t
+            return self.x
+        dt = t - self.t
+        if dt <= 0:
+            dt = 1e-3  # repeated timestamp: treat as one fast sample
+        self.t = t
+        a_d = _alpha(self.d_cutoff, dt)
+        self.dx += a_d * ((x - self.x) / dt - self.dx)
+        a = _alpha(self.min_cutoff + self.beta * abs(self.dx), dt)
+        self.x += a * (x - self.x)
+        return self.x
+
+
+class _Track:
+    __slots__ = ("fx", "fy", "cell", "ax", "ay")
+
+    def __init__(self, min_cutoff, beta, d_cutoff):
+        self.fx = OneEuroFilter(min_cutoff, beta, d_cutoff)
+        self.fy = OneEuroFilter(min_cutoff, beta, d_cutoff)
+        self.cell = None
+        self.ax = self.ay = 0.0  # last point that was allowed to pick the cell
+
+
+class TouchFilter:
+    """Per-contact smoothing, prediction and cell hysteresis in front of a classifier.
+
+    update() filters a raw sample, projects it predict_ms ahead along the
+    filtered velocity (capped at predict_max px), and classifies it; if the
+    projection lands in another region the filtered point is used instead. A
+    different cell is only accepted once the point is more than hysteresis
+    px from the last point that chose a cell, so jitter at a border cannot
+    flip between neighbours and push a frame for each flip; a real stroke
+    moves further than that every sample and is not delayed.
+    """
+
+    enabled = True
+
+    def __init__(self, classify, min_cutoff=MIN_CUTOFF, beta=BETA, d_cutoff=D_CUTOFF,
+                 predict_ms=PREDICT_MS, predict_max=PREDICT_MAX, hysteresis=HYSTERESIS_PX):
+        self.classify = classify
+        self.params = (min_cutoff, beta, d_cutoff)
+        self.predict = predict_ms / 1000.0
+        self.predict_max = predict_max
+        self.hysteresis = hysteresis
+        self.tracks = {}
+        self.held = 0  # samples kept in their previous cell by the hysteresis
+
+    def update(self, contact, x, y, t):
+        """(region, row, col) for a raw sample of contact at time t (seconds)."""
+        track = self.tracks.get(contact)
+        if track is None:
+            track = self.tracks[contact] = _Track(*self.params)
+        fx = track.fx(x, t)
+        fy = track.fy(y, t)
+
+        # The filtered point decides the region; the look-ahead along the
+        # filtered velocity may only move the cell within it (a fast swipe
+        # ending near the matrix edge must not press a button)
+        lim = self.predict_max
+        px = fx + min(max(track.fx.dx * self.predict, -lim), lim)
+        py = fy + min(max(track.fy.dx * self.predict, -lim), lim)
+        px = int(px) if px > 0 else 0
+        py = int(py) if py > 0 else 0
+
+        cell = self.classify(px, py)
+        if px != int(fx) or py != int(fy):
+            here = self.classify(int(fx) if fx > 0 else 0, int(fy) if fy > 0 else 0)
+            if cell[0] != here[0]:
+                cell = here
+        if track.cell is not None and cell != track.cell:
+            h = self.hysteresis
+            if abs(px - track.ax) < h and abs(py - track.ay) < h:
+                self.held += 1
+                return track.cell
+        track.cell = cell
+        track.ax, track.ay = px, py
+        return cell
+
+    def end(self, contact):
+        """Forget a lifted contact; its next touch starts unfiltered."""
+        self.tracks.pop(contact, None)
+
+
+class NullTouchFilter:
+    """Filtering switched off: samples are classified as they come."""
+
+    enabled = False
+    held = 0
+
+    def __init__(self, classify):
+        self.classify = classify
+
+    def update(self, contact, x, y, t):
+        return self.classify(x, y)
+
+    def end(self, contact):
+        pass
@@ -0,0 +1,213 @@
+# =====================================================================
+#                   Pixelbox - touchRecorder.py
+#   touchRecorder.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Records evdev touch streams to a compact file and replays them as a fake device.
+# =====================================================================
+'''
+Code Example Use:
+sudo python3 -m utils.touchRecorder record swipe.pbt --seconds 10
+python3 -m utils.touchRecorder info swipe.pbt
+python3 touchToLED.py --replay swipe.pbt --speed 0     (0 = as fast as possible)
+'''
+
+
+import argparse
+import os
+import struct
+import threading
+import time
+
+from utils.fakeInput import FakeEvent, FakeInputDevice
+
+# ----- File Format -----
+# Header: magic, version, kernel timestamp of the first event (seconds)
+# Record: microseconds since first event, type, code, value  (15 bytes)
+MAGIC   = b"PBXT"
+VERSION = 2
+HEADER  = struct.Struct("<4sBd")
+RECORD  = struct.Struct("<QBHi")
+RECORDS = {1: struct.Struct("<IBHi"), 2: RECORD}  # version 1 offsets wrapped after ~71 minutes
+
+
+# ----- Recording -----
+def record(device, path, seconds=None, max_events=None):
+    """Copy events from device into path until seconds/max_events is reached or Ctrl-C.
+
+    Returns the number of events written.
+    """
+    count = 0
+    base = None
+    with open(path, "wb") as f:
+        try:
+            for ev in device.read_loop():
+                t = ev.timestamp()
+                if base is None:
+                    base = t
+                    f.write(HEADER.pack(MAGIC, VERSION, base))
+                f.write(RECORD.pack(int(round((t - base) * 1000000)), ev.type, ev.code, ev.value))
+                count += 1
+                if (max_events and count >= max_events) or (seconds and t - base >= seconds):
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if base is None:
+                f.write(HEADER.pack(MAGIC, VERSION, 0.0))  # empty recording
+    return count
+
+def load_events(path):
+    """Read a recording back into a list of events with their kernel timestamps."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, base = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version not in RECORDS:
+        raise ValueError(f"{path} is not a Pixelbox touch recording")
+
+    base_us = int(round(base * 1000000))
+    events = []
+    for dt, type_, code, value in RECORDS[version].iter_unpack(data[HEADER.size:]):
+        t = base_us + dt
+        events.append(FakeEvent(t // 1000000, t % 1000000, type_, code, value))
+    return events
+
+
+# ----- Replay -----
+class ReplayDevice(FakeInputDevice):
+    """Fake InputDevice that delivers recorded events on their original schedule.
+
+    speed scales time: 1.0 is real time, 2.0 twice as fast, 0 as fast as
+    possible. The clock starts on the first read, and delivered events are
+    re-stamped with the wall-clock time they fell due, so latency measured
+    against event timestamps stays meaningful. fileno() is a pipe that
+    becomes readable whenever events are due, so the device also works with
+    select(), asyncio readers and Tk file handlers; read() then returns the
+    due events or raises BlockingIOError like a non-blocking evdev device.
+    """
+
+    def __init__(self, events, speed=1.0, name="Replayed touchscreen"):
+        if isinstance(events, (str, bytes, os.PathLike)):
+            events = load_events(events)
+        super().__init__(events, name=name)
+        self.speed = speed
+        self._t0 = events[0].timestamp() if events else 0.0
+        self._start = None
+        self._wall_start = None
+        self._pipe = None
+
+    def _start_clock(self):
+        if self._start is None:
+            self._start = time.monotonic()
+            self._wall_start = time.time()
+
+    def _due(self, event):
+        """Monotonic time at which event becomes readable."""
+        if not self.speed:
+            return self._start
+        return self._start + (event.timestamp() - self._t0) / self.speed
+
+    def _deliver(self):
+        """Pop the next event, re-stamped to the wall-clock time it fell due."""
+        ev = self.events[self._pos]
+        self._pos += 1
+        t = self._wall_start + (self._due(ev) - self._start)
+        sec = int(t)
+        return FakeEvent(sec, int((t - sec) * 1000000), ev.type, ev.code, ev.value)
+
+    # -- evdev-style reads --
+    def read_one(self):
+        self._start_clock()
+        if self._pos >= len(self.events) or self._due(self.events[self._pos]) > time.monotonic():
+            return None
+        return self._deliver()
+
+    def read(self):
+        if self._pipe is not None:
+            try:
+                os.read(self._pipe[0], 4096)  # drain wake-ups
+            except BlockingIOError:
+                pass
+        ev = self.read_one()
+        if ev is None:
+            raise BlockingIOError("no events due")
+        due = [ev]
+        while True:
+            ev = self.read_one()
+            if ev is None:
+                return iter(due)
+            due.append(ev)
+
+    def read_loop(self):
+        self._start_clock()
+        while self._pos < len(self.events):
+            delay = self._due(self.events[self._pos]) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            yield self._deliver()
+
+    async def async_read_loop(self):
+        import asyncio  # ~60 ms to import; the Tk GUI replays through fileno() and never needs it
+
+        self._start_clock()
+        while self._pos < len(self.events):
+            delay = self._due(self.events[self._pos]) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield self._deliver()
+
+    # -- fd for select()/Tk --
+    def fileno(self):
+        if self._pipe is None:
+            self._pipe = os.pipe()
+            os.set_blocking(self._pipe[0], False)
+            self._start_clock()
+            threading.Thread(target=self._pump, daemon=True).start()
+        return self._pipe[0]
+
+    def _pump(self):
+        """Write a wake-up byte to the pipe as each event falls due."""
+        for ev in self.events[self._pos:]:
+            delay = self._due(ev) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            os.write(self._pipe[1], b"\x01")
+
+    @property
+    def done(self):
+        return self._pos >= len(self.events)
+
+
+# ----- Command Line -----
+def main():
+    parser = argparse.ArgumentParser(description="Record or inspect Pixelbox touch recordings")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="record the touchscreen to a file")
+    rec.add_argument("path")
+    rec.add_argument("--device", help="evdev device path (default: the detected touchscreen)")
+    rec.add_argument("--seconds", type=float, help="stop after this many seconds")
+    info = sub.add_parser("info", help="summarise a recording")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        from utils.touchDevice import find_touch_device
+        device = find_touch_device(args.device)
+        if device is None:
+            parser.error("touchscreen device not found")
+        print(f"Recording {device.name} -> {args.path} (Ctrl-C to stop)")
+        print(f"{record(device, args.path, seconds=args.seconds)} events written.")
+    else:
+        from evdev import ecodes
+        events = load_events(args.path)
+        syn = sum(1 for ev in events if ev.type == ecodes.EV_SYN)
+        span = events[-1].timestamp() - events[0].timestamp() if events else 0.0
+        print(f"{len(events)} events, {syn} SYN frames over {span:.3f} s "
+              f"({syn / span if span else 0:.1f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# =====================================================================
+#                   Pixelbox - touchTracker.py
+#   touchTracker.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Slot-aware multi-touch contact tracker (evdev multi-touch protocol B).
+# =====================================================================
+'''
+Code Example Use:
+tracker = ContactTracker()
+for event in device.read_loop():
+    frame = tracker.feed(event)
+    if frame:
+        moved, lifted = frame      # [(slot, x, y)], [slot]
+'''
+
+
+from evdev import ecodes
+
+MAX_CONTACTS = 10
+UNKNOWN_ID = -2  # down (BTN_TOUCH) before, or without, a tracking id
+
+
+class Contact:
+    """State of one touch slot."""
+
+    __slots__ = ("slot", "tracking_id", "x", "y", "moved")
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.tracking_id = -1
+        self.x = None
+        self.y = None
+        self.moved = False
+
+    @property
+    def active(self):
+        return self.tracking_id != -1
+
+
+class ContactTracker:
+    """Keeps per-slot touch state and reports every contact once per SYN.
+
+    ABS_MT_SLOT selects which slot the following ABS_MT_* events update, so
+    coordinates from different fingers never mix. Panels without slots
+    report everything in slot 0, and single-touch panels (ABS_X/ABS_Y gated
+    by BTN_TOUCH) are mapped onto slot 0 as well.
+    """
+
+    def __init__(self, max_contacts=MAX_CONTACTS):
+        self.contacts = [Contact(slot) for slot in range(max_contacts)]
+        self.slot = 0
+        self.multitouch = False  # set once any ABS_MT_* event arrives
+        self._lifted = []
+
+    @property
+    def active(self):
+        """Contacts currently down."""
+        return [c for c in self.contacts if c.active]
+
+    def _lift(self, contact):
+        if contact.active:
+            self._lifted.append(contact.slot)
+        # x/y are kept: the kernel drops a new finger's position if it repeats the slot's last one
+        contact.tracking_id = -1
+        contact.moved = False
+
+    def _current(self):
+        if 0 <= self.slot < len(self.contacts):
+            return self.contacts[self.slot]
+        return None  # more fingers than tracked slots: ignore the extras
+
+    def feed(self, event):
+        """Apply one evdev event; on SYN_REPORT returns (moved, lifted), else None.
+
+        moved lists (slot, x, y) for every active contact whose position
+        changed or that touched down in the frame; lifted lists the slots released in it.
+        """
+        if event.type == ecodes.EV_ABS:
+            code = event.code
+            if code == ecodes.ABS_MT_SLOT:
+                self.multitouch = True
+                self.slot = event.value
+                return None
+            if code in (ecodes.ABS_MT_TRACKING_ID, ecodes.ABS_MT_POSITION_X, ecodes.ABS_MT_POSITION_Y):
+                self.multitouch = True
+            elif code in (ecodes.ABS_X, ecodes.ABS_Y) and not self.multitouch:
+                code = ecodes.ABS_MT_POSITION_X if code == ecodes.ABS_X else ecodes.ABS_MT_POSITION_Y
+            else:
+                return None
+
+            contact = self._current()
+            if contact is None:
+                return None
+            if code == ecodes.ABS_MT_TRACKING_ID:
+                if event.value == -1:
+                    self._lift(contact)
+                else:
+                    if contact.active and contact.tracking_id not in (event.value, UNKNOWN_ID):
+                        self._lift(contact)  # slot reused by a new finger
+                    if not contact.active:
+                        contact.moved = True  # report a new finger even at the last position
+                    contact.tracking_id = event.value
+            elif code == ecodes.ABS_MT_POSITION_X:
+                contact.x = event.value
+                contact.moved = True
+            else:
+                contact.y = event.value
+                contact.moved = True
+
+        elif event.type == ecodes.EV_KEY and event.code == ecodes.BTN_TOUCH:
+            if event.value == 0:
+                for contact in self.contacts:
+                    self._lift(contact)
+            elif not any(c.active for c in self.contacts):
+                # Single-touch panels, and MT panels without tracking ids, still get a contact
+                self.contacts[0].tracking_id = UNKNOWN_ID
+                self.contacts[0].moved = True
+
+        elif event.type == ecodes.EV_SYN:
+            if event.code == ecodes.SYN_DROPPED:
+                # Kernel buffer overran; state is unknown until the next touch
+                for contact in self.contacts:
+                    self._lift(contact)
+                return None
+            if event.code != ecodes.SYN_REPORT:
+                return None
+            moved = []
+            for contact in self.contacts:
+                if contact.moved and contact.active and contact.x is not None and contact.y is not None:
+                    moved.append((contact.slot, contact.x, contact.y))
+                contact.moved = False
+            lifted, self._lifted = self._lifted, []
+            return moved, lifted
+
+        return None
@@ -0,0 +1,136 @@
+# =====================================================================
+#                   Pixelbox - undoHistory.py
+#   undoHistory.py
+#   Pixelbox
+#   Author: Alex Closson
+#   Date: 10/17/2026
+#   Last Update: 10/17/2026
+#   Version: 1.0.0
+#   Summary: Undo/redo for the framebuffer from per-action pixel deltas under a byte budget.
+# =====================================================================
+'''
+Code Example Use:
+history = UndoHistory(frame)
+history.paint_cells(cells, color)   # instead of frame.paint_cells, while a stroke lasts
+history.end()                       # finger lifted: the stroke is one undo step
+changed = history.undo()            # [(logical index, rgb)] now on the canvas
+'''
+
+
+import struct
+from collections import deque
+
+# One delta: logical pixel index, old RGB, new RGB
+DELTA = struct.Struct("<H3s3s")
+
+UNDO_BUDGET = 64 * 1024  # bytes of deltas kept (8 KiB pixel changes ~ 32 full clears)
+
+
+class UndoHistory:
+    """Groups framebuffer writes into actions and stores only the pixels they changed.
+
+    An action (a stroke, a clear) stays open until end(); repeated writes to a
+    pixel keep its first old and last new colour. Closed actions are packed
+    into DELTA records and kept in a ring trimmed from the oldest end to
+    budget bytes, so memory is bounded and undo/redo cost is proportional to
+    the pixels the action changed.
+    """
+
+    def __init__(self, frame, budget=UNDO_BUDGET):
+        self.frame = frame
+        self.budget = budget
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.size = 0          # bytes held by both stacks
+        self._open = {}        # index -> (old, new) for the action in progress
+
+    # -- recording writes --
+    def _write(self, index, rgb):
+        buf = self.frame.buf
+        i = index * 3
+        old = bytes(buf[i:i + 3])
+        if old == rgb and index not in self._open:
+            return
+        buf[i:i + 3] = rgb
+        first = self._open.get(index)
+        self._open[index] = (first[0] if first else old, rgb)
+
+    def paint_cells(self, cells, color):
+        rgb = bytes(color)
+        cols = self.frame.cols
+        for row, col in cells:
+            self._write(row * cols + col, rgb)
+
+    def set_indices(self, indices, color):
+        rgb = bytes(color)
+        for index in indices:
+            self._write(index, rgb)
+
+    def fill(self, color=(0, 0, 0), skip=()):
+        """Fill the canvas; only pixels that were not already color are recorded.
+
+        Logical indices in skip (e.g. button indicators) are left untouched.
+        """
+        rgb = bytes(color)
+        buf = self.frame.buf
+        for index in range(self.frame.num_pixels):
+            if buf[index * 3:index * 3 + 3] != rgb and index not in skip:
+                self._write(index, rgb)
+
+    def end(self):
+        """Close the open action as one undo step."""
+        deltas = [DELTA.pack(i, old, new) for i, (old, new) in self._open.items() if old != new]
+        self._open.clear()
+        if not deltas:
+            return
+        record = b"".join(deltas)
+        self.size -= sum(len(r) for r in self.redo_stack)
+        self.redo_stack.clear()
+        self.undo_stack.append(record)
+        self.size += len(record)
+        while self.size > self.budget and len(self.undo_stack) > 1:
+            self.size -= len(self.undo_stack.popleft())
+
+    # -- undo / redo --
+    def _apply(self, record, use_old):
+        buf = self.frame.buf
+        changed = []
+        for index, old, new in DELTA.iter_unpack(record):
+            rgb = old if use_old else new
+            buf[index * 3:index * 3 + 3] = rgb
+            changed.append((index, rgb))
+        return changed
+
+    def undo(self):
+        """Revert the last action; returns [(index, rgb)] of pixels changed (empty if none)."""
+        self.end()
+        if not self.undo_stack:
+            return []
+        record = self.undo_stack.pop()
+        self.redo_stack.append(record)
+        return self._apply(record, use_old=True)
+
+    def redo(self):
+        """Re-apply the last undone action; returns [(index, rgb)] of pixels changed."""
+        self.end()
+        if not self.redo_stack:
+            return []
+        record = self.redo_stack.pop()
+        self.undo_stack.append(record)
+        return self._apply(record, use_old=False)
+
+    @property
+    def can_undo(self):
+        return bool(self.undo_stack or self._open)
+
+    @property
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+
+def group_by_color(changed):
+    """[(index, rgb)] -> {rgb: [index, ...]} for callers that log one colour at a time."""
+    groups = {}
+    for index, rgb in changed:
+        groups.setdefault(rgb, []).append(index)
+    return groups